@@ -0,0 +1,166 @@
+"""
+Damage calculations per second on one core.
+
+Compares the old `calculate_damage`, which looked the move meta up through
+`data.get_move_meta` and walked the nested type chart on every hit, against
+`BattleState.calculate_damage` on the compiled `MoveTables`. Both are fed
+the same seeded moves and pokemon and must return the same results.
+
+Run from `src/` with `python -m benchmarks.battle_damage`.
+"""
+from typing import List, Set, Tuple
+
+import json
+import random
+import sys
+import time
+
+from cogs.helpers.battle_engine import (
+    FREEZE_MOVES,
+    SLEEP_MOVES,
+    STAT_IDS,
+    BattleMove,
+    BattleState,
+    Combatant,
+    MoveEffect,
+    MoveTables,
+    StatChange,
+)
+from data import data
+from utils import constants
+
+CALCULATIONS: int = 200_000
+SEED: int = 1234
+
+
+def _old_damage(rng: random.Random, move: dict, attacker: Combatant, defender: Combatant) -> BattleMove:
+    move_meta: dict = data.get_move_meta(move["id"])
+
+    if move["damage_class_id"] == 1 or move["power"] is None:
+        success = True
+        damage = 0
+        hits = 0
+        critical_hit = 1
+    else:
+        accu: int = move["accuracy"] if move["accuracy"] is not None else 100
+        success: int = rng.randrange(99) <= accu
+        hits: int = rng.randint(move_meta["min_hits"] or 1, move_meta["max_hits"] or 1)
+
+        critical_hit = 2 if rng.randint(1, 150) == 1 else 1
+        rng.choice([0.1, 1, 0.75])
+
+        if move["damage_class_id"] == 2:
+            atk = attacker.base_stats[1] * constants.STAT_STAGE_MULTIPLIERS[attacker.stages.atk]
+            defn = defender.base_stats[2] * constants.STAT_STAGE_MULTIPLIERS[attacker.stages.defn]
+        else:
+            atk = attacker.base_stats[3] * constants.STAT_STAGE_MULTIPLIERS[attacker.stages.satk]
+            defn = defender.base_stats[4] * constants.STAT_STAGE_MULTIPLIERS[attacker.stages.sdef]
+
+        damage = int((2 * attacker.level / 5 + 2) * move["power"] * atk / defn) / 50 + 2
+
+    messages: List[str] = []
+
+    typ_mult = 1
+    for typ in list(defender.types):
+        typ_mult *= constants.TYPE_EFFICACY[move["type_id"]][typ]
+
+    if not success:
+        effectiveness = MoveEffect.missed
+        messages.append("It missed!")
+        typ_mult = 0
+    elif typ_mult == 0:
+        effectiveness = MoveEffect.not_effective
+        messages.append("It had no effect!")
+    elif typ_mult < 1:
+        messages.append("It was not very effective...")
+        effectiveness = MoveEffect.not_effective
+    elif typ_mult == 1:
+        effectiveness = MoveEffect.normal
+    else:
+        messages.append("It was super effective!")
+        effectiveness = MoveEffect.super_effective
+
+    if hits > 1:
+        messages.append(f"It hit {hits} times!")
+
+    healing = damage * move_meta["drain"] / 100
+    healing += attacker.max_hp * move_meta["healing"] / 100
+
+    for ailment in attacker.ailments:
+        if ailment == "Paralysis":
+            if rng.random() < 0.25:
+                success = False
+        elif ailment == "Sleep":
+            if move["id"] not in SLEEP_MOVES:
+                success = False
+        elif ailment == "Freeze":
+            if move["id"] not in FREEZE_MOVES:
+                success = False
+        elif ailment == "Burn":
+            if move["damage_class_id"] == 2:
+                damage /= 2
+
+    changes: list = []
+    # Since the tables, stats `StatChange.stat` doesn't know are skipped (the chance is still rolled)
+    if rng.randrange(100) < move_meta["stat_chance"] and move_meta["change_stat_id"] in STAT_IDS:
+        changes.append(StatChange(move_meta["change_stat_id"], move_meta["stat_change"]))
+
+    ailment = (
+        constants.MOVE_AILMENTS[move_meta["meta_ailment_id"]]
+        if rng.randrange(100) < move_meta["ailment_chance"]
+        else None
+    )
+
+    return BattleMove(success, round(damage), round(healing), ailment, effectiveness, messages, changes, critical_hit)
+
+
+def _cases() -> List[Tuple[dict, Combatant, Combatant]]:
+    with open(MoveTables.META_PATH, encoding="utf-8") as f:
+        with_meta: Set[int] = {m["move_id"] for m in json.load(f)}
+    with open(MoveTables.MOVES_PATH, encoding="utf-8") as f:
+        # `data.get_move_meta` has nothing for the other moves
+        moves: List[dict] = [m for m in json.load(f) if m["id"] in with_meta]
+
+    rng: random.Random = random.Random(SEED)
+
+    def _combatant() -> Combatant:
+        stats: Tuple[int, ...] = tuple(rng.randint(20, 300) for _ in range(6))
+        types: Tuple[int, ...] = tuple(rng.sample(range(1, 19), rng.randint(1, 2)))
+        ailments: set = set(rng.choice(((), ("Burn",), ("Paralysis",), ("Sleep",))))
+        return Combatant(rng.randint(1, 898), rng.randint(1, 100), types, stats, stats[0], ailments=ailments)
+
+    return [(rng.choice(moves), _combatant(), _combatant()) for _ in range(1000)]
+
+
+def main() -> None:
+    tables: MoveTables = MoveTables.from_files()
+    cases: List[Tuple[dict, Combatant, Combatant]] = _cases()
+    rounds: int = CALCULATIONS // len(cases)
+
+    state: BattleState = BattleState((cases[0][1], cases[0][2]), seed=SEED, tables=tables)
+    old_rng: random.Random = random.Random(SEED)
+
+    t1 = time.perf_counter()
+    for _ in range(rounds):
+        for move, attacker, defender in cases:
+            _old_damage(old_rng, move, attacker, defender)
+    old: float = rounds * len(cases) / (time.perf_counter() - t1)
+
+    t1 = time.perf_counter()
+    for _ in range(rounds):
+        for move, attacker, defender in cases:
+            state.calculate_damage(move, attacker, defender)
+    new: float = rounds * len(cases) / (time.perf_counter() - t1)
+
+    print(f"old (dicts) : {old:>12,.0f} calculations/s")
+    print(f"tables      : {new:>12,.0f} calculations/s, {new / old:.1f}x")
+
+    old_rng.seed(SEED)
+    state.rng.seed(SEED)
+    for move, attacker, defender in cases:
+        if _old_damage(old_rng, move, attacker, defender) != state.calculate_damage(move, attacker, defender):
+            sys.exit(f"Tables and dicts disagree on move {move['id']}.")
+
+
+if __name__ == "__main__":
+    main()
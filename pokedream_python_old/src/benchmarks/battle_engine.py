@@ -0,0 +1,60 @@
+"""
+Simulated 1v1 battles per second of the headless battle engine on one core.
+
+Random catchable species at random levels fight with their first four
+level-up moves until one faints. The whole run is played twice from the same
+seed to check that it replays identically.
+
+Run from `src/` with `python -m benchmarks.battle_engine`.
+"""
+from typing import List, Optional, Tuple
+
+import random
+import sys
+import time
+
+from cogs.helpers.battle_engine import BattleState, Combatant
+from data import data
+
+BATTLES: int = 5000
+SEED: int = 1234
+
+
+def _combatant(rng: random.Random, species: List[dict]) -> Combatant:
+    specie: dict = rng.choice(species)
+    moves: List[dict] = [data.move_by_id(m["move_id"]) for m in data.get_pokemon_moves(specie["species_id"])[:4]]
+    return Combatant.from_species(specie, rng.randint(15, 70), moves)
+
+
+def _run(species: List[dict]) -> Tuple[List[Optional[int]], int, float]:
+    rng: random.Random = random.Random(SEED)
+    battles: List[Tuple[Combatant, Combatant]] = [
+        (_combatant(rng, species), _combatant(rng, species)) for _ in range(BATTLES)
+    ]
+
+    winners: List[Optional[int]] = []
+    turns: int = 0
+
+    t1 = time.perf_counter()
+    for idx, sides in enumerate(battles):
+        state: BattleState = BattleState(sides, seed=SEED + idx)
+        winners.append(state.run())
+        turns += state.turns
+    return winners, turns, time.perf_counter() - t1
+
+
+def main() -> None:
+    species: List[dict] = [
+        s for s in map(data.species_by_num, range(1, 899)) if s is not None and s["catchable"] and s["base_stats"]
+    ]
+
+    winners, turns, elapsed = _run(species)
+    print(f"battles : {BATTLES / elapsed:>10,.0f} battles/s, {turns / elapsed:>10,.0f} moves/s")
+    print(f"draws   : {winners.count(None):>10,} of {BATTLES:,} hit the turn limit")
+
+    if _run(species)[0] != winners:
+        sys.exit("Battles played from the same seed ended differently.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Battle scene renders per second per core.
+
+Compares the old approach (decode the background and both sprites, paste
+and encode a PNG on every render, without the downloads) against
+`render_scene` composing every frame from its cached decoded images, and
+against later turns of a battle that only repaint the HP bars, as JPEG and
+WebP. Images are generated here so no network is needed.
+
+Run from `src/` with `python -m benchmarks.battle_scenes`.
+"""
+from io import BytesIO
+from typing import Callable, Dict, Iterator, Tuple
+
+import itertools
+import time
+
+from PIL import Image, ImageDraw, ImageFilter
+
+from core import battle_scenes
+from core.battle_scenes import SceneSide, render_scene
+
+RENDERS: int = 50
+BACKGROUND_SIZE: Tuple[int, int] = (1800, 900)
+SPRITE_SIZE: Tuple[int, int] = (400, 400)
+
+
+def _png(image: Image.Image) -> bytes:
+    out: BytesIO = BytesIO()
+    image.save(out, "PNG")
+    return out.getvalue()
+
+
+def _background() -> bytes:
+    # Blurred noise compresses about like a painted background, flat colors would flatter PNG.
+    channels = [
+        Image.effect_noise(BACKGROUND_SIZE, sigma).filter(ImageFilter.GaussianBlur(6)) for sigma in (40, 50, 60)
+    ]
+    return _png(Image.merge("RGB", channels))
+
+
+def _sprite(color: Tuple[int, int, int]) -> bytes:
+    image: Image.Image = Image.new("RGBA", SPRITE_SIZE, (0, 0, 0, 0))
+    ImageDraw.Draw(image).ellipse((40, 40, 360, 360), fill=color + (255,))
+    return _png(image)
+
+
+def _old_render(background: bytes, sprite1: bytes, sprite2: bytes) -> bytes:
+    img: Image.Image = Image.open(BytesIO(background))
+    pk1: Image.Image = Image.open(BytesIO(sprite1))
+    pk2: Image.Image = Image.open(BytesIO(sprite2))
+
+    img.paste(pk1, (175, 220), mask=pk1)
+    img.paste(pk2, (1250, 220), mask=pk2)
+
+    out: BytesIO = BytesIO()
+    img.save(out, "PNG")
+    return out.getvalue()
+
+
+def _bench(name: str, render: Callable[[], bytes]) -> float:
+    size: int = len(render())
+
+    t1 = time.perf_counter()
+    for _ in range(RENDERS):
+        render()
+    rate: float = RENDERS / (time.perf_counter() - t1)
+
+    print(f"{name:<18}: {rate:>8,.1f} renders/s per core, {size / 1024:>7,.1f} KiB per image")
+    return rate
+
+
+def main() -> None:
+    background: bytes = _background()
+    sprites: Dict[str, bytes] = {"pikachu": _sprite((250, 210, 50)), "charmander": _sprite((240, 120, 40))}
+
+    battle_scenes._init_worker({"default": background})
+    turns: Iterator[int] = itertools.count()
+
+    def _sides() -> Tuple[SceneSide, SceneSide]:
+        turn: int = next(turns)
+        return (
+            SceneSide("pikachu", 42, "Pikachu", 120 - turn % 120, 120),
+            SceneSide("charmander", 37, "Charmander", 110 - turn % 110, 110, ("BRN",) if turn % 2 else ()),
+        )
+
+    def _first_turn(fmt: str) -> bytes:
+        battle_scenes._frames.clear()
+        return render_scene("default", _sides(), sprites, fmt)
+
+    def _next_turn(fmt: str) -> bytes:
+        return render_scene("default", _sides(), sprites, fmt)
+
+    old: float = _bench("old (png)", lambda: _old_render(background, sprites["pikachu"], sprites["charmander"]))
+    for fmt in ("JPEG", "WEBP"):
+        for name, render in (("first turn", _first_turn), ("next turns", _next_turn)):
+            rate: float = _bench(f"{name} ({fmt.lower()})", lambda: render(fmt))
+            print(f"{'':<18}  {rate / old:>8,.1f}x the old renders")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Messages per second the prefix matcher can classify.
+
+Run from `src/` with `python -m benchmarks.prefix_matcher`.
+"""
+from types import SimpleNamespace
+from typing import List
+
+import random
+import time
+
+from core.setting_cache import PrefixManager
+
+BOT_ID: int = 766553763569336340
+GUILDS: int = 10000
+MESSAGES: int = 200000
+
+
+def _legacy_prefixes(guilds: dict, mention: str, message) -> List[str]:
+    # What `_prefix_manager` used to build for every message.
+    guild = guilds.get(f"{message.guild.id}")
+    prefix: str = "p!" if guild is None else guild.prefix
+
+    return [prefix.lower(), prefix.upper(), mention + " ", mention[:2] + "!" + mention[2:] + " "]
+
+
+def main() -> None:
+    _guilds: list = [SimpleNamespace(id=gid, prefix=random.choice(("p!", "pb!", "?"))) for gid in range(GUILDS)]
+
+    manager: PrefixManager = PrefixManager(None)
+    manager.set_user(BOT_ID)
+    manager._cached = {guild.id: manager._build(guild.prefix) for guild in _guilds}
+
+    messages: list = [
+        SimpleNamespace(
+            content=random.choice(("hello there", "p!catch pikachu", "lol", "pb!info", "gg wp everyone")),
+            guild=SimpleNamespace(id=random.randrange(GUILDS)),
+        )
+        for _ in range(MESSAGES)
+    ]
+
+    legacy_guilds: dict = {f"{guild.id}": guild for guild in _guilds}
+    mention: str = f"<@{BOT_ID}>"
+
+    t1 = time.perf_counter()
+    for message in messages:
+        message.content.startswith(tuple(_legacy_prefixes(legacy_guilds, mention, message)))
+    legacy: float = time.perf_counter() - t1
+
+    t1 = time.perf_counter()
+    for message in messages:
+        manager.match(message)
+    current: float = time.perf_counter() - t1
+
+    print(f"legacy list build : {MESSAGES / legacy:>12,.0f} msg/s")
+    print(f"prefix matcher    : {MESSAGES / current:>12,.0f} msg/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Catch throughput with many concurrent claimers per spawn.
+
+Every round spawns a pokemon in each channel and lets `CLAIMERS` catches
+race for it, exactly one of them must win. The redis backend is only
+benchmarked when `REDIS_URI` is set in the environment.
+
+Run from `src/` with `python -m benchmarks.spawn_claims`.
+"""
+from types import SimpleNamespace
+from typing import List
+
+import asyncio
+import os
+import sys
+import time
+
+from core.spawn_state import Claim, RedisSpawnStore, SpawnStore
+
+CHANNELS: int = 200
+CLAIMERS: int = 10
+ROUNDS: int = 20
+SPECIES_ID: int = 25
+
+
+async def _round(store: SpawnStore) -> int:
+    await asyncio.gather(*(store.spawn(channel_id, SPECIES_ID) for channel_id in range(CHANNELS)))
+
+    results: List[Claim] = await asyncio.gather(
+        *(store.claim(channel_id, SPECIES_ID) for channel_id in range(CHANNELS) for _ in range(CLAIMERS))
+    )
+    return results.count(Claim.OK)
+
+
+async def _bench(name: str, store: SpawnStore) -> bool:
+    won: int = 0
+
+    t1 = time.perf_counter()
+    for _ in range(ROUNDS):
+        won += await _round(store)
+    elapsed: float = time.perf_counter() - t1
+
+    claims: int = ROUNDS * CHANNELS * CLAIMERS
+    print(f"{name:<6}: {claims / elapsed:>12,.0f} claims/s, {won} won out of {ROUNDS * CHANNELS} spawns")
+    return won == ROUNDS * CHANNELS
+
+
+async def main() -> None:
+    ok: bool = await _bench("local", SpawnStore())
+
+    redis_uri: str = os.environ.get("REDIS_URI", "")
+    if redis_uri:
+        import aioredis
+
+        redis = await aioredis.create_redis_pool(redis_uri, minsize=CLAIMERS, maxsize=CLAIMERS * 4)
+        try:
+            ok &= await _bench("redis", RedisSpawnStore(SimpleNamespace(redis=redis)))
+        finally:
+            redis.close()
+            await redis.wait_closed()
+
+    if not ok:
+        sys.exit("A spawn was caught more than once, or not at all.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
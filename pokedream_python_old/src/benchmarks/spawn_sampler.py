@@ -0,0 +1,70 @@
+"""
+Draws per second of the alias spawn sampler against `random.choices`, plus
+a chi-squared check of the sampled distribution.
+
+Run from `src/` with `python -m benchmarks.spawn_sampler`.
+"""
+from collections import Counter
+from typing import Dict, List
+
+import math
+import random
+import sys
+import time
+
+from core.spawn_sampler import AliasTable, SpawnSampler
+
+DRAWS: int = 1000000
+# `random.choices` rebuilds its cumulative weights on every call, a full run would take minutes.
+CHOICES_DRAWS: int = 100000
+
+
+def _chi_squared(table: AliasTable, weights: Dict[int, float], draws: int) -> bool:
+    counts: Counter = Counter(table.sample() for _ in range(draws))
+    total: float = sum(weights.values())
+
+    statistic: float = 0.0
+    for species_id, weight in weights.items():
+        expected: float = draws * weight / total
+        statistic += (counts[species_id] - expected) ** 2 / expected
+
+    # Wilson-Hilferty approximation of the 99.9th percentile of chi-squared.
+    df: int = len(weights) - 1
+    critical: float = df * (1 - 2 / (9 * df) + 3.0902 * math.sqrt(2 / (9 * df))) ** 3
+
+    print(f"chi-squared       : {statistic:>12,.1f} (critical {critical:,.1f} at p=0.001, df={df})")
+    return statistic < critical
+
+
+def main() -> None:
+    sampler: SpawnSampler = SpawnSampler.from_files()
+
+    species: List[int] = list(sampler.weights.keys())
+    weights: List[float] = list(sampler.weights.values())
+
+    t1 = time.perf_counter()
+    for _ in range(CHOICES_DRAWS):
+        random.choices(species, weights=weights, k=1)
+    choices: float = time.perf_counter() - t1
+
+    t1 = time.perf_counter()
+    for _ in range(DRAWS):
+        sampler.sample()
+    alias: float = time.perf_counter() - t1
+
+    print(f"random.choices    : {CHOICES_DRAWS / choices:>12,.0f} draws/s")
+    print(f"alias sampler     : {DRAWS / alias:>12,.0f} draws/s")
+
+    ok: bool = _chi_squared(sampler.table, sampler.weights, DRAWS)
+    biome: AliasTable = sampler.biomes["ice"]
+    ok &= _chi_squared(biome, {s: sampler.weights[s] for s in biome.items}, DRAWS // 10)
+
+    boosted: SpawnSampler = SpawnSampler.from_files(boosts={15: 4.0})
+    ok &= _chi_squared(boosted.table, boosted.weights, DRAWS)
+
+    if not ok:
+        sys.exit("Sampled distribution doesn't match the abundance weights.")
+
+
+if __name__ == "__main__":
+    main()
@@ -28,3 +28,11 @@ __ready_cogs__ = (
     "cogs.sprites",
     # "cogs.christmas"
 )
+
+# Rarely used cogs, they are only registered as stubs of their commands when
+# `LAZY_COGS` is enabled in the config and imported on first use. Cogs whose
+# listeners may fire before any of their commands were used must not be here.
+__lazy__ = {
+    "cogs.events": ("event",),
+    "cogs.storymode": ("journey",),
+}
@@ -193,6 +193,7 @@ class Admin(commands.Cog):
                 member.suspended_reason = reason
 
             await member.save()
+            await self.bot.suspensions.suspend(mem.id)
 
         with suppress(discord.Forbidden, discord.HTTPException):
             return await msg.edit("Successfully suspened member!", view=None, allowed_mentions=None)
@@ -229,6 +230,7 @@ class Admin(commands.Cog):
             member.suspended = False
 
             await member.save()
+            await self.bot.suspensions.unsuspend(mem.id)
 
         with suppress(discord.Forbidden, discord.HTTPException):
             return await msg.edit("Successfully unsuspened member!", view=None, allowed_mentions=None)
@@ -252,7 +254,6 @@ class Admin(commands.Cog):
             return random.randint(0, 31)
 
         args = parser.parse_args(split_args(args))
-        count: int = (await self.bot.manager.fetch_pokemon_list(user.id)).__len__()
 
         if not args.name:
             return await ctx.reply("Name must be provided!", mention_author=False)
@@ -276,7 +277,6 @@ class Admin(commands.Cog):
         def random_nature():
             return random.choice(constants.NATURES[1:])
 
-        _idx: int = await self.bot.manager.get_next_idx(user.id)
         pk = models.Pokemon(
             owner_id=user.id,
             level=level,
@@ -290,7 +290,6 @@ class Admin(commands.Cog):
             nature=random_nature(),
             timestamp=datetime.utcnow(),
             iv_total=hp + atk + defn + speed + sdef + satk,
-            idx=_idx,
             xp=xp,
             shiny=shiny,
         )
@@ -307,8 +306,8 @@ class Admin(commands.Cog):
             with suppress(discord.Forbidden, discord.HTTPException):
                 return await msg.edit("Aborted", view=None, embed=None)
 
+        pk.idx = (await self.bot.manager.reserve_idx(user.id))[0]
         await pk.save()
-        await self.bot.manager.update_idx(user.id)
 
         with suppress(discord.Forbidden, discord.HTTPException):
             return await msg.edit("Added successfully!", view=None, embed=None)
@@ -488,22 +487,11 @@ class Admin(commands.Cog):
 
     @tasks.loop(minutes=1)
     async def send_normal_spawn(self):
-        spawn_channels: List[discord.TextChannel] = []
-
-        for chid in self.bot.bot_config.normal_spawns:
-            try:
-                channel = self.bot.get_channel(chid) or (await self.bot.fetch_channel(chid))
-            except (discord.NotFound, discord.HTTPException):
-                channel = None
-
-            if channel is not None:
-                spawn_channels.append(channel)
+        # Normal spawn channels are global config, unlike redirects they are never pruned.
+        spawn_channels, _ = await self.bot.channels.resolve_many(self.bot.bot_config.normal_spawns)
 
         for channel in spawn_channels:
-            if channel is None:
-                continue
-
-            _species = data.random_pokemon()
+            _species = data.species_by_num(self.bot.spawn_sampler.sample())
 
             message: Optional[discord.Message] = channel.last_message
 
@@ -326,8 +326,8 @@ class Auction(commands.Cog):
                     _auc: models.Auctions = auction
                     await auction.delete()
 
-                    await self.bot.manager.update_pokemon(pokemon_id, owner_id=ctx.author.id, idx=member.next_idx)
-                    await self.bot.manager.update_idx(ctx.author.id)
+                    _idx: int = (await self.bot.manager.reserve_idx(ctx.author.id))[0]
+                    await self.bot.manager.update_pokemon(pokemon_id, owner_id=ctx.author.id, idx=_idx)
 
                     _auction_owner: models.Member = await self.bot.manager.fetch_member_info(_auc.owner_id)
                     _auction_owner.balance += bid
@@ -418,13 +418,12 @@ class Auction(commands.Cog):
 
         else:
             auc_owner: models.Member = await self.bot.manager.fetch_member_info(auction.owner_id)
-            auc_bidder: models.Member = await self.bot.manager.fetch_member_info(auction.bidder)
 
             auc_owner.balance = auction.current_bid
             await auc_owner.save()
 
-            await self.bot.manager.update_pokemon(auction.pokemon, owner_id=auction.bidder, idx=auc_bidder.next_idx)
-            await self.bot.manager.update_idx(auction.bidder)
+            _idx: int = (await self.bot.manager.reserve_idx(auction.bidder))[0]
+            await self.bot.manager.update_pokemon(auction.pokemon, owner_id=auction.bidder, idx=_idx)
 
             bidder: discord.User = self.bot.get_user(auction.bidder) or await self.bot.fetch_user(auction.bidder)
             owner: discord.User = self.bot.get_user(auction.owner_id) or await self.bot.fetch_user(auction.owner_id)
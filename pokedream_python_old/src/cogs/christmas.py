@@ -14,6 +14,7 @@ from cogs.helpers.battles import Reward, Trainer, Battle, BattleType, BattleEngi
 
 if typing.TYPE_CHECKING:
     from core.bot import PokeBest
+    from core.catch import CatchContext
 
 
 class SantaView(discord.ui.View):
@@ -76,7 +77,8 @@ class Christmas(commands.Cog):
         self.bot: PokeBest = bot
 
     @commands.Cog.listener()
-    async def on_catch(self, ctx: commands.Context, pokemon: models.Pokemon):
+    async def on_catch(self, catch: CatchContext):
+        ctx: commands.Context = catch.ctx
         catch_streak: typing.Optional[str] = await self.bot.redis.get(f"streak:member:{ctx.author.id}", encoding="utf-8")
 
         if catch_streak is not None:
@@ -6,25 +6,30 @@ from discord.ext import commands
 import discord
 import models
 import asyncpg
-from typing import Optional, Union, List, TYPE_CHECKING
-import pickle
+from tortoise.transactions import in_transaction
+from typing import Dict, Optional, Union, List, TYPE_CHECKING
+from core.member_cache import MemberCache
+from core.collection_stats import CollectionStats, CollectionStatsCache
+from core.xp import XPAccumulator
+from core.catch import count_query
 
 if TYPE_CHECKING:
     from core.bot import PokeBest
 
 
+class _EconomyRollback(Exception):
+    pass
+
+
 class Database(commands.Cog):
     def __init__(self, bot: PokeBest) -> None:
         self.bot: PokeBest = bot
+        self.member_cache: MemberCache = MemberCache(bot)
+        self.collection_stats: CollectionStatsCache = CollectionStatsCache(bot)
+        self.xp: XPAccumulator = XPAccumulator(bot)
 
     async def fetch_member_info(self, member_id: int) -> Union[None, models.Member]:
-        # val: Optional[models.Member] = await self.bot.redis.hget("db:member", member_id)
-        # if val is None:
-        #     val = await models.Member.get_or_none(id=member_id)
-        #     if val is not None:
-        #         await self.bot.redis.hset("db:member", member_id, pickle.dumps(val))
-        # return pickle.loads(val)
-        return await models.Member.get_or_none(id=member_id)
+        return await self.member_cache.get(member_id)
 
     async def fetch_pokemon_list(self, member_id: int) -> List[models.Pokemon]:
         return await models.Pokemon.filter(owner_id=member_id)
@@ -33,34 +38,124 @@ class Database(commands.Cog):
         return await models.Pokemon.get_or_none(owner_id=member_id, idx=number)
 
     async def fetch_pokemon_count(self, member_id: int) -> int:
-        return (await self.fetch_pokemon_list(member_id)).__len__()
+        return (await self.fetch_collection_stats(member_id)).total
+
+    async def fetch_collection_stats(self, member_id: int) -> CollectionStats:
+        return await self.collection_stats.get(member_id)
 
     async def update_idx(self, member_id: int) -> None:
-        m = await self.fetch_member_info(member_id)
-        _next_idx: int = m.next_idx
+        await self.reserve_idx(member_id)
 
-        await models.Member.filter(id=member_id).update(next_idx=_next_idx + 1)
+    async def reserve_idx(self, member_id: int, count: int = 1) -> range:
+        """
+        Reserve `count` consecutive pokemon indices of a member in one statement.
+        Concurrent callers always get disjoint blocks.
+        """
+        result: Optional[Dict[str, int]] = await self.update_economy(member_id, next_idx=count)
+        if result is None:
+            raise ValueError(f"Member {member_id} doesn't exist.")
+
+        _next_idx: int = result.get("next_idx", 0)
+        return range(_next_idx - count, _next_idx)
 
     async def get_next_idx(self, member_id: int) -> int:
-        return (await self.fetch_member_info(member_id)).next_idx
+        # Read straight from postgres, a cached copy may lag behind `update_idx`.
+        return (await models.Member.filter(id=member_id).values_list("next_idx", flat=True))[0]
 
     async def update_pokemon(self, pokemon_id: int, **kwargs) -> None:
-        await models.Pokemon.filter(id=pokemon_id).update(**kwargs)
+        """Updates a pokemon, the collection stats of its owner before and after are invalidated."""
+        async with in_transaction() as connection:
+            owners: List[Optional[int]] = await (
+                models.Pokemon.filter(id=pokemon_id)
+                .select_for_update()
+                .using_db(connection)
+                .values_list("owner_id", flat=True)
+            )
+            await models.Pokemon.filter(id=pokemon_id).using_db(connection).update(**kwargs)
+
+        if "owner_id" in kwargs:
+            owners.append(kwargs["owner_id"])
+
+        for owner_id in set(owners):
+            if owner_id is not None:
+                self.collection_stats.invalidate(owner_id)
 
     async def update_member(self, member_id: int, **kwargs) -> None:
         await models.Member.filter(id=member_id).update(**kwargs)
-
-        m = await self.fetch_member_info(member_id)
+        await self.member_cache.invalidate(member_id)
 
     async def increase_credits(self, member_id: int, amt: int) -> None:
-        mem: models.Member = await self.fetch_member_info(member_id)
-        mem.balance += amt
-        await mem.save()
+        await self.update_economy(member_id, balance=amt)
 
     async def increase_shards(self, member_id: int, amt: int) -> None:
-        mem: models.Member = await self.fetch_member_info(member_id)
-        mem.shards += amt
-        await mem.save()
+        await self.update_economy(member_id, shards=amt)
+
+    @staticmethod
+    def _economy_query(deltas: Dict[str, int]) -> str:
+        _projection: Dict[str, str] = models.Member._meta.fields_db_projection
+        _table: str = models.Member._meta.db_table
+
+        columns: List[str] = [f'"{_projection[field]}"' for field in deltas]
+        values: List[int] = list(deltas.values())
+
+        sets: str = ", ".join(f"{col} = {col} + ${i}" for i, col in enumerate(columns, start=2))
+        floors: str = "".join(
+            f" AND {col} + ${i} >= 0" for i, (col, delta) in enumerate(zip(columns, values), start=2) if delta < 0
+        )
+        returning: str = ", ".join(f'{col} AS "{field}"' for col, field in zip(columns, deltas))
+
+        return f'UPDATE "{_table}" SET {sets} WHERE "id" = $1{floors} RETURNING {returning};'
+
+    async def update_economy(
+        self, member_id: int, *, connection: Optional[asyncpg.Connection] = None, **deltas: int
+    ) -> Optional[Dict[str, int]]:
+        """
+        Atomically add `deltas` to the integer columns of a member, e.g.
+        `update_economy(id, balance=-500, redeems=1)`.
+
+        Every negative delta is a floor check, the update only happens if the
+        column stays non-negative. Returns the new values of the changed
+        columns, or `None` if the member doesn't exist or can't afford it.
+        """
+        deltas = {field: delta for field, delta in deltas.items() if delta != 0}
+        if not deltas:
+            return {} if await models.Member.filter(id=member_id).exists() else None
+
+        _executor = connection or self.bot.pool
+        record: Optional[asyncpg.Record] = await _executor.fetchrow(
+            self._economy_query(deltas), member_id, *deltas.values()
+        )
+        count_query()
+
+        await self.member_cache.invalidate(member_id)
+
+        return None if record is None else dict(record)
+
+    async def update_economy_many(self, changes: Dict[int, Dict[str, int]]) -> Optional[Dict[int, Dict[str, int]]]:
+        """
+        Same as `update_economy` for several members inside one transaction.
+        Either every member is updated, or nothing is and `None` is returned.
+        """
+        results: Dict[int, Dict[str, int]] = {}
+
+        async with self.bot.pool.acquire() as connection:
+            try:
+                async with connection.transaction():
+                    for member_id, deltas in changes.items():
+                        result = await self.update_economy(member_id, connection=connection, **deltas)
+
+                        if result is None:
+                            raise _EconomyRollback()
+
+                        results[member_id] = result
+            except _EconomyRollback:
+                return None
+
+        # Readers may have re-cached the old rows before the commit.
+        for member_id in changes:
+            await self.member_cache.invalidate(member_id)
+
+        return results
 
     async def fetch_pokemon(self, member_id: int, pokemon_id: int) -> models.Pokemon:
         return await models.Pokemon.get_or_none(owner_id=member_id, idx=pokemon_id)
@@ -64,20 +64,20 @@ class DiwaliEvent(commands.Cog):
 
             species: dict = data.species_by_name("hisuian zorua")
 
+            _result = await self.bot.manager.update_economy(ctx.author.id, crackers=-50, next_idx=1)
+            if _result is None:
+                return await not_enough_crackers(ctx)
+
             pokemon: models.Pokemon = models.Pokemon.get_random(
                 species_id=species["species_id"],
                 level=random.randint(1, 50),
                 xp=0,
                 owner_id=ctx.author.id,
                 timestamp=datetime.now(),
-                idx=mem.next_idx,
+                idx=_result["next_idx"] - 1,
             )
 
             await pokemon.save()
-            await self.bot.manager.update_idx(ctx.author.id)
-
-            mem.crackers -= 50
-            await mem.save()
 
             return await ctx.reply(
                 f"You successfully purchased `{species['names']['9']}`!",
@@ -90,20 +90,20 @@ class DiwaliEvent(commands.Cog):
 
             species: dict = data.species_by_name("hisuian growlithe")
 
+            _result = await self.bot.manager.update_economy(ctx.author.id, crackers=-50, next_idx=1)
+            if _result is None:
+                return await not_enough_crackers(ctx)
+
             pokemon: models.Pokemon = models.Pokemon.get_random(
                 species_id=species["species_id"],
                 level=random.randint(1, 50),
                 xp=0,
                 owner_id=ctx.author.id,
                 timestamp=datetime.now(),
-                idx=mem.next_idx,
+                idx=_result["next_idx"] - 1,
             )
 
             await pokemon.save()
-            await self.bot.manager.update_idx(ctx.author.id)
-
-            mem.crackers -= 50
-            await mem.save()
 
             return await ctx.reply(
                 f"You successfully purchased `{species['names']['9']}`!",
@@ -116,20 +116,20 @@ class DiwaliEvent(commands.Cog):
 
             species: dict = data.species_by_name("hisuian braviary")
 
+            _result = await self.bot.manager.update_economy(ctx.author.id, crackers=-50, next_idx=1)
+            if _result is None:
+                return await not_enough_crackers(ctx)
+
             pokemon: models.Pokemon = models.Pokemon.get_random(
                 species_id=species["species_id"],
                 level=random.randint(1, 50),
                 xp=0,
                 owner_id=ctx.author.id,
                 timestamp=datetime.now(),
-                idx=mem.next_idx,
+                idx=_result["next_idx"] - 1,
             )
 
             await pokemon.save()
-            await self.bot.manager.update_idx(ctx.author.id)
-
-            mem.crackers -= 50
-            await mem.save()
 
             return await ctx.reply(
                 f"You successfully purchased `{species['names']['9']}`!",
@@ -120,15 +120,13 @@ class Gambling(commands.Cog):
 
         loser: GambleUser = discord.utils.find(lambda x: x.user_id != winner.user_id, gamble.users)
 
-        winner.model.balance += amount
-        loser.model.balance -= amount
+        _result = await self.bot.manager.update_economy_many(
+            {loser.user_id: {"balance": -amount}, winner.user_id: {"balance": amount}}
+        )
 
-        if loser.model.balance < 0:
+        if _result is None:
             raise PokeBestError("Something went wrong in this gamble session.")
 
-        await winner.model.save()
-        await loser.model.save()
-
         self.bot.dispatch("gamble_end", winner, loser, ctx, amount)
 
         with suppress(discord.Forbidden, discord.HTTPException):
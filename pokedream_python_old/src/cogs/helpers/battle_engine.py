@@ -0,0 +1,460 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple, TYPE_CHECKING
+from utils import constants
+from utils.constants import STAT_STAGE_MULTIPLIERS
+import json
+import random
+
+if TYPE_CHECKING:
+    import models
+
+__all__ = (
+    "MoveEffect",
+    "StatStages",
+    "StatChange",
+    "BattleMove",
+    "Combatant",
+    "MoveResult",
+    "MoveTables",
+    "BattleState",
+)
+
+# Moves that can still be used while asleep or frozen
+SLEEP_MOVES: Tuple[int, ...] = (173, 214)
+FREEZE_MOVES: Tuple[int, ...] = (588, 172, 221, 293, 503, 592)
+
+USER_TARGET: int = 7
+# Stat stages stay within +-MAX_STAGE, like in the games
+MAX_STAGE: int = 6
+# Stat ids `StatChange.stat` knows
+STAT_IDS: range = range(1, 8)
+RANDOM_FACTORS: Tuple[float, ...] = (0.1, 1, 0.75)
+
+
+class MoveEffect(IntEnum):
+    missed = 1
+    super_effective = 2
+    not_effective = 3
+    normal = 4
+    nothing = 5
+
+
+@dataclass
+class StatStages:
+    hp: int = 0
+    atk: int = 0
+    defn: int = 0
+    satk: int = 0
+    sdef: int = 0
+    spd: int = 0
+    evasion: int = 0
+    accuracy: int = 0
+    crit: int = 0
+
+    def update(self, stages):
+        self.hp += stages.hp
+        self.atk += stages.atk
+        self.defn += stages.defn
+        self.satk += stages.satk
+        self.sdef += stages.sdef
+        self.spd += stages.spd
+        self.evasion += stages.evasion
+        self.accuracy += stages.accuracy
+        self.crit += stages.crit
+
+
+@dataclass
+class StatChange:
+    stat_id: int
+    change: int
+
+    @cached_property
+    def stat(self):
+        return ("hp", "atk", "defn", "satk", "spd", "evasion", "accuracy")[self.stat_id - 1]
+
+
+@dataclass
+class BattleMove:
+    success: bool
+    damage: int
+    healing: int
+    ailment: str
+    effect: MoveEffect
+    messages: List[str]
+    stat_changes: List[StatChange]
+    critical_hit: bool
+
+    @property
+    def text(self) -> str:
+        if self.effect == MoveEffect.missed:
+            message = "Uhh.. It missed!"
+        elif self.effect == MoveEffect.super_effective:
+            message = f"Woah! It was super effective! **`-{self.damage}`**"
+        elif self.effect == MoveEffect.not_effective:
+            message = f"It wasn't that effective. **`-{self.damage}`**"
+        elif self.effect == MoveEffect.nothing:
+            message = "It had no effect!"
+        else:
+            message = f"**`-{self.damage}`**"
+
+        if self.effect not in (MoveEffect.missed, MoveEffect.nothing) and self.critical_hit:
+            message = f"\nIt was a **CRITICAL HII! ** | **`-{self.damage}`**"
+
+        return message
+
+
+class Combatant:
+    """
+    The battle relevant state of one pokemon.
+
+    Ailments and stat stages are kept by reference, a combatant built from a
+    trainer's pokemon shares them with it.
+    """
+
+    __slots__ = ("species_id", "level", "types", "base_stats", "max_hp", "hp", "moves", "stages", "ailments")
+
+    def __init__(
+        self,
+        species_id: int,
+        level: int,
+        types: Tuple[int, ...],
+        base_stats: Tuple[int, ...],
+        max_hp: int,
+        hp: Optional[float] = None,
+        moves: Sequence[dict] = (),
+        stages: Optional[StatStages] = None,
+        ailments: Optional[Set[str]] = None,
+    ) -> None:
+        self.species_id: int = species_id
+        self.level: int = level
+        self.types: Tuple[int, ...] = types
+        self.base_stats: Tuple[int, ...] = base_stats
+        self.max_hp: int = max_hp
+        self.hp: float = max_hp if hp is None else hp
+        self.moves: Tuple[dict, ...] = tuple(moves)
+        self.stages: StatStages = stages if stages is not None else StatStages()
+        self.ailments: Set[str] = ailments if ailments is not None else set()
+
+    @classmethod
+    def from_pokemon(cls, pokemon: models.Pokemon, ailments: Optional[Set[str]] = None) -> "Combatant":
+        specie: dict = pokemon.specie
+        return cls(
+            pokemon.species_id,
+            pokemon.level,
+            tuple(specie["types"]),
+            tuple(specie["base_stats"]),
+            pokemon.max_hp,
+            pokemon.hp,
+            stages=pokemon.stages,
+            ailments=ailments,
+        )
+
+    @classmethod
+    def from_species(cls, species: dict, level: int, moves: Sequence[dict], *, iv: int = 15) -> "Combatant":
+        """A combatant without a pokemon behind it, its HP come from the usual stat formula."""
+        max_hp: int = (2 * species["base_stats"][0] + iv) * level // 100 + level + 10
+        return cls(
+            species["species_id"],
+            level,
+            tuple(species["types"]),
+            tuple(species["base_stats"]),
+            max_hp,
+            moves=moves,
+        )
+
+    @property
+    def fainted(self) -> bool:
+        return self.hp <= 0
+
+
+@dataclass
+class MoveResult:
+    move: BattleMove
+    # Side whose stages the stat changes of the move went to
+    target: int
+    fainted: bool
+
+
+def _items(table) -> Iterable[Tuple[int, object]]:
+    return table.items() if isinstance(table, Mapping) else enumerate(table)
+
+
+class MoveTables:
+    """
+    Move data, move meta and the type chart compiled into flat lists indexed
+    by move id, so damage calculations don't go through `data.get_move_meta`
+    and nested dicts on every hit.
+
+    `efficacy[move_id]` is the type chart row of the move's type, indexed by
+    the defender's type id. Moves without meta get neutral values.
+    """
+
+    MOVES_PATH: Path = Path("data/json/moves.json")
+    META_PATH: Path = Path("data/json/move_meta.json")
+
+    _default: Optional["MoveTables"] = None
+
+    def __init__(self, moves: Iterable[dict], meta: Iterable[dict], type_efficacy, ailments) -> None:
+        moves = list(moves)
+        meta_by_move: Dict[int, dict] = {m["move_id"]: m for m in meta}
+        size: int = max(move["id"] for move in moves) + 1
+
+        types: int = max(type_id for type_id, _ in _items(type_efficacy)) + 1
+        rows: Dict[int, List[float]] = {}
+        for type_id, row in _items(type_efficacy):
+            rows[type_id] = [1.0] * types
+            for defender, multiplier in _items(row):
+                rows[type_id][defender] = multiplier
+        neutral: List[float] = [1.0] * types
+
+        self.damaging: List[bool] = [False] * size
+        self.physical: List[bool] = [False] * size
+        self.power: List[int] = [0] * size
+        self.accuracy: List[int] = [100] * size
+        self.min_hits: List[int] = [1] * size
+        self.max_hits: List[int] = [1] * size
+        self.efficacy: List[List[float]] = [neutral] * size
+        self.drain: List[int] = [0] * size
+        self.healing: List[int] = [0] * size
+        self.stat_chance: List[int] = [0] * size
+        self.stat_change: List[Optional[StatChange]] = [None] * size
+        self.ailment_chance: List[int] = [0] * size
+        self.ailment: List[Optional[str]] = [None] * size
+
+        for move in moves:
+            mid: int = move["id"]
+            self.damaging[mid] = move["damage_class_id"] != 1 and move["power"] is not None
+            self.physical[mid] = move["damage_class_id"] == 2
+            self.power[mid] = move["power"] or 0
+            self.accuracy[mid] = move["accuracy"] if move["accuracy"] is not None else 100
+            self.efficacy[mid] = rows.get(move["type_id"], neutral)
+
+            meta: Optional[dict] = meta_by_move.get(mid)
+            if meta is None:
+                continue
+
+            self.min_hits[mid] = meta["min_hits"] or 1
+            self.max_hits[mid] = meta["max_hits"] or 1
+            self.drain[mid] = meta["drain"]
+            self.healing[mid] = meta["healing"]
+            self.stat_chance[mid] = meta["stat_chance"]
+            if meta["change_stat_id"] in STAT_IDS:
+                self.stat_change[mid] = StatChange(meta["change_stat_id"], meta["stat_change"])
+            self.ailment_chance[mid] = meta["ailment_chance"]
+            try:
+                self.ailment[mid] = ailments[meta["meta_ailment_id"]]
+            except (KeyError, IndexError):
+                pass
+
+    @classmethod
+    def from_files(cls, moves_path: Path = MOVES_PATH, meta_path: Path = META_PATH) -> "MoveTables":
+        with open(moves_path, encoding="utf-8") as f:
+            moves: List[dict] = json.load(f)
+        with open(meta_path, encoding="utf-8") as f:
+            meta: List[dict] = json.load(f)
+
+        return cls(moves, meta, constants.TYPE_EFFICACY, constants.MOVE_AILMENTS)
+
+    @classmethod
+    def default(cls) -> "MoveTables":
+        """The tables of the bundled move data, compiled on first use."""
+        if cls._default is None:
+            cls._default = cls.from_files()
+        return cls._default
+
+
+class BattleState:
+    """
+    Battle rules without anything Discord, over the two combatants of a 1v1
+    battle. Every random roll goes through `rng`, so a seed replays a battle.
+    """
+
+    __slots__ = ("sides", "rng", "tables", "turns")
+
+    def __init__(
+        self,
+        sides: Tuple[Combatant, Combatant],
+        *,
+        seed: Optional[int] = None,
+        rng: Optional[random.Random] = None,
+        tables: Optional[MoveTables] = None,
+    ) -> None:
+        self.sides: Tuple[Combatant, Combatant] = sides
+        self.rng: random.Random = rng if rng is not None else random.Random(seed)
+        self.tables: MoveTables = tables if tables is not None else MoveTables.default()
+        self.turns: int = 0
+
+    @property
+    def winner(self) -> Optional[int]:
+        for idx, side in enumerate(self.sides):
+            if side.fainted:
+                return 1 - idx
+        return None
+
+    # TODO: Status Moves
+    def calculate_damage(self, move: dict, attacker: Combatant, defender: Combatant) -> BattleMove:
+        rng: random.Random = self.rng
+        t: MoveTables = self.tables
+        mid: int = move["id"]
+
+        if not t.damaging[mid]:
+            success = True
+            damage = 0
+            hits = 0
+            critical_hit = 1
+        else:
+            success: int = rng.randrange(99) <= t.accuracy[mid]
+            hits: int = rng.randint(t.min_hits[mid], t.max_hits[mid])
+
+            critical_hit = 2 if rng.randint(1, 150) == 1 else 1
+            # Neither STAB, spread targets nor the random factor are applied yet, the factor is still rolled
+            # so seeds keep replaying the same way.
+            rng.choice(RANDOM_FACTORS)
+
+            if t.physical[mid]:
+                atk = attacker.base_stats[1] * STAT_STAGE_MULTIPLIERS[attacker.stages.atk]
+                defn = defender.base_stats[2] * STAT_STAGE_MULTIPLIERS[attacker.stages.defn]
+
+            else:
+                atk = attacker.base_stats[3] * STAT_STAGE_MULTIPLIERS[attacker.stages.satk]
+                defn = defender.base_stats[4] * STAT_STAGE_MULTIPLIERS[attacker.stages.sdef]
+
+            damage = int((2 * attacker.level / 5 + 2) * t.power[mid] * atk / defn) / 50 + 2
+
+        messages: List[str] = []
+
+        efficacy: List[float] = t.efficacy[mid]
+        typ_mult = 1
+        for typ in defender.types:
+            typ_mult *= efficacy[typ]
+
+        if not success:
+            effectiveness = MoveEffect.missed
+            messages.append("It missed!")
+            typ_mult = 0
+
+        elif typ_mult == 0:
+            effectiveness = MoveEffect.not_effective
+            messages.append("It had no effect!")
+
+        elif typ_mult < 1:
+            messages.append("It was not very effective...")
+            effectiveness = MoveEffect.not_effective
+
+        elif typ_mult == 1:
+            effectiveness = MoveEffect.normal
+
+        else:
+            messages.append("It was super effective!")
+            effectiveness = MoveEffect.super_effective
+
+        if hits > 1:
+            messages.append(f"It hit {hits} times!")
+
+        healing = damage * t.drain[mid] / 100 + attacker.max_hp * t.healing[mid] / 100
+
+        for ailment in attacker.ailments:
+            if ailment == "Paralysis":
+                if rng.random() < 0.25:
+                    success = False
+            elif ailment == "Sleep":
+                if mid not in SLEEP_MOVES:
+                    success = False
+            elif ailment == "Freeze":
+                if mid not in FREEZE_MOVES:
+                    success = False
+            elif ailment == "Burn":
+                if t.physical[mid]:
+                    damage /= 2
+
+            ## TODO: Add more ailments
+
+        changes: list = []
+
+        if rng.randrange(100) < t.stat_chance[mid] and t.stat_change[mid] is not None:
+            changes.append(t.stat_change[mid])
+
+        ailment = t.ailment[mid] if rng.randrange(100) < t.ailment_chance[mid] else None
+
+        return BattleMove(
+            success,
+            round(damage),
+            round(healing),
+            ailment,
+            effectiveness,
+            messages,
+            changes,
+            critical_hit,
+        )
+
+    def apply_status_damage(self) -> None:
+        for side in self.sides:
+            if "Burn" in side.ailments:
+                side.hp -= 1 / 16 * side.max_hp
+            if "Poison" in side.ailments:
+                side.hp -= 1 / 8 * side.max_hp
+
+    def use_move(self, side: int, move: dict) -> MoveResult:
+        """Burn and poison hurt both pokemon, then the pokemon of `side` uses `move` on the other one."""
+        self.apply_status_damage()
+        self.turns += 1
+
+        attacker, defender = self.sides[side], self.sides[1 - side]
+        bm: BattleMove = self.calculate_damage(move, attacker, defender)
+        target: int = side if move["target_id"] == USER_TARGET else 1 - side
+
+        if bm.success:
+            defender.hp -= bm.damage
+            attacker.hp += bm.healing
+
+            attacker.hp = int(round(attacker.hp))
+            defender.hp = int(round(defender.hp))
+
+            attacker.hp = min(attacker.hp, attacker.max_hp)
+
+            if bm.ailment:
+                defender.ailments.add(bm.ailment)
+
+            stages: StatStages = self.sides[target].stages
+            for change in bm.stat_changes:
+                stage: int = getattr(stages, change.stat) + change.change
+                setattr(stages, change.stat, min(max(stage, -MAX_STAGE), MAX_STAGE))
+
+        defender.hp = max(defender.hp, 0)
+
+        return MoveResult(bm, target, defender.hp == 0)
+
+    def speed(self, side: int) -> float:
+        combatant: Combatant = self.sides[side]
+        return combatant.base_stats[5] * STAT_STAGE_MULTIPLIERS[combatant.stages.spd]
+
+    def play_turn(self) -> Optional[int]:
+        """
+        Both pokemon use a random move of theirs, the faster one first. Returns
+        the winning side once one of them fainted.
+        """
+        speeds: Tuple[float, float] = (self.speed(0), self.speed(1))
+        first: int = self.rng.randrange(2) if speeds[0] == speeds[1] else int(speeds[1] > speeds[0])
+
+        for side in (first, 1 - first):
+            attacker: Combatant = self.sides[side]
+            if attacker.moves:
+                self.use_move(side, self.rng.choice(attacker.moves))
+
+            winner: Optional[int] = self.winner
+            if winner is not None:
+                return winner
+        return None
+
+    def run(self, max_turns: int = 200) -> Optional[int]:
+        """Plays turns until a pokemon faints, `None` means nobody won within `max_turns`."""
+        for _ in range(max_turns):
+            winner: Optional[int] = self.play_turn()
+            if winner is not None:
+                return winner
+        return None
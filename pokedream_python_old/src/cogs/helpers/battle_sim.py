@@ -0,0 +1,290 @@
+"""
+Batch battle simulations for balancing raid bosses, gyms and journey rosters.
+
+Every pokemon of one population fights every pokemon of the other one
+`battles` times on the headless battle engine. The report holds the win-rate
+matrix and how many turns each matchup took to end in a KO.
+
+Run from `src/` with, for example
+
+    python -m cogs.helpers.battle_sim pikachu@50 charizard@50 --vs mewtwo@2500 --battles 10000 --csv sim.csv
+"""
+from __future__ import annotations
+
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import IO, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import argparse
+import csv
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+from data import data
+
+from .battle_engine import BattleState, Combatant, MoveTables
+
+__all__ = (
+    "Entrant",
+    "PairResult",
+    "SimulationReport",
+    "entrant",
+    "simulate",
+    "simulate_in_processes",
+)
+
+DEFAULT_LEVEL: int = 50
+MAX_TURNS: int = 200
+# Battles of a matchup are played in chunks of this many, each chunk with its own seed
+CHUNK_BATTLES: int = 2000
+
+
+class Entrant(NamedTuple):
+    name: str
+    species: dict
+    level: int
+    moves: Tuple[dict, ...]
+
+    def __str__(self) -> str:
+        return f"{self.name}@{self.level}"
+
+    def combatant(self) -> Combatant:
+        return Combatant.from_species(self.species, self.level, self.moves)
+
+
+def entrant(spec: str) -> Entrant:
+    """
+    Parses `name` or `name@level`. The pokemon gets its first four moves, like
+    raid bosses and gym pokemon do.
+    """
+    name, _, level = spec.partition("@")
+    name = name.strip()
+
+    species: Optional[dict] = data.species_by_name(name)
+    if species is None:
+        raise ValueError(f"Unknown pokemon {name!r}")
+
+    try:
+        _level: int = int(level) if level else DEFAULT_LEVEL
+    except ValueError:
+        raise ValueError(f"Invalid level {level!r} of {name!r}") from None
+
+    moves: list = data.get_pokemon_moves(species["species_id"]) or data.get_pokemon_moves(species["dex_number"])
+    return Entrant(name, species, _level, tuple(data.move_by_id(m["move_id"]) for m in moves[:4]))
+
+
+@dataclass
+class PairResult:
+    # Wins of the left and right pokemon, battles nobody won within the turn limit
+    wins: List[int] = field(default_factory=lambda: [0, 0])
+    draws: int = 0
+    # Turns the battles ending in a KO took
+    turns: Counter = field(default_factory=Counter)
+    moves: int = 0
+
+    @property
+    def battles(self) -> int:
+        return sum(self.wins) + self.draws
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins[0] / self.battles if self.battles else 0.0
+
+    def turns_percentile(self, percentile: float) -> Optional[int]:
+        """Turns within which `percentile` of the KOs happened."""
+        total: int = sum(self.turns.values())
+        if not total:
+            return None
+
+        seen: int = 0
+        for turns in sorted(self.turns):
+            seen += self.turns[turns]
+            if seen >= total * percentile:
+                return turns
+
+    def merge(self, other: PairResult) -> None:
+        self.wins[0] += other.wins[0]
+        self.wins[1] += other.wins[1]
+        self.draws += other.draws
+        self.turns.update(other.turns)
+        self.moves += other.moves
+
+    @property
+    def mean_turns(self) -> Optional[float]:
+        total: int = sum(self.turns.values())
+        return sum(t * n for t, n in self.turns.items()) / total if total else None
+
+
+def _run_pair(left: Entrant, right: Entrant, battles: int, seed: int, max_turns: int) -> PairResult:
+    rng: random.Random = random.Random(seed)
+    tables: MoveTables = MoveTables.default()
+    result: PairResult = PairResult()
+
+    for _ in range(battles):
+        state: BattleState = BattleState((left.combatant(), right.combatant()), rng=rng, tables=tables)
+
+        winner: Optional[int] = None
+        turns: int = 0
+        while winner is None and turns < max_turns:
+            turns += 1
+            winner = state.play_turn()
+
+        if winner is None:
+            result.draws += 1
+        else:
+            result.wins[winner] += 1
+            result.turns[turns] += 1
+        result.moves += state.turns
+
+    return result
+
+
+@dataclass
+class SimulationReport:
+    left: List[Entrant]
+    right: List[Entrant]
+    battles: int
+    seed: int
+    # results[i][j] are the battles of left[i] against right[j]
+    results: List[List[PairResult]]
+    elapsed: float
+
+    @property
+    def moves(self) -> int:
+        return sum(r.moves for row in self.results for r in row)
+
+    def matrix(self) -> str:
+        """Win rates of the left pokemon as a text table, one row per left pokemon."""
+        names: List[str] = [str(e) for e in self.right]
+        width: int = max(map(len, (str(e) for e in self.left)))
+        lines: List[str] = [" " * width + "".join(f" {name[:12]:>12}" for name in names)]
+
+        for left, row in zip(self.left, self.results):
+            lines.append(f"{str(left):<{width}}" + "".join(f" {r.win_rate:>12.1%}" for r in row))
+        return "\n".join(lines)
+
+    def write_csv(self, out: IO[str]) -> None:
+        """One row per matchup, turn figures only count the battles ending in a KO."""
+        writer = csv.writer(out)
+        writer.writerow(
+            ("left", "right", "battles", "left_wins", "right_wins", "draws", "left_win_rate")
+            + ("mean_turns", "p50_turns", "p90_turns", "max_turns")
+        )
+        for left, row in zip(self.left, self.results):
+            for right, r in zip(self.right, row):
+                mean: Optional[float] = r.mean_turns
+                writer.writerow(
+                    (str(left), str(right), r.battles, r.wins[0], r.wins[1], r.draws, f"{r.win_rate:.4f}")
+                    + (
+                        "" if mean is None else f"{mean:.2f}",
+                        r.turns_percentile(0.5) or "",
+                        r.turns_percentile(0.9) or "",
+                        max(r.turns, default=""),
+                    )
+                )
+
+    def write_turns_csv(self, out: IO[str]) -> None:
+        """The full turns-to-KO distribution, one row per matchup and number of turns."""
+        writer = csv.writer(out)
+        writer.writerow(("left", "right", "turns", "battles"))
+        for left, row in zip(self.left, self.results):
+            for right, r in zip(self.right, row):
+                for turns in sorted(r.turns):
+                    writer.writerow((str(left), str(right), turns, r.turns[turns]))
+
+
+def simulate(
+    left: Sequence[Entrant],
+    right: Sequence[Entrant],
+    *,
+    battles: int,
+    seed: Optional[int] = None,
+    max_turns: int = MAX_TURNS,
+    executor: Optional[Executor] = None,
+) -> SimulationReport:
+    """
+    Runs `battles` battles for every pair of a left and a right pokemon.
+    The chunks of every matchup are spread over `executor` if one is given.
+    Every chunk has its own seed, so a seeded report doesn't depend on how
+    it was spread.
+    """
+    seed = random.getrandbits(32) if seed is None else seed
+
+    chunks: List[Tuple[int, int]] = []
+    args: List[tuple] = []
+    for i, a in enumerate(left):
+        for j, b in enumerate(right):
+            for start in range(0, battles, CHUNK_BATTLES):
+                chunks.append((i, j))
+                args.append((a, b, min(CHUNK_BATTLES, battles - start), seed + len(args), max_turns))
+
+    t1 = time.perf_counter()
+    if executor is None:
+        outcomes: Iterable[PairResult] = map(_run_pair, *zip(*args))
+    else:
+        outcomes = executor.map(_run_pair, *zip(*args))
+
+    results: List[List[PairResult]] = [[PairResult() for _ in right] for _ in left]
+    for (i, j), outcome in zip(chunks, outcomes):
+        results[i][j].merge(outcome)
+    elapsed: float = time.perf_counter() - t1
+
+    return SimulationReport(list(left), list(right), battles, seed, results, elapsed)
+
+
+def simulate_in_processes(
+    left: Sequence[Entrant], right: Sequence[Entrant], *, battles: int, workers: int, **kwargs
+) -> SimulationReport:
+    """
+    `simulate` on a pool of `workers` processes started for this simulation.
+    They're spawned rather than forked, so a bot calling this doesn't copy
+    itself into them.
+    """
+    if workers <= 1:
+        return simulate(left, right, battles=battles, **kwargs)
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return simulate(left, right, battles=battles, executor=executor, **kwargs)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m cogs.helpers.battle_sim", description=__doc__.split("\n\n")[1])
+    parser.add_argument("left", nargs="+", help="pokemon as name or name@level")
+    parser.add_argument("--vs", nargs="+", required=True, dest="right", help="the opposing pokemon")
+    parser.add_argument("--battles", type=int, default=1000, help="battles per matchup")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--max-turns", type=int, default=MAX_TURNS)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--csv", help="file for one row per matchup, - for stdout")
+    parser.add_argument("--turns-csv", help="file for the turns-to-KO distributions")
+    args = parser.parse_args(argv)
+
+    try:
+        left: List[Entrant] = [entrant(spec) for spec in args.left]
+        right: List[Entrant] = [entrant(spec) for spec in args.right]
+    except ValueError as e:
+        parser.error(str(e))
+
+    report: SimulationReport = simulate_in_processes(
+        left, right, battles=args.battles, workers=args.workers, seed=args.seed, max_turns=args.max_turns
+    )
+
+    for path, write in ((args.csv, report.write_csv), (args.turns_csv, report.write_turns_csv)):
+        if path == "-":
+            write(sys.stdout)
+        elif path:
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                write(f)
+
+    if args.csv != "-":
+        print(report.matrix())
+    rate: float = report.moves / report.elapsed
+    print(f"{report.moves:,} moves in {report.elapsed:.2f}s ({rate:,.0f}/s), seed {report.seed}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,6 @@ import enum
 
 from dataclasses import dataclass, field
 from enum import Enum, IntEnum
-from functools import cached_property
 import json
 from typing import List, Optional, TYPE_CHECKING, Set
 import aiohttp
@@ -14,14 +13,13 @@ from discord.ext import commands
 import models
 from data import data
 from contextlib import suppress
-from PIL import Image
 from utils.constants import UTC, BattleType, BattleEngine, BattleCategory
 from utils.methods import make_hp_bar, write_fp
 from utils.emojis import emojis
 from utils import constants
 from io import BytesIO
 from models.helpers import ArrayAppend
-import requests
+from .battle_engine import BattleMove, BattleState, Combatant, MoveEffect, MoveResult, StatChange, StatStages
 import random
 import math
 import pickle
@@ -218,14 +216,6 @@ class Trainer:
         return _mv_list
 
 
-class MoveEffect(IntEnum):
-    missed = 1
-    super_effective = 2
-    not_effective = 3
-    normal = 4
-    nothing = 5
-
-
 class Stage(IntEnum):
     PROGRESS = 1
     END = 2
@@ -244,70 +234,6 @@ class Reward(IntEnum):
     JourneyTrainer = 9
 
 
-@dataclass
-class StatStages:
-    hp: int = 0
-    atk: int = 0
-    defn: int = 0
-    satk: int = 0
-    sdef: int = 0
-    spd: int = 0
-    evasion: int = 0
-    accuracy: int = 0
-    crit: int = 0
-
-    def update(self, stages):
-        self.hp += stages.hp
-        self.atk += stages.atk
-        self.defn += stages.defn
-        self.satk += stages.satk
-        self.sdef += stages.sdef
-        self.spd += stages.spd
-        self.evasion += stages.evasion
-        self.accuracy += stages.accuracy
-        self.crit += stages.crit
-
-
-@dataclass
-class StatChange:
-    stat_id: int
-    change: int
-
-    @cached_property
-    def stat(self):
-        return ("hp", "atk", "defn", "satk", "spd", "evasion", "accuracy")[self.stat_id - 1]
-
-
-@dataclass
-class BattleMove:
-    success: bool
-    damage: int
-    healing: int
-    ailment: str
-    effect: MoveEffect
-    messages: List[str]
-    stat_changes: List[StatChange]
-    critical_hit: bool
-
-    @property
-    def text(self) -> str:
-        if self.effect == MoveEffect.missed:
-            message = "Uhh.. It missed!"
-        elif self.effect == MoveEffect.super_effective:
-            message = f"Woah! It was super effective! **`-{self.damage}`**"
-        elif self.effect == MoveEffect.not_effective:
-            message = f"It wasn't that effective. **`-{self.damage}`**"
-        elif self.effect == MoveEffect.nothing:
-            message = "It had no effect!"
-        else:
-            message = f"**`-{self.damage}`**"
-
-        if self.effect not in (MoveEffect.missed, MoveEffect.nothing) and self.critical_hit:
-            message = f"\nIt was a **CRITICAL HII! ** | **`-{self.damage}`**"
-
-        return message
-
-
 class Battle:
     def __init__(
         self,
@@ -346,6 +272,10 @@ class Battle:
         self._image_cache = {}
         self.raid_battle: bool = raid_battle
 
+        # Every roll of the battle comes from here, the seed is enough to replay it.
+        self.seed: int = kwargs.get("seed", random.getrandbits(32))
+        self.rng: random.Random = random.Random(self.seed)
+
         for t in self.trainers:
             t.selected_pokemon.stages = StatStages()
 
@@ -404,153 +334,8 @@ class Battle:
         with suppress(discord.Forbidden):
             await trainer2.send(embed=self._build_moves_embed(trainer2, t2moves))
 
-    def make_battle_image(self, pk1_url: str, pk2_url: str) -> bytes:
-        img: Image = Image.open(requests.get("https://i.imgur.com/KWdmvCn.png", stream=True).raw)
-
-        pk1: Image = Image.open(requests.get(pk1_url, stream=True).raw)
-        pk2: Image = Image.open(requests.get(pk2_url, stream=True).raw)
-
-        img.paste(pk1, (175, 220), mask=pk1)
-        img.paste(pk2, (1250, 220), mask=pk2)
-
-        img_bytes = BytesIO()
-        img.save(img_bytes, "PNG")
-        img_bytes.seek(0)
-
-        return img_bytes
-
-    # TODO: Status Moves
-    def calculate_damage(self, move, attacker: Trainer, defender: Trainer) -> BattleMove:
-        move_meta: dict = data.get_move_meta(move["id"])
-        if move["damage_class_id"] == 1 or move["power"] is None:
-            success = True
-            damage = 0
-            hits = 0
-            critical_hit = 1
-        else:
-            accu: int = move["accuracy"] if move["accuracy"] is not None else 100
-            success: int = random.randrange(99) <= accu
-
-            hits: int = random.randint(
-                move_meta.__getitem__("min_hits") or 1,
-                move_meta.__getitem__("max_hits") or 1,
-            )
-
-            # if move["power"] is None:
-            #     move = data.move_by_id(33)
-
-            if move["type_id"] in list(attacker.selected_pokemon.specie["types"]):
-                stab = 1.5
-            else:
-                stab = 1
-
-            target = 0.75 if move["target_id"] in [5, 9, 10, 11, 13, 14] else 1
-            critical_hit = 2 if random.randint(1, 150) == 1 else 1
-            rand = random.choice([0.1, 1, 0.75])
-
-            if move["damage_class_id"] == 2:
-                atk = (
-                    attacker.selected_pokemon.specie["base_stats"][1]
-                    * constants.STAT_STAGE_MULTIPLIERS[attacker.selected_pokemon.stages.atk]
-                )
-                defn = (
-                    defender.selected_pokemon.specie["base_stats"][2]
-                    * constants.STAT_STAGE_MULTIPLIERS[attacker.selected_pokemon.stages.defn]
-                )
-
-            else:
-                atk = (
-                    attacker.selected_pokemon.specie["base_stats"][3]
-                    * constants.STAT_STAGE_MULTIPLIERS[attacker.selected_pokemon.stages.satk]
-                )
-                defn = (
-                    defender.selected_pokemon.specie["base_stats"][4]
-                    * constants.STAT_STAGE_MULTIPLIERS[attacker.selected_pokemon.stages.sdef]
-                )
-
-            damage = int((2 * attacker.selected_pokemon.level / 5 + 2) * move["power"] * atk / defn) / 50 + 2
-
-            # damage *= stab * target * critical_hit * rand * typ_mult
-
-        # return BattleMove(int(damage), effectiveness, critical_hit == 2)
-
-        messages: List[str] = []
-
-        typ_mult = 1
-        for typ in defender.selected_pokemon.specie["types"]:
-            typ_mult *= constants.TYPE_EFFICACY[move["type_id"]][typ]
-
-        if not success:
-            effectiveness = MoveEffect.missed
-            messages.append("It missed!")
-            typ_mult = 0
-
-        elif typ_mult == 0:
-            effectiveness = MoveEffect.not_effective
-            messages.append("It had no effect!")
-
-        elif typ_mult < 1:
-            messages.append("It was not very effective...")
-            effectiveness = MoveEffect.not_effective
-
-        elif typ_mult == 1:
-            effectiveness = MoveEffect.normal
-
-        else:
-            messages.append("It was super effective!")
-            effectiveness = MoveEffect.super_effective
-
-        if hits > 1:
-            messages.append(f"It hit {hits} times!")
-
-        healing = damage * move_meta["drain"] / 100
-        healing += attacker.selected_pokemon.max_hp * move_meta["healing"] / 100
-
-        for ailment in attacker.ailments:
-            if ailment == "Paralysis":
-                if random.random() < 0.25:
-                    success = False
-            elif ailment == "Sleep":
-                if move["id"] not in (173, 214):
-                    success = False
-            elif ailment == "Freeze":
-                if move["id"] not in (588, 172, 221, 293, 503, 592):
-                    success = False
-            elif ailment == "Burn":
-                if move["damage_class_id"] == 2:
-                    damage /= 2
-
-            ## TODO: Add more ailments
-
-        changes: list = []
-
-        if random.randrange(100) < move_meta["stat_chance"]:
-            changes.append(StatChange(move_meta["change_stat_id"], move_meta["stat_change"]))
-
-        ailment = (
-            constants.MOVE_AILMENTS[move_meta["meta_ailment_id"]]
-            if random.randrange(100) < move_meta["ailment_chance"]
-            else None
-        )
-
-        return BattleMove(
-            success,
-            round(damage),
-            round(healing),
-            ailment,
-            effectiveness,
-            messages,
-            changes,
-            critical_hit,
-        )
-
     async def send_battle(self):
-        img_bytes: bytes = await self.bot.loop.run_in_executor(
-            None,
-            self.make_battle_image,
-            self.trainers[0].selected_pokemon.normal_image,
-            self.trainers[1].selected_pokemon.normal_image,
-        )
+        img_bytes: Optional[BytesIO] = None
 
         resp: Optional[aiohttp.ClientResponse] = None
 
@@ -598,31 +383,6 @@ class Battle:
                     #     f"{self.bot.config.IMAGE_SERVER_URL}duelhp/{self.trainers[0].selected_pokemon.species_id}/{self.trainers[1].selected_pokemon.species_id}/{pk1shinyint}/{pk2shinyint}/{pk1hpapi}/{pk2hpapi}/{self.trainers[0].selected_pokemon.level}/{self.trainers[1].selected_pokemon.level}/{self.trainers[0].selected_pokemon}/{self.trainers[1].selected_pokemon}/water"
                     # )
 
-                elif 8 <= self.category.value <= 12:
-                    pk1hpapi: int = round(
-                        (self.trainers[0].selected_pokemon.hp / self.trainers[0].selected_pokemon.max_hp) * 109
-                    )
-                    pk2hpapi: int = round(
-                        (self.trainers[1].selected_pokemon.hp / self.trainers[1].selected_pokemon.max_hp) * 109
-                    )
-
-                    resp = requests.get(
-                        f"{self.bot.config.IMAGE_SERVER_URL}dueljourney/{self.trainers[0].selected_pokemon.species_id}/{self.trainers[1].selected_pokemon.species_id}/{pk1shinyint}/{pk2shinyint}/{pk1hpapi}/{pk2hpapi}/{self.trainers[0].selected_pokemon.level}/{self.trainers[1].selected_pokemon.level}/{self.trainers[0].selected_pokemon}/{self.trainers[1].selected_pokemon}/{_journey_urls[self.category]}"
-                    )
-
-                else:
-                    async with self.bot.session.get(
-                        f"{self.bot.config.IMAGE_SERVER_URL}duelrl/{self.trainers[0].selected_pokemon.species_id}/{self.trainers[1].selected_pokemon.species_id}/{pk1shinyint}/{pk2shinyint}/{pk1hpapi}/{pk2hpapi}/{self.trainers[0].selected_pokemon.level}/{self.trainers[1].selected_pokemon.level}/{self.trainers[0].selected_pokemon}/{self.trainers[1].selected_pokemon}"
-                    ) as __resp:
-                        resp = __resp
-
-                        if resp is not None and resp.status == 200:
-                            img_bytes = await self.bot.loop.run_in_executor(None, write_fp, await resp.read())
-
-                    # resp = requests.get(
-                    #     f"{self.bot.config.IMAGE_SERVER_URL}duelrl/{self.trainers[0].selected_pokemon.species_id}/{self.trainers[1].selected_pokemon.species_id}/{pk1shinyint}/{pk2shinyint}/{pk1hpapi}/{pk2hpapi}/{self.trainers[0].selected_pokemon.level}/{self.trainers[1].selected_pokemon.level}/{self.trainers[0].selected_pokemon}/{self.trainers[1].selected_pokemon}"
-                    # )
-
             if self.reward in [Reward.Raids, Reward.Gym] or self.category == BattleCategory.Gym:
                 pk1hpapi: int = round(
                     (self.trainers[0].selected_pokemon.hp / self.trainers[0].selected_pokemon.max_hp) * 109
@@ -658,7 +418,17 @@ class Battle:
             else:
                 _nm = self.trainers[1].__str__()
 
-            _file: discord.File = discord.File(img_bytes, "duel.png")
+            # Journey battles show animated sprites instead, other images the image server didn't draw are composed here.
+            _filename: str = "duel.png"
+            if img_bytes is None and not 8 <= self.category.value <= 12:
+                img_bytes = await self.bot.battle_scenes.render(
+                    self.trainers[0].selected_pokemon,
+                    self.trainers[1].selected_pokemon,
+                    status=(self.trainers[0].ailments, self.trainers[1].ailments),
+                )
+                _filename = self.bot.battle_scenes.filename
+
+            _file: Optional[discord.File] = discord.File(img_bytes, _filename) if img_bytes is not None else None
             embed: discord.Embed = self.bot.Embed(title=f"Battle between {self.trainers[0]} and {_nm}!")
 
             embed.add_field(
@@ -667,7 +437,7 @@ class Battle:
                 inline=True,
             )
 
-            embed.set_image(url="attachment://duel.png")
+            embed.set_image(url=f"attachment://{_filename}")
 
             # Refers to journey's battle
             if 8 <= self.category.value <= 12:
@@ -750,31 +520,21 @@ class Battle:
 
         self.used.add(trainer_id)
         if self.battle_type == BattleType.oneVone:
-            for trainer in self.trainers:
-                if "Burn" in trainer.ailments:
-                    trainer.selected_pokemon.hp -= 1 / 16 * trainer.selected_pokemon.max_hp
-                if "Poison" in trainer.ailments:
-                    trainer.selected_pokemon.hp -= 1 / 8 * trainer.selected_pokemon.max_hp
-
             t: Trainer = self._get_trainer_by_id(trainer_id)
             o: Trainer = self._get_another_trainer(trainer_id)
 
             tpk, opk = t.selected_pokemon, o.selected_pokemon
 
-            bm: BattleMove = self.calculate_damage(move, t, o)
-            text: str = "\n".join([f"{move['name']} dealt {bm.damage} damage!"] + bm.messages)
+            state: BattleState = BattleState(
+                (Combatant.from_pokemon(tpk, t.ailments), Combatant.from_pokemon(opk, o.ailments)), rng=self.rng
+            )
+            result: MoveResult = state.use_move(0, move)
+            tpk.hp, opk.hp = state.sides[0].hp, state.sides[1].hp
 
-            # opk.hp -= bm.damage
+            bm: BattleMove = result.move
+            text: str = "\n".join([f"{move['name']} dealt {bm.damage} damage!"] + bm.messages)
 
             if bm.success:
-                opk.hp -= bm.damage
-                tpk.hp += bm.healing
-
-                tpk.hp = int(round(tpk.hp))
-                opk.hp = int(round(opk.hp))
-
-                tpk.hp = min(tpk.hp, tpk.max_hp)
-
                 if bm.healing > 0:
                     text += f"\n{tpk} restored {bm.healing} HP."
                 elif bm.healing < 0:
@@ -782,34 +542,17 @@ class Battle:
 
                 if bm.ailment:
                     text += f"\nIt imposed {bm.ailment}!"
-                    o.ailments.add(bm.ailment)
 
+                target: models.Pokemon = tpk if result.target == 0 else opk
                 for change in bm.stat_changes:
-                    if move["target_id"] == 7:
-                        target = tpk
-                        if change.change < 0:
-                            text += f"\n{target}'s {constants.STAT_NAMES[change.stat]} decreased by {-change.change}!"
-                        else:
-                            text += f"\n{target}'s {constants.STAT_NAMES[change.stat]} increased by {change.change}!"
-
+                    if change.change < 0:
+                        text += f"\n{target}'s {constants.STAT_NAMES[change.stat]} decreased by {-change.change}!"
                     else:
-                        target = opk
-                        if change.change < 0:
-                            text += f"\n{target}'s {constants.STAT_NAMES[change.stat]} decreased by {-change.change}!"
-                        else:
-                            text += f"\n{target}'s {constants.STAT_NAMES[change.stat]} increased by {change.change}!"
-
-                    setattr(
-                        target.stages,
-                        change.stat,
-                        getattr(target.stages, change.stat) + change.change,
-                    )
+                        text += f"\n{target}'s {constants.STAT_NAMES[change.stat]} increased by {change.change}!"
 
             else:
                 text = "It missed!"
 
-            opk.hp = max(opk.hp, 0)
-
             if opk.owner_id == self.bot.user.id:
                 r: Optional[models.Raids] = await models.Raids.filter(pkmodel=opk.id).first()
                 if r is not None:
@@ -1027,10 +770,7 @@ class Battle:
                 elif self.reward == Reward.Pokemon:
                     if t.is_bot is False:
                         opk.owner_id = t.user.id
-                        _idx: int = await self.bot.manager.get_next_idx(t.user.id)
-
-                        opk.idx = _idx
-                        await self.bot.manager.update_idx(t.user.id)
+                        opk.idx = (await self.bot.manager.reserve_idx(t.user.id))[0]
                         await opk.save()
 
                         self.move_emb.add_field(
@@ -7,6 +7,7 @@ import typing
 
 if typing.TYPE_CHECKING:
     from core.bot import PokeBest
+    from core.catch import CatchContext
 
 import models
 
@@ -16,11 +17,8 @@ class Leaderboard(commands.Cog):
         self.bot: PokeBest = bot
 
     @commands.Cog.listener()
-    async def on_catch(self, ctx: commands.Context, pokemon: models.Pokemon):
-        mem: models.Member = await self.bot.manager.fetch_member_info(ctx.author.id)
-
-        mem.monthly_catches += 1
-        await mem.save()
+    async def on_catch(self, catch: CatchContext):
+        catch.increment(monthly_catches=1)
 
     @commands.command(aliases=("lb",))
     async def leaderboard(self, ctx: commands.Context):
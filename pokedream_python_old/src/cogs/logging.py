@@ -4,6 +4,7 @@ from discord.colour import Color
 from discord.ext import commands
 from discord.ext.commands import flags
 from core.bot import PokeBest
+from core.catch import CatchContext
 import random
 from typing import List
 import config
@@ -271,7 +272,8 @@ class Logging(commands.Cog):
         await start_log_webhook.send(embed=emb)
 
     @commands.Cog.listener()
-    async def on_catch(self, ctx: commands.Context, pokemon: models.Pokemon):
+    async def on_catch(self, catch: CatchContext):
+        ctx, pokemon = catch.ctx, catch.pokemon
         if not pokemon.shiny:
             return
         shiny_hook: discord.Webhook = discord.Webhook.from_url(
@@ -86,7 +86,7 @@ class Market(commands.Cog):
                 mention_author=False,
             )
 
-        await pokemon.save()
+        await self.bot.manager.update_pokemon(pokemon.id, owner_id=None)
         await market_res.save()
 
         try:
@@ -344,17 +344,20 @@ class Market(commands.Cog):
                             mention_author=False,
                         )
 
-                    pokemon.owner_id = ctx.author.id
-                    pokemon.idx = member.next_idx
+                    _result = await self.bot.manager.update_economy(ctx.author.id, balance=-market.price, next_idx=1)
+                    if _result is None:
+                        return await ctx.reply(
+                            "You don't have enough balance to buy this pokemon!",
+                            mention_author=False,
+                        )
 
-                    member.balance -= market.price
-                    member.next_idx += 1
+                    pokemon.owner_id = ctx.author.id
+                    pokemon.idx = _result["next_idx"] - 1
 
                     await pokemon.save()
-                    await member.save()
 
                     market_owner: models.Member = await self.bot.manager.fetch_member_info(market.user_id)
-                    await self.bot.manager.update_member(market_owner.id, balance=market_owner.balance + market.price)
+                    await self.bot.manager.increase_credits(market.user_id, market.price)
 
                     with suppress(discord.Forbidden):
                         owner: discord.User = self.bot.get_user(market_owner.id) or await self.bot.fetch_user(
@@ -697,7 +700,7 @@ class Market(commands.Cog):
                 mention_author=False,
             )
 
-        await pokemon.save()
+        await self.bot.manager.update_pokemon(pokemon.id, owner_id=None)
         await market_res.save()
 
         try:
@@ -927,19 +930,20 @@ class Market(commands.Cog):
                     mention_author=False,
                 )
 
+            _result = await self.bot.manager.update_economy(ctx.author.id, balance=-market.price, next_idx=1)
+            if _result is None:
+                return await ctx.reply(
+                    "You don't have enough balance to buy this pokemon!",
+                    mention_author=False,
+                )
+
             pokemon.owner_id = ctx.author.id
-            pokemon.idx = member.next_idx
-        
-            buyer: models.Member = await self.bot.manager.fetch_member_info(ctx.author.id)
-            buyer.balance -= market.price
-            buyer.next_idx += 1
-            await buyer.save()
+            pokemon.idx = _result["next_idx"] - 1
 
             await pokemon.save()
 
             market_owner: models.Member = await self.bot.manager.fetch_member_info(market.user_id)
-            market_owner.balance += market.price
-            await market_owner.save()
+            await self.bot.manager.increase_credits(market.user_id, market.price)
 
             with suppress(discord.Forbidden):
                 owner: discord.User = self.bot.get_user(market_owner.id) or await self.bot.fetch_user(market.user_id)
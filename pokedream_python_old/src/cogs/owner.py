@@ -1,5 +1,7 @@
 from __future__ import annotations
 from contextlib import suppress
+from functools import partial
+from io import BytesIO, StringIO
 
 from discord.ext import commands
 import discord
@@ -14,10 +16,15 @@ from config import OWNERS
 import models
 from models.helpers import ArrayAppend, ArrayRemove
 from core.views import Confirm
+from cogs.helpers import battle_sim
 from data import data
 from utils.converters import TrainerConverter
 
 
+# Battles a `simulate` command may run, on a pool of `SIMULATION_WORKERS` processes of its own
+MAX_SIMULATED_BATTLES: int = 200_000
+
+
 class Owner(commands.Cog):
     def __init__(self, bot: PokeBest) -> None:
         self.bot: PokeBest = bot
@@ -318,6 +325,54 @@ class Owner(commands.Cog):
                 allowed_mentions=None,
             )
 
+    @commands.command()
+    async def simulate(self, ctx: commands.Context, battles: int, *, matchup: str):
+        """Simulate battles between pokemon, e.g. `simulate 1000 pikachu@50, eevee vs mewtwo@2500`"""
+        left, _, right = matchup.partition(" vs ")
+        if not right:
+            return await ctx.reply("Separate both sides with `vs`!", mention_author=False)
+
+        try:
+            _left: typing.List[battle_sim.Entrant] = [battle_sim.entrant(s) for s in left.split(",")]
+            _right: typing.List[battle_sim.Entrant] = [battle_sim.entrant(s) for s in right.split(",")]
+        except ValueError as e:
+            return await ctx.reply(f"{e}!", mention_author=False)
+
+        if battles < 1 or battles * len(_left) * len(_right) > MAX_SIMULATED_BATTLES:
+            return await ctx.reply(
+                f"You can simulate up to {MAX_SIMULATED_BATTLES:,} battles at once, "
+                "use `python -m cogs.helpers.battle_sim` for more.",
+                mention_author=False,
+            )
+
+        # The executor thread only waits on the worker processes, the battles don't run under the bot's GIL
+        with ctx.typing():
+            report: battle_sim.SimulationReport = await self.bot.loop.run_in_executor(
+                None,
+                partial(
+                    battle_sim.simulate_in_processes,
+                    _left,
+                    _right,
+                    battles=battles,
+                    workers=getattr(self.bot.config, "SIMULATION_WORKERS", 2),
+                ),
+            )
+
+        out: StringIO = StringIO()
+        report.write_csv(out)
+
+        embed: discord.Embed = self.bot.Embed(
+            title=f"Win rates over {battles:,} battles",
+            description=f"```\n{report.matrix()[:4000]}\n```",
+        ).set_footer(
+            text=f"{report.moves:,} moves in {report.elapsed:.2f}s, seed {report.seed}",
+        )
+        return await ctx.reply(
+            embed=embed,
+            file=discord.File(BytesIO(out.getvalue().encode()), filename="simulation.csv"),
+            mention_author=False,
+        )
+
     # @commands.command()
     # async def
     # TODO: Maintenance, command locking
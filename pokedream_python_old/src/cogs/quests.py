@@ -14,6 +14,7 @@ from utils.constants import TYPES
 
 if typing.TYPE_CHECKING:
     from core.bot import PokeBest
+    from core.catch import CatchContext
 
 from utils.emojis import emojis
 from tortoise.exceptions import ConfigurationError
@@ -258,7 +259,8 @@ class Quests(commands.Cog):
         # await ctx.reply(embed=emb, mention_author=False)
         await paginator.paginate(ctx)
 
-    async def update_quest_progress(self, mem: models.Member, _quest):
+    async def update_quest_progress(self, catch: CatchContext, _quest):
+        mem: models.Member = catch.member
         _qidx: int = 0
         for idx, q in enumerate(mem.daily_quests):
             if type(_quest) == str:
@@ -287,16 +289,17 @@ class Quests(commands.Cog):
 
         if _quest["quest_progress"] >= QUESTS[_quest["quest_id"] - 1]["number"]:
             if QUESTS[_quest["quest_id"] - 1]["event"] == "on_catch":
-                self.bot.dispatch("catch_quest_done", mem, _quest)
+                await self.complete_catch_quest(catch, _quest)
 
             elif QUESTS[_quest["quest_id"] - 1]["event"] == "on_vote":
                 ...
 
-        await mem.save()
+        catch.touch("daily_quests")
 
     @commands.Cog.listener()
-    async def on_catch(self, ctx: commands.Context, pokemon: models.Pokemon):
-        mem: models.Member = await self.bot.manager.fetch_member_info(ctx.author.id)
+    async def on_catch(self, catch: CatchContext):
+        mem: models.Member = catch.member
+        pokemon: models.Pokemon = catch.pokemon
 
         for _quest in mem.daily_quests:
             __quest_mem_copy = _quest
@@ -304,35 +307,33 @@ class Quests(commands.Cog):
             if __quest_data["event"] == "on_catch":
                 if _quest.get("species_id", None) is not None and pokemon.species_id == _quest["species_id"]:
                     species: dict = data.species_by_num(_quest["species_id"])
-                    await self.update_quest_progress(mem, __quest_mem_copy)
+                    await self.update_quest_progress(catch, __quest_mem_copy)
 
                 if __quest_data.get("species_id", None) is not None and __quest_data["species_id"] == pokemon.species_id:
-                    await self.update_quest_progress(mem, __quest_mem_copy)
+                    await self.update_quest_progress(catch, __quest_mem_copy)
 
                 if __quest_data.get("type", None) is not None:
                     species: dict = data.species_by_num(pokemon.species_id)
                     type_id: int = TYPES.index(__quest_data["type"].title())
                     if type_id in species["types"]:
-                        await self.update_quest_progress(mem, __quest_mem_copy)
+                        await self.update_quest_progress(catch, __quest_mem_copy)
 
                 if _quest.get("species_id", None) is None and __quest_data.get("type") is None:
-                    await self.update_quest_progress(mem, _quest)
+                    await self.update_quest_progress(catch, _quest)
 
-    @commands.Cog.listener()
-    async def on_catch_quest_done(self, mem: models.Member, quest: dict):
+    async def complete_catch_quest(self, catch: CatchContext, quest: dict):
+        """Rewards a finished catch quest through the catch, which saves the member afterwards."""
         if quest["quest_done"]:
             return
 
-        _daily_quest_array = mem.daily_quests
+        mem: models.Member = catch.member
+        _daily_quest_array: list = [json.loads(q) if type(q) == str else q for q in mem.daily_quests]
         qidx: int = 0
         for idx, q in enumerate(_daily_quest_array):
-            if json.loads(q)["quest_id"] == quest["quest_id"]:
+            if q["quest_id"] == quest["quest_id"]:
                 qidx = idx
                 break
 
-        _daily_quest_array[qidx] = None
-
-        mem: models.Member = await self.bot.manager.fetch_member_info(mem.id)
         quest["quest_done"] = True
 
         __quest_data: dict = QUESTS[quest["quest_id"] - 1]
@@ -341,10 +342,10 @@ class Quests(commands.Cog):
             quest["quest_progress"] = __quest_data["number"]
 
         if __quest_data.get("shards", None) is not None:
-            mem.shards += __quest_data["shards"]
+            catch.increment(shards=__quest_data["shards"])
 
         if __quest_data.get("credits", None) is not None:
-            mem.balance += __quest_data["credits"]
+            catch.increment(balance=__quest_data["credits"])
 
         user: discord.User = self.bot.get_user(mem.id) or await self.bot.fetch_user(mem.id)
 
@@ -364,8 +365,7 @@ class Quests(commands.Cog):
         _daily_quest_array = list(map(json.dumps, _daily_quest_array))
 
         mem.daily_quests = _daily_quest_array
-
-        await mem.save()
+        catch.touch("daily_quests")
 
     async def _reset_or_give_daily_quests(self):
         with suppress(ConfigurationError):
@@ -13,6 +13,7 @@ from utils.methods import clear_empty_fields
 
 if typing.TYPE_CHECKING:
     from core.bot import PokeBest
+    from core.catch import CatchContext
 
 from utils.emojis import emojis
 from utils.constants import TYPES, BattleEngine
@@ -133,8 +134,9 @@ class ResearchTasks(commands.Cog):
 
         return txt
 
-    async def insert_or_update_task(self, mem_id: int, quest):
-        mem: models.Member = await self.bot.manager.fetch_member_info(mem_id)
+    async def insert_or_update_task(self, mem_id: int, quest, *, catch: typing.Optional[CatchContext] = None):
+        """Progresses a research task, left for the catch to save when one is given."""
+        mem: models.Member = catch.member if catch else await self.bot.manager.fetch_member_info(mem_id)
         task, idx = await self.get_quest(quest["idx"], mem)
 
         if quest.get("number") is not None and quest.get("number") <= task.get("progress", 1):
@@ -161,9 +163,26 @@ class ResearchTasks(commands.Cog):
             task["done"] = True
             mem.quests = ArrayAppend("quests", json.dumps(task))
 
-            self.bot.dispatch("task_finish", task, mem, quest)
+            if catch:
+                self.reward_catch_task(catch, quest)
+            else:
+                self.bot.dispatch("task_finish", task, mem, quest)
 
-        await mem.save()
+        if catch:
+            catch.touch("quests")
+        else:
+            await mem.save()
+
+    def reward_catch_task(self, catch: CatchContext, quest):
+        """Rewards a finished task through the catch, which saves the member afterwards."""
+        if quest.get("credits") is not None:
+            catch.increment(balance=quest["credits"])
+
+        if quest.get("redeems") is not None:
+            catch.increment(redeems=quest["redeems"])
+
+        if quest.get("gift") is not None:
+            catch.increment(gift=quest["gift"])
 
     @commands.command(aliases=("rs",))
     @has_started()
@@ -212,7 +231,8 @@ class ResearchTasks(commands.Cog):
         await _view.paginate()
 
     @commands.Cog.listener()
-    async def on_catch(self, ctx: commands.Context, pokemon: models.Pokemon):
+    async def on_catch(self, catch: CatchContext):
+        pokemon: models.Pokemon = catch.pokemon
         pokemon_types: list = [TYPES[type_id].lower() for type_id in pokemon.specie["types"]]
         pokemon_rarity = "normal"
 
@@ -231,7 +251,7 @@ class ResearchTasks(commands.Cog):
         if quest is None:
             return
 
-        await self.insert_or_update_task(ctx.author.id, quest)
+        await self.insert_or_update_task(catch.ctx.author.id, quest, catch=catch)
 
     @commands.Cog.listener()
     async def on_levelup(self, message: discord.Message, pokemon: models.Pokemon):
@@ -48,6 +48,7 @@ class Settings(commands.Cog):
             _guild: models.Guild = await models.Guild.get(id=ctx.guild.id)
 
             self.bot.cache.guilds[f"{ctx.guild.id}"] = _guild
+            await self.bot.prefixes.set_prefix(ctx.guild.id, args)
 
         return await msg.edit(
             f"Successfully changed the server's prefix to `{args}`!",
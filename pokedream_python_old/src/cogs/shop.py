@@ -179,7 +179,9 @@ class Shop(commands.Cog):
             if pokemon.level + amount > 100:
                 return await ctx.reply("Your pokemon can't cross level 100!", mention_author=False)
 
-            member.balance -= price
+            if await self.bot.manager.update_economy(ctx.author.id, balance=-price) is None:
+                return await not_enough_balance(ctx)
+
             pokemon.level += amount
 
             embed: discord.Embed = self.bot.Embed(title="⬆️ Level up!")
@@ -198,8 +200,6 @@ class Shop(commands.Cog):
 
                 pokemon.species_id = specie["species_id"]
 
-            await member.save()
-
             await pokemon.save()
 
             return await ctx.reply(embed=embed, mention_author=False)
@@ -224,10 +224,10 @@ class Shop(commands.Cog):
             if member.balance < 50:
                 return not_enough_balance(ctx)
 
-            member.balance -= 50
-            pokemon.nature = nature
+            if await self.bot.manager.update_economy(ctx.author.id, balance=-50) is None:
+                return await not_enough_balance(ctx)
 
-            await member.save()
+            pokemon.nature = nature
             await pokemon.save()
 
             return await ctx.reply(
@@ -268,10 +268,10 @@ class Shop(commands.Cog):
             if member.balance < int(item["cost"]):
                 return await not_enough_balance(ctx)
 
-            member.balance -= int(item["cost"])
-            pokemon.mega_items = ArrayAppend("mega_items", item.__getitem__("id"))
+            if await self.bot.manager.update_economy(ctx.author.id, balance=-int(item["cost"])) is None:
+                return await not_enough_balance(ctx)
 
-            await member.save()
+            pokemon.mega_items = ArrayAppend("mega_items", item.__getitem__("id"))
             await pokemon.save()
 
             return await ctx.reply(
@@ -296,8 +296,10 @@ class Shop(commands.Cog):
             if pokemon is None:
                 raise NoSelectedPokemon(ctx)
 
+            if await self.bot.manager.update_economy(ctx.author.id, balance=-item["cost"]) is None:
+                return await not_enough_balance(ctx)
+
             await self.bot.manager.update_pokemon(pokemon.id, held_item=item["id"])
-            await self.bot.manager.update_member(ctx.author.id, balance=member.balance - item["cost"])
 
             return await ctx.reply(
                 f"You bought a `{item['name']}` for your {pokemon:l} to hold!",
@@ -345,10 +347,10 @@ class Shop(commands.Cog):
                 return await not_enough_balance(ctx)
 
             evo_species: dict = data.species_by_num(evoto)
-            member.balance -= item.__getitem__("cost")
-            pokemon.species_id = evo_species.__getitem__("species_id")
+            if await self.bot.manager.update_economy(ctx.author.id, balance=-item.__getitem__("cost")) is None:
+                return await not_enough_balance(ctx)
 
-            await member.save()
+            pokemon.species_id = evo_species.__getitem__("species_id")
             await pokemon.save()
 
             return await ctx.reply(
@@ -391,7 +393,9 @@ class Shop(commands.Cog):
                 if member.balance < cost:
                     return await not_enough_balance(ctx)
 
-                await self.bot.manager.update_member(ctx.author.id, balance=member.balance - cost)
+                if await self.bot.manager.update_economy(ctx.author.id, balance=-cost) is None:
+                    return await not_enough_balance(ctx)
+
                 await self.bot.manager.update_pokemon(pokemon.id, species_id=species["species_id"])
 
                 return await ctx.reply(
@@ -413,11 +417,10 @@ class Shop(commands.Cog):
             if member.shards < item["cost"]:
                 return await not_enough_balance(ctx)
 
-            await self.bot.manager.update_member(
-                ctx.author.id,
-                shiny_charm=datetime.utcnow() + timedelta(days=7),
-                shards=member.shards - item["cost"],
-            )
+            if await self.bot.manager.update_economy(ctx.author.id, shards=-item["cost"]) is None:
+                return await not_enough_balance(ctx)
+
+            await self.bot.manager.update_member(ctx.author.id, shiny_charm=datetime.utcnow() + timedelta(days=7))
 
             return await ctx.reply(
                 "Your shiny chance has been increased by **20%** for **1 week**!",
@@ -437,9 +440,10 @@ class Shop(commands.Cog):
             if member.shards < item["cost"]:
                 return await not_enough_balance(ctx)
 
-            await self.bot.manager.update_guild(ctx.guild.id, spawn_boost=datetime.utcnow() + timedelta(hours=24))
+            if await self.bot.manager.update_economy(ctx.author.id, shards=-item["cost"]) is None:
+                return await not_enough_balance(ctx)
 
-            await self.bot.manager.update_member(ctx.author.id, shards=member.shards - item["cost"])
+            await self.bot.manager.update_guild(ctx.guild.id, spawn_boost=datetime.utcnow() + timedelta(hours=24))
 
             return await ctx.reply(
                 "Spawns are now boosted from next **24 hours**!",
@@ -461,11 +465,11 @@ class Shop(commands.Cog):
             if member.shards < item["cost"] * amount:
                 return await not_enough_balance(ctx)
 
-            await self.bot.manager.update_member(
-                ctx.author.id,
-                shards=member.shards - (item["cost"] * amount),
-                redeems=member.redeems + amount,
-            )
+            if (
+                await self.bot.manager.update_economy(ctx.author.id, shards=-(item["cost"] * amount), redeems=amount)
+                is None
+            ):
+                return await not_enough_balance(ctx)
 
             return await ctx.reply(f"Successfully purchased {amount} redeem(s)!", mention_author=False)
 
@@ -489,9 +493,11 @@ class Shop(commands.Cog):
             if member.balance < int(machine["cost"]):
                 return await not_enough_balance(ctx)
 
+            if await self.bot.manager.update_economy(ctx.author.id, balance=-int(machine["cost"])) is None:
+                return await not_enough_balance(ctx)
+
             await self.bot.manager.update_member(
                 ctx.author.id,
-                balance=member.balance - int(machine["cost"]),
                 technical_machines=ArrayAppend(int(machine.__getitem__("machine_number"))),
             )
 
@@ -502,9 +508,8 @@ class Shop(commands.Cog):
             if member.shards < 50:
                 return await not_enough_balance(ctx)
 
-            member.shards -= 50
-            member.gift += 1
-            await member.save()
+            if await self.bot.manager.update_economy(ctx.author.id, shards=-50, gift=1) is None:
+                return await not_enough_balance(ctx)
 
             return await ctx.reply(f"Successfully purchased a gift {emojis.gift}!", mention_author=False)
 
@@ -512,8 +517,9 @@ class Shop(commands.Cog):
             if member.shards < 500:
                 return await not_enough_balance(ctx)
 
-            member.redeems += 1
-            member.gift += 2
+            _result = await self.bot.manager.update_economy(ctx.author.id, shards=-500, redeems=1, gift=2, next_idx=1)
+            if _result is None:
+                return await not_enough_balance(ctx)
 
             pk: models.Pokemon = models.Pokemon.get_random(
                 species_id=10394,
@@ -522,14 +528,9 @@ class Shop(commands.Cog):
                 timestamp=datetime.utcnow(),
                 owner_id=ctx.author.id,
                 shiny=False,
-                idx=member.next_idx,
+                idx=_result["next_idx"] - 1,
             )
 
-            member.next_idx += 1
-            member.shards -= 500
-
-            await member.save()
-
             await pk.save()
 
             return await ctx.reply(
@@ -541,6 +542,10 @@ class Shop(commands.Cog):
             if member.shards < 10000:
                 return await not_enough_balance(ctx)
 
+            _result = await self.bot.manager.update_economy(ctx.author.id, shards=-10000, next_idx=1)
+            if _result is None:
+                return await not_enough_balance(ctx)
+
             pk: models.Pokemon = models.Pokemon.get_random(
                 species_id=10393,
                 level=random.randint(10, 40),
@@ -548,14 +553,9 @@ class Shop(commands.Cog):
                 timestamp=datetime.utcnow(),
                 owner_id=ctx.author.id,
                 shiny=True,
-                idx=member.next_idx,
+                idx=_result["next_idx"] - 1,
             )
 
-            member.next_idx += 1
-            member.shards -= 10000
-
-            await member.save()
-
             await pk.save()
 
             return await ctx.reply(f"You received a *{pk:l}*! 🎅 Merry Christmas!", mention_author=False)
@@ -564,6 +564,10 @@ class Shop(commands.Cog):
             if member.shards < 5000:
                 return await not_enough_balance(ctx)
 
+            _result = await self.bot.manager.update_economy(ctx.author.id, shards=-5000, next_idx=1)
+            if _result is None:
+                return await not_enough_balance(ctx)
+
             pk: models.Pokemon = models.Pokemon.get_random(
                 species_id=10397,
                 level=random.randint(10, 40),
@@ -571,14 +575,9 @@ class Shop(commands.Cog):
                 timestamp=datetime.utcnow(),
                 owner_id=ctx.author.id,
                 shiny=True,
-                idx=member.next_idx,
+                idx=_result["next_idx"] - 1,
             )
 
-            member.next_idx += 1
-            member.shards -= 5000
-
-            await member.save()
-
             await pk.save()
 
             return await ctx.reply(
@@ -590,6 +589,10 @@ class Shop(commands.Cog):
             if member.shards < 10000:
                 return await not_enough_balance(ctx)
             
+            _result = await self.bot.manager.update_economy(ctx.author.id, shards=-10000, next_idx=1)
+            if _result is None:
+                return await not_enough_balance(ctx)
+
             pk: models.Pokemon = models.Pokemon.get_random(
                 species_id=10159,
                 level=random.randint(10, 40),
@@ -597,14 +600,9 @@ class Shop(commands.Cog):
                 timestamp=datetime.utcnow(),
                 owner_id=ctx.author.id,
                 shiny=True,
-                idx=member.next_idx,
+                idx=_result["next_idx"] - 1,
             )
 
-            member.next_idx += 1
-            member.shards -= 10000
-
-            await member.save()
-
             await pk.save()
 
             return await ctx.reply(f"You received a *{pk:l}*!", mention_author=False)
@@ -616,11 +614,11 @@ class Shop(commands.Cog):
             if await self.bot.redis.hexists("db:incense", ctx.author.id):
                 return await ctx.reply("You already have an active incense!", mention_author=False)
 
-            await self.bot.redis.hset("db:incense", ctx.author.id, 100)
-            self.bot.cache.incense_timestamps[f"{ctx.author.id}"] = datetime.utcnow()
+            if await self.bot.manager.update_economy(ctx.author.id, shards=-25) is None:
+                return await not_enough_balance(ctx)
 
-            member.shards -= 25
-            await member.save()
+            await self.bot.incense.add(ctx.author.id, 100)
+            self.bot.cache.incense_timestamps[f"{ctx.author.id}"] = datetime.utcnow()
 
             return await ctx.reply("You bought an incense!", mention_author=False)
 
@@ -690,7 +688,9 @@ class Shop(commands.Cog):
                     mention_author=False,
                 )
 
-            _next_idx: int = await self.bot.manager.get_next_idx(ctx.author.id)
+            _result = await self.bot.manager.update_economy(ctx.author.id, redeems=-1, next_idx=1)
+            if _result is None:
+                return await ctx.reply("You don't have redeems!", mention_author=False)
 
             pokemon_res: models.Pokemon = models.Pokemon.get_random(
                 species_id=species.__getitem__("species_id"),
@@ -698,14 +698,10 @@ class Shop(commands.Cog):
                 level=random.randint(5, 40),
                 xp=0,
                 timestamp=datetime.now(),
-                idx=_next_idx,
+                idx=_result["next_idx"] - 1,
             )
 
             await pokemon_res.save()
-            await self.bot.manager.update_idx(ctx.author.id)
-
-            member.redeems -= 1
-            await member.save()
 
             return await ctx.reply(f"You redeemed a `{pokemon_res:l}`!", mention_author=False)
 
@@ -726,10 +722,10 @@ class Shop(commands.Cog):
                     mention_author=False,
                 )
 
-            self.bot.spawn_cache[ctx.channel.id]["species_id"] = pokemon.__getitem__("species_id")
+            if await self.bot.manager.update_economy(ctx.author.id, redeems=-1) is None:
+                return await ctx.reply("You don't have redeems!", mention_author=False)
 
-            member.redeems -= 1
-            await member.save()
+            await self.bot.spawns.spawn(ctx.channel.id, pokemon.__getitem__("species_id"))
 
             self.bot.dispatch("spawn", ctx.channel, pokemon.__getitem__("species_id"), True)
 
@@ -737,10 +733,8 @@ class Shop(commands.Cog):
             if member.redeems == 0:
                 return await ctx.reply("You don't have redeems!", mention_author=False)
 
-            member.balance += 15000
-
-            member.redeems -= 1
-            await member.save()
+            if await self.bot.manager.update_economy(ctx.author.id, redeems=-1, balance=15000) is None:
+                return await ctx.reply("You don't have redeems!", mention_author=False)
 
             return await ctx.reply(
                 "Successfully added `15,000` credits to your account!",
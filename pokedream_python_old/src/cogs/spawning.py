@@ -1,6 +1,5 @@
 import asyncio
 from tortoise.exceptions import ConfigurationError
-from utils.converters import PokemonConverter, SpeciesConverter
 from cogs.helpers.battles import Battle, BattleEngine, Trainer
 from discord.utils import escape_markdown
 from discord.ext import commands, tasks
@@ -10,6 +9,8 @@ from utils.methods import write_fp
 from utils.constants import TYPES, UTC
 from core.views import SpawnDuelView, Confirm
 from core.views import SpawnFightView
+from core.spawn_state import Claim, SpawnState
+from core.catch import CatchContext
 from contextlib import suppress
 from typing import List, Optional, Union
 from core.bot import PokeBest
@@ -18,6 +19,7 @@ from data import data
 import discord
 import models
 import random
+import io
 import config
 
 
@@ -37,30 +39,36 @@ class MessageHandler(commands.Cog):
         # self.clear_expired_incense.start()
 
     async def increase_xp(self: "MessageHandler", message: discord.Message):
-        ctx: commands.Context = await self.bot.get_context(message)
         member: models.Member = await self.bot.manager.fetch_member_info(message.author.id)
 
         if member is None:
             return
 
-        pokemon: models.Pokemon = await PokemonConverter().convert(ctx, "")
+        pokemon: models.Pokemon = await self.bot.manager.xp.get_selected(member)
         if pokemon is None:
             return
 
         if pokemon.held_item == 13002:
             return
 
+        # Nothing left to gain, only the XP cap has to be written once.
+        if pokemon.level == 100:
+            if pokemon.xp != pokemon.max_xp:
+                pokemon.xp = pokemon.max_xp
+                await self.bot.manager.xp.save(pokemon)
+            return
+
         level_increase: int = 0
 
         if pokemon.xp <= pokemon.max_xp:
             xp_inc: int = random.randint(10, 40)
-            if member.boost_expires is not None or ctx.guild.id == config.SUPPORT_SERVER_ID:
+            if member.boost_expires is not None or message.guild.id == config.SUPPORT_SERVER_ID:
                 xp_inc *= 2
 
             if message.author.premium_since is not None and message.guild.id == config.SUPPORT_SERVER_ID:
                 xp_inc *= 2
 
-            pokemon.xp += xp_inc
+            self.bot.manager.xp.add(pokemon, xp_inc)
 
         embed: Union[None, discord.Embed] = None
 
@@ -71,7 +79,7 @@ class MessageHandler(commands.Cog):
 
             embed = self.bot.Embed(
                 title="⬆️ Level up!",
-                description=f"Congratulations {ctx.author.mention}!\nYour {pokemon:n} is now **Level {pokemon.level}**!",
+                description=f"Congratulations {message.author.mention}!\nYour {pokemon:n} is now **Level {pokemon.level}**!",
             )
 
             embed.set_thumbnail(url=pokemon.normal_image)
@@ -92,44 +100,41 @@ class MessageHandler(commands.Cog):
 
                     self.bot.dispatch("evolve", message, pokemon)
 
+        if embed is None:
+            return
+
         if pokemon.level == 100:
             pokemon.xp = pokemon.max_xp
 
-        await pokemon.save()
+        await self.bot.manager.xp.save(pokemon)
 
-        if pokemon.level != 100 and embed:
+        if pokemon.level != 100:
             self.bot.dispatch("levelup", message, pokemon)
-            return await ctx.send(embed=embed)
+            return await message.channel.send(embed=embed)
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
         if message.author.bot or message.guild is None:  # This will not allow to spawn and increase xp in dms
             return
 
+        self.bot.guesses.feed(message)
+
         try:
             await self.increase_xp(message)
         except ConfigurationError:
             return
 
-        try:
-            _message_count: int = self.bot.spawn_cache[message.channel.id]["messages"]
-        except KeyError:
-            self.bot.spawn_cache[message.channel.id] = {
-                "messages": 0,
-                "species_id": None,
-                "hint_used": False,
-                "is_shiny": False,
-                "is_engaged": False,
-            }
-            _message_count: int = 0
+        _message_count: int = self.bot.spawns.increment(message.channel.id)
 
         if message.guild.id == self.bot.config.SUPPORT_SERVER_ID:
             SPAWN_THRESHOLD = 15
         else:
             SPAWN_THRESHOLD = 25
 
-        if _message_count >= SPAWN_THRESHOLD:
-            _species = data.random_pokemon()
+        if _message_count > SPAWN_THRESHOLD:
+            _species = data.species_by_num(
+                self.bot.spawn_sampler.sample(self.type_spawn_channels.get(message.channel.id))
+            )
 
             _ctx: commands.Context = await self.bot.get_context(message)
             spawn_duel: SpawnDuelView = SpawnDuelView(self.bot, _ctx, message.channel, _species.__getitem__("species_id"))
@@ -142,17 +147,15 @@ class MessageHandler(commands.Cog):
                 spawn_duel=spawn_duel,
             )
 
-        self.bot.spawn_cache[message.channel.id]["messages"] += 1
+        if message.author.id not in self.bot.incense:
+            self.incense_counter.pop(message.author.id, None)
+            return
 
-        incense_counter: Optional[int] = self.incense_counter.get(message.author.id, None)
-        if incense_counter is None and (await self.bot.redis.hexists(f"db:incense", message.author.id)):
-            self.incense_counter[message.author.id] = 1
-        elif incense_counter is not None:
-            self.incense_counter[message.author.id] += 1
+        self.incense_counter[message.author.id] = self.incense_counter.get(message.author.id, 0) + 1
 
-            if self.incense_counter[message.author.id] >= 10:
-                self.bot.dispatch("spawn_incense", message)
-                self.incense_counter[message.author.id] = 0
+        if self.incense_counter[message.author.id] >= 10:
+            self.bot.dispatch("spawn_incense", message)
+            self.incense_counter[message.author.id] = 0
 
     @commands.Cog.listener()
     async def on_spawn(
@@ -167,8 +170,7 @@ class MessageHandler(commands.Cog):
         except (KeyError, AttributeError):
             _redirects = []
 
-        with suppress(KeyError):
-            self.bot.spawn_cache[channel.id]["messages"] = 0
+        self.bot.spawns.reset_messages(channel.id)
 
         try:
             guild_prefix: str = self.bot.cache.guilds[f"{channel.guild.id}"].prefix
@@ -188,9 +190,6 @@ class MessageHandler(commands.Cog):
         except TypeError:
             _spawn_embed.color = 0x000000
 
-        if is_shiny:
-            self.bot.spawn_cache[channel.id]["is_shiny"] = is_shiny
-
         # _nos: str = "normal" if not is_shiny else "shiny"
 
         types: List[str] = [TYPES[idx] for idx in _species["types"]]
@@ -204,59 +203,25 @@ class MessageHandler(commands.Cog):
 
         #     _spawn_embed.set_image(url="attachment://pokemon.jpg")
 
-        async with self.bot.session.get(
-            f"{self.bot.config.IMAGE_SERVER_URL}spawn/{random.choice(types).lower()}/{_species['species_id']}"
-        ) as resp:
-            if resp.status == 200:
-                arr = await self.bot.loop.run_in_executor(None, write_fp, await resp.read())
-                image: discord.File = discord.File(arr, filename="pokemon.jpg")
-                _spawn_embed.set_image(url="attachment://pokemon.jpg")
+        image: Optional[discord.File] = None
+        _image: Optional[bytes] = await self.bot.spawn_images.get(random.choice(types), _species["species_id"])
 
-            else:
-                async with self.bot.session.get(_species["sprites"]["normal"]) as resp:
-                    arr = await self.bot.loop.run_in_executor(None, write_fp, await resp.read())
-                    image: discord.File = discord.File(arr, filename="pokemon.jpg")
-                    _spawn_embed.set_image(url="attachment://pokemon.jpg")
+        if _image is not None:
+            image = discord.File(io.BytesIO(_image), filename="pokemon.jpg")
+            _spawn_embed.set_image(url="attachment://pokemon.jpg")
 
         if _redirects.__len__() == 0 or redeemed:
             await channel.send(embed=_spawn_embed, file=image)
-
-            try:
-                self.bot.spawn_cache[channel.id]["species_id"] = _species["species_id"]
-                self.bot.spawn_cache[channel.id]["is_engaged"] = False
-
-            except KeyError:
-                self.bot.spawn_cache[channel.id] = {
-                    "species_id": _species["species_id"],
-                    "is_shiny": is_shiny,
-                    "hint_used": False,
-                    "messages": 0,
-                    "is_engaged": False,
-                }
+            await self.bot.spawns.spawn(channel.id, _species["species_id"], is_shiny=is_shiny)
 
         else:
             if channel.id not in self.bot.bot_config.normal_spawns:
-                try:
-                    channels: List[discord.TextChannel] = [
-                        channel.guild.get_channel(chid) or (await self.bot.fetch_channel(chid)) for chid in _redirects
-                    ]
+                # Spawns stay in the channel when none of the redirects can be used.
+                channels: List[discord.TextChannel] = await self.bot.channels.redirects(channel.guild)
+                if channels:
                     channel: discord.TextChannel = random.choice(channels)
 
-                except:
-                    return
-
-            try:
-                self.bot.spawn_cache[channel.id]["species_id"] = _species["species_id"]
-                self.bot.spawn_cache[channel.id]["is_engaged"] = False
-
-            except KeyError:
-                self.bot.spawn_cache[channel.id] = {
-                    "species_id": _species["species_id"],
-                    "is_shiny": is_shiny,
-                    "hint_used": False,
-                    "messages": 0,
-                    "is_engaged": False,
-                }
+            await self.bot.spawns.spawn(channel.id, _species["species_id"], is_shiny=is_shiny)
 
             if channel.id == 837902385946427412:
                 _spawn_embed.set_image(url=None)
@@ -274,7 +239,7 @@ class MessageHandler(commands.Cog):
 
     @commands.Cog.listener()
     async def on_spawn_incense(self, message: discord.Message):
-        species: dict = data.random_pokemon()
+        species: dict = data.species_by_num(self.bot.spawn_sampler.sample())
         _species_id: int = species["species_id"]
 
         emb: discord.Embed = self.bot.Embed(
@@ -289,84 +254,71 @@ class MessageHandler(commands.Cog):
 
             emb.set_thumbnail(url="attachment://pokemon.jpg")
 
-        def _check(msg: discord.Message):
-            guess: str = msg.content.lower()
-            _pk: Optional[dict] = data.species_by_name(guess)
-
-            return (
-                msg.author.id == message.author.id
-                and msg.channel.id == message.channel.id
-                and _pk is not None
-                and _pk["species_id"] == _species_id
-            )
-
-        _remaining_count: int = int(await self.bot.redis.hget("db:incense", message.author.id))
-        if _remaining_count <= 1:
-            await self.bot.redis.hdel(f"db:incense", message.author.id)
-        else:
-            await self.bot.redis.hset("db:incense", message.author.id, _remaining_count - 1)
+        _remaining_count: int = await self.bot.incense.use(message.author.id)
 
-        emb.set_footer(text=f"Incense Remaining: {_remaining_count - 1}")
+        emb.set_footer(text=f"Incense Remaining: {_remaining_count}")
         _spawn_msg: discord.Message = await message.channel.send(embed=emb, file=image)
 
         try:
-            msg: discord.Message = await self.bot.wait_for("message", check=_check, timeout=200.0)
+            msg: discord.Message = await self.bot.guesses.wait(
+                message.channel.id, message.author.id, _species_id, timeout=200.0
+            )
 
             if msg:
                 emb.title = "Caught!"
-                mem: models.Member = await self.bot.manager.fetch_member_info(message.author.id)
-                _next_idx: int = mem.next_idx
+                ctx: commands.Context = await self.bot.get_context(message)
 
-                if hasattr(mem, "shiny_hunt") and _species_id == mem.shiny_hunt:
-                    mem.shiny_streak += 1
+                async with self.bot.catches.catch(ctx) as catch:
+                    mem: models.Member = await self.bot.manager.fetch_member_info(message.author.id)
+                    catch.member = mem
 
-                    is_shiny: bool = (mem.shiny_streak * random.randint(1, 4096)) == 1
+                    if hasattr(mem, "shiny_hunt") and _species_id == mem.shiny_hunt:
+                        mem.shiny_streak += 1
 
-                else:
-                    is_shiny: bool = random.randint(1, 4096) == 1
+                        is_shiny: bool = (mem.shiny_streak * random.randint(1, 4096)) == 1
 
-                pokemon_res: models.Pokemon = models.Pokemon.get_random(
-                    species_id=_species_id,
-                    owner_id=message.author.id,
-                    level=random.randint(5, 40),
-                    timestamp=datetime.now(),
-                    xp=0,
-                    idx=_next_idx,
-                    shiny=is_shiny,
-                )
+                    else:
+                        is_shiny: bool = random.randint(1, 4096) == 1
 
-                emb.description = f"Congratulations {message.author.mention}! You caught a {self.bot.sprites.get(pokemon_res.species_id, pokemon_res.shiny)} **{pokemon_res:l}!**"
+                    _reward: int = 50 if _species_id not in mem.pokemons else 20
+                    _result = await self.bot.manager.update_economy(message.author.id, balance=_reward, next_idx=1)
 
-                await pokemon_res.save()
+                    pokemon_res: models.Pokemon = models.Pokemon.get_random(
+                        species_id=_species_id,
+                        owner_id=message.author.id,
+                        level=random.randint(5, 40),
+                        timestamp=datetime.now(),
+                        xp=0,
+                        idx=_result["next_idx"] - 1,
+                        shiny=is_shiny,
+                    )
 
-                if pokemon_res.shiny and mem.shiny_hunt == pokemon_res.species_id:
-                    mem.shiny_hunt = 0
-                    mem.shiny_streak = 0
+                    emb.description = f"Congratulations {message.author.mention}! You caught a {self.bot.sprites.get(pokemon_res.species_id, pokemon_res.shiny)} **{pokemon_res:l}!**"
 
-                mem.next_idx += 1
-                ctx: commands.Context = await self.bot.get_context(message)
+                    await pokemon_res.save()
+                    catch.pokemon = pokemon_res
 
-                _message: str = f"Congratulations {message.author.mention}! You caught a {self.bot.sprites.get(pokemon_res.species_id, pokemon_res.shiny)} **{pokemon_res:l}!**"
+                    if pokemon_res.shiny and mem.shiny_hunt == pokemon_res.species_id:
+                        mem.shiny_hunt = 0
+                        mem.shiny_streak = 0
 
-                if pokemon_res.species_id not in mem.pokemons:
-                    mem.balance += 50
-                    _message += " Added to Pokédex! You received 50 credits."
-                else:
-                    _message += " You received 20 credits."
-                    mem.balance += 20
+                    _message: str = f"Congratulations {message.author.mention}! You caught a {self.bot.sprites.get(pokemon_res.species_id, pokemon_res.shiny)} **{pokemon_res:l}!**"
 
-                mem.pokemons = ArrayAppend("pokemons", pokemon_res.species_id)
-                if pokemon_res.shiny:
-                    _message += "\n\n✨ Oh! The colors on this one seem odd..."
+                    if _reward == 50:
+                        _message += " Added to Pokédex! You received 50 credits."
+                    else:
+                        _message += " You received 20 credits."
 
-                await mem.save()
+                    mem.pokemons = ArrayAppend("pokemons", pokemon_res.species_id)
+                    if pokemon_res.shiny:
+                        _message += "\n\n✨ Oh! The colors on this one seem odd..."
 
-                # await message.channel.send(_message, mention_author=False)
+                    catch.touch("pokemons", "shiny_hunt", "shiny_streak")
 
-                with suppress(discord.Forbidden, discord.HTTPException):
-                    await _spawn_msg.edit(embed=emb)
+                    # await message.channel.send(_message, mention_author=False)
 
-                self.bot.dispatch("catch", ctx, pokemon_res)
+                    with suppress(discord.Forbidden, discord.HTTPException):
+                        await _spawn_msg.edit(embed=emb)
 
         except asyncio.TimeoutError:
             emb.title = "Despawned"
@@ -377,107 +329,101 @@ class MessageHandler(commands.Cog):
 
     @commands.command(aliases=("c",))
     @has_started()
-    async def catch(self, ctx: commands.Context, *, pokemon: SpeciesConverter):
+    async def catch(self, ctx: commands.Context, *, pokemon: str):
         """Catch a wild pokemon!"""
-        try:
-            if self.bot.spawn_cache[ctx.channel.id]["species_id"] is None:
-                return await ctx.reply("There is no wild pokemon!", mention_author=False)
-        except KeyError:
+        species_id: Optional[int] = self.bot.species.lookup(pokemon)
+        _claim: Claim = await self.bot.spawns.claim(ctx.channel.id, species_id)
+
+        if _claim is Claim.NOTHING:
             return await ctx.reply("There is no wild pokemon!", mention_author=False)
 
-        if self.bot.spawn_cache[ctx.channel.id]["is_engaged"]:
+        if _claim is Claim.ENGAGED:
             return await ctx.reply("This pokemon is in duel with another trainer.", mention_author=False)
 
-        if pokemon is None or self.bot.spawn_cache[ctx.channel.id]["species_id"] != pokemon.__getitem__("species_id"):
-            return await ctx.reply("That is the wrong pokemon! Try again.", mention_author=False)
+        if _claim is Claim.WRONG:
+            _message: str = "That is the wrong pokemon! Try again."
 
-        mem: models.Member = await self.bot.manager.fetch_member_info(ctx.author.id)
+            _suggestions: List[int] = self.bot.species.suggest(pokemon, limit=1) if species_id is None else []
+            if _suggestions:
+                _message += f" Did you mean `{data.species_by_num(_suggestions[0])['names']['9']}`?"
 
-        species_id: int = self.bot.spawn_cache[ctx.channel.id]["species_id"]
-        self.bot.spawn_cache[ctx.channel.id]["species_id"] = None
-        _next_idx: int = mem.next_idx
+            return await ctx.reply(_message, mention_author=False)
 
-        if hasattr(mem, "shiny_hunt") and species_id == mem.shiny_hunt:
-            mem.shiny_streak += 1
+        async with self.bot.catches.catch(ctx) as catch:
+            mem: models.Member = await self.bot.manager.fetch_member_info(ctx.author.id)
+            catch.member = mem
 
-            is_shiny: bool = (mem.shiny_streak * random.randint(1, 4096)) == 1
+            if hasattr(mem, "shiny_hunt") and species_id == mem.shiny_hunt:
+                mem.shiny_streak += 1
 
-        else:
-            is_shiny: bool = random.randint(1, 4096) == 1
-
-        pokemon_res: models.Pokemon = models.Pokemon.get_random(
-            species_id=species_id,
-            owner_id=ctx.author.id,
-            level=random.randint(5, 40),
-            timestamp=datetime.now(),
-            xp=0,
-            idx=_next_idx,
-            shiny=is_shiny,
-        )
+                is_shiny: bool = (mem.shiny_streak * random.randint(1, 4096)) == 1
+
+            else:
+                is_shiny: bool = random.randint(1, 4096) == 1
 
-        await pokemon_res.save()
+            _reward: int = 50 if species_id not in mem.pokemons else 20
+            _shards: int = 0
 
-        if pokemon_res.shiny and mem.shiny_hunt == pokemon_res.species_id:
-            mem.shiny_hunt = 0
-            mem.shiny_streak = 0
+            if self.bot.config.CHRISTMAS_MODE and 15 in data.species_by_num(species_id)["types"]:
+                _shards = random.randint(1, 5)
 
-        mem.next_idx += 1
+            _result = await self.bot.manager.update_economy(ctx.author.id, balance=_reward, shards=_shards, next_idx=1)
 
-        self.bot.spawn_cache[ctx.channel.id]["hint_used"] = False
+            pokemon_res: models.Pokemon = models.Pokemon.get_random(
+                species_id=species_id,
+                owner_id=ctx.author.id,
+                level=random.randint(5, 40),
+                timestamp=datetime.now(),
+                xp=0,
+                idx=_result["next_idx"] - 1,
+                shiny=is_shiny,
+            )
 
-        message: str = f"Congratulations {ctx.author.mention}! You caught a {self.bot.sprites.get(pokemon_res.species_id, pokemon_res.shiny)} **{pokemon_res:l}!**"
+            await pokemon_res.save()
+            catch.pokemon = pokemon_res
 
-        if pokemon_res.species_id not in mem.pokemons:
-            mem.balance += 50
-            message += " Added to Pokédex! You received 50 credits."
-            # message += "\n\nAdded to Pokédex! You received 50 credits."
-        else:
-            message += " You received 20 credits."
-            mem.balance += 20
+            if pokemon_res.shiny and mem.shiny_hunt == pokemon_res.species_id:
+                mem.shiny_hunt = 0
+                mem.shiny_streak = 0
 
-        mem.pokemons = ArrayAppend("pokemons", pokemon_res.species_id)
-        if pokemon_res.shiny:
-            message += "\n\n✨ Oh! The colors on this one seem odd..."
+            message: str = f"Congratulations {ctx.author.mention}! You caught a {self.bot.sprites.get(pokemon_res.species_id, pokemon_res.shiny)} **{pokemon_res:l}!**"
 
-        if self.bot.config.CHRISTMAS_MODE:
-            species: dict = data.species_by_num(pokemon_res.species_id)
-            if 15 in species["types"]:
-                _shards = random.randint(1, 5)
-                message += f"\n\n❄️ The wild {pokemon_res} dropped 💎 {_shards} shard(s)!"
+            if _reward == 50:
+                message += " Added to Pokédex! You received 50 credits."
+                # message += "\n\nAdded to Pokédex! You received 50 credits."
+            else:
+                message += " You received 20 credits."
 
-                mem.shards += _shards
+            mem.pokemons = ArrayAppend("pokemons", pokemon_res.species_id)
+            if pokemon_res.shiny:
+                message += "\n\n✨ Oh! The colors on this one seem odd..."
 
-        await mem.save()
+            if _shards:
+                message += f"\n\n❄️ The wild {pokemon_res} dropped 💎 {_shards} shard(s)!"
 
-        # message += f"\n**IV:** ||{pokemon_res.iv_total/186:.2%}||"
-        # await ctx.reply(embed=self.bot.Embed(description=message).set_footer(text=f"Number: {pokemon_res.idx}"), mention_author=False)
-        await ctx.reply(message, mention_author=False)
+            catch.touch("pokemons", "shiny_hunt", "shiny_streak")
 
-        self.bot.dispatch("catch", ctx, pokemon_res)
+            # message += f"\n**IV:** ||{pokemon_res.iv_total/186:.2%}||"
+            # await ctx.reply(embed=self.bot.Embed(description=message).set_footer(text=f"Number: {pokemon_res.idx}"), mention_author=False)
+            # The pokemon is saved already, a failed reply mustn't skip writing the member.
+            with suppress(discord.Forbidden, discord.HTTPException):
+                await ctx.reply(message, mention_author=False)
 
         # Re-initialising cache can save life
-        self.bot.spawn_cache[ctx.channel.id] = {
-            "messages": 0,
-            "species_id": None,
-            "hint_used": False,
-            "is_shiny": False,
-            "is_engaged": False,
-        }
+        await self.bot.spawns.reset(ctx.channel.id)
 
     @commands.command(aliases=("h",))
     @has_started()
     async def hint(self, ctx: commands.Context):
         """Get hint for a spawned wild pokemon."""
-        try:
-            if self.bot.spawn_cache[ctx.channel.id]["species_id"] is None:
-                return await ctx.reply("There is no wild pokemon!", mention_author=False)
-        except KeyError:
+        _state: Optional[SpawnState] = self.bot.spawns.get(ctx.channel.id)
+        if _state is None or _state.species_id is None:
             return await ctx.reply("There is no wild pokemon!", mention_author=False)
 
-        if self.bot.spawn_cache[ctx.channel.id]["hint_used"] is True:
+        if _state.hint_used is True:
             return await ctx.reply("You can't get more hints!", mention_author=False)
 
-        specie = data.species_by_num(self.bot.spawn_cache[ctx.channel.id]["species_id"])
+        specie = data.species_by_num(_state.species_id)
 
         inds = [i for i, x in enumerate(specie["names"]["9"]) if x.isalpha()]
         blanks = random.sample(inds, len(inds) // 2)
@@ -508,10 +454,19 @@ class MessageHandler(commands.Cog):
 
             return await ctx.reply(embed=emb, mention_author=False)
 
-        species: Optional[dict] = await SpeciesConverter().convert(ctx, species)
+        species_id: Optional[int] = self.bot.species.lookup(species)
 
-        if species is None:
-            return await ctx.reply("There is no pokemon available like that.", mention_author=False)
+        if species_id is None:
+            _message: str = "There is no pokemon available like that."
+
+            _suggestions: List[int] = self.bot.species.suggest(species)
+            if _suggestions:
+                _names: str = ", ".join(f"`{data.species_by_num(idx)['names']['9']}`" for idx in _suggestions)
+                _message += f" Did you mean {_names}?"
+
+            return await ctx.reply(_message, mention_author=False)
+
+        species: dict = data.species_by_num(species_id)
 
         if species["catchable"] is False:
             return await ctx.reply(
@@ -548,7 +503,8 @@ class MessageHandler(commands.Cog):
         )
 
     @commands.Cog.listener()
-    async def on_catch(self, ctx: commands.Context, pokemon: models.Pokemon):
+    async def on_catch(self, catch: CatchContext):
+        ctx: commands.Context = catch.ctx
         if random.randint(1, 50) == 5:
             emb: discord.Embed = self.bot.Embed(
                 title="You have been challanged!",
@@ -570,23 +526,18 @@ class MessageHandler(commands.Cog):
             if (tr := battle._get_trainer_by_id(self.bot.user.id)) is not None:
                 if tr.pokemon[0].species_id == 150 and tr.pokemon[0].level == 150:
                     if not trainer.is_bot:
-                        mem: models.Member = await self.bot.manager.fetch_member_info(trainer.user.id)
-
                         pokemon_res: models.Pokemon = models.Pokemon.get_random(
                             species_id=10252,
-                            owner_id=mem.id,
+                            owner_id=trainer.user.id,
                             level=random.randint(5, 40),
                             timestamp=datetime.now(),
                             xp=0,
-                            idx=mem.next_idx,
+                            idx=(await self.bot.manager.reserve_idx(trainer.user.id))[0],
                             shiny=random.randint(1, 4096) == 1,
                         )
 
                         await pokemon_res.save()
 
-                        mem.next_idx += 1
-                        await mem.save()
-
     # @tasks.loop(seconds=10)
     # async def clear_expired_incense(self):
     #     await self.bot.wait_until_ready()
@@ -102,6 +102,74 @@ class BotStats(commands.Cog):
         description.append(f'Current Spammers: {", ".join(being_spammed) if being_spammed else "None"}')
         description.append(f"Questionable Connections: {questionable_connections}")
 
+        message_stats = self.bot.message_stats
+        description.append(
+            f"Messages Seen: {message_stats['messages_seen']}, "
+            + f"Commands Parsed: {message_stats['commands_parsed']}, "
+            + f"Rate Limited: {message_stats['commands_rate_limited']}"
+        )
+
+        member_cache = self.bot.manager.member_cache
+        embed.add_field(
+            name="Member Cache",
+            value=f"Size: {len(member_cache)}\n"
+            + f"Local Hits: {member_cache.stats['local_hits']}\n"
+            + f"Redis Hits: {member_cache.stats['redis_hits']}\n"
+            + f"Misses: {member_cache.stats['misses']}\n"
+            + f"Hit Ratio: {member_cache.hit_ratio:.2%}",
+        )
+
+        spawn_images = self.bot.spawn_images
+        embed.add_field(
+            name="Spawn Images",
+            value=f"Memory: {len(spawn_images)}\n"
+            + f"Memory Hits: {spawn_images.stats['memory_hits']}\n"
+            + f"Disk Hits: {spawn_images.stats['disk_hits']}\n"
+            + f"Misses: {spawn_images.stats['misses']}\n"
+            + f"Fallbacks: {spawn_images.stats['fallbacks']}\n"
+            + f"Hit Ratio: {spawn_images.hit_ratio:.2%}",
+        )
+
+        spawns = self.bot.spawns
+        spawns_memory = spawns.memory_usage()
+        embed.add_field(
+            name="Spawn States",
+            value=f"Channels: {len(spawns)}\n"
+            + f"Evictions: {spawns.evictions}\n"
+            + f"Memory: {spawns_memory / 1024:.2f} KiB\n"
+            + f"Per Channel: {spawns_memory / max(len(spawns), 1):.0f} B",
+        )
+
+        catches = self.bot.catches
+        embed.add_field(
+            name="Catches",
+            value=f"Catches: {catches.stats['catches']}\n"
+            + f"Queries per Catch: {catches.queries_per_catch:.1f}\n"
+            + f"Pending Guesses: {len(self.bot.guesses)}",
+        )
+
+        channels = self.bot.channels.stats
+        embed.add_field(
+            name="Spawn Channels",
+            value=f"Cached: {channels['cached']}\n"
+            + f"Fetched: {channels['fetched']}\n"
+            + f"Known Missing: {channels['missing']}\n"
+            + f"Pruned: {channels['pruned']}",
+        )
+
+        locks = self.bot.locks
+        contended = sorted(locks.stats.items(), key=lambda item: item[1].wait_time, reverse=True)[:5]
+        embed.add_field(
+            name=f"Command Locks ({'redis' if locks.distributed else 'local'})",
+            value="\n".join(
+                f"{name}: {stats.contended}/{stats.acquired} contended, "
+                + f"{stats.timeouts} timeouts, {stats.average_wait * 1000:.1f}ms avg wait"
+                for name, stats in contended
+            )
+            or "No locked commands yet.",
+            inline=False,
+        )
+
         total_warnings += questionable_connections
         if being_spammed:
             embed.colour = WARNING
@@ -153,54 +153,34 @@ async def do_transfer(bot: PokeBest, trade: Trade):
             trader: Trader = trade.traders[0]
             another: Trader = trade.traders[1]
 
-            trader_model: models.Member = await models.Member.get(id=trader.user.id)
-            another_model: models.Member = await models.Member.get(id=another.user.id)
-
-            # Balance
-            trader_model.balance += another.items.balance
-            another_model.balance += trader.items.balance
-
-            trader_model.balance -= trader.items.balance
-            another_model.balance -= another.items.balance
-
-            # Redeems
-            trader_model.redeems += another.items.redeems
-            another_model.redeems += trader.items.redeems
-
-            trader_model.redeems -= trader.items.redeems
-            another_model.redeems -= another.items.redeems
-
-            # Shards
-            trader_model.shards += another.items.shards
-            another_model.shards += trader.items.shards
-
-            trader_model.shards -= trader.items.shards
-            another_model.shards -= another.items.shards
+            def _deltas(receiver: Trader, sender: Trader) -> Dict[str, int]:
+                return {
+                    "balance": sender.items.balance - receiver.items.balance,
+                    "redeems": sender.items.redeems - receiver.items.redeems,
+                    "shards": sender.items.shards - receiver.items.shards,
+                    "next_idx": sender.items.pokemon.__len__(),
+                }
+
+            # Balance, redeems, shards and indices are applied in one transaction,
+            # it fails as a whole if any trader can't afford what they offered.
+            result = await bot.manager.update_economy_many(
+                {trader.id: _deltas(trader, another), another.id: _deltas(another, trader)}
+            )
 
-            if trader_model.balance < 0 or another_model.balance < 0:
+            if result is None:
                 raise PokeBestError("Something went wrong while processing this trade.")
 
             # Exchanging pokemon
-            if trader.items.pokemon.__len__() != 0:
-                for pk in trader.items.pokemon:
-                    pk.owner_id = another.user.id
-                    pk.idx = another_model.next_idx
-
-                    another_model.next_idx += 1
-
-                    await pk.save()
-
-            if another.items.pokemon.__len__() != 0:
-                for pk in another.items.pokemon:
-                    pk.owner_id = trader.user.id
-                    pk.idx = trader_model.next_idx
+            for sender, receiver in ((trader, another), (another, trader)):
+                _next_idx: int = result[receiver.id].get("next_idx", 0) - sender.items.pokemon.__len__()
 
-                    trader_model.next_idx += 1
+                for pk in sender.items.pokemon:
+                    pk.owner_id = receiver.user.id
+                    pk.idx = _next_idx
 
-                    await pk.save()
+                    _next_idx += 1
 
-            await trader_model.save()
-            await another_model.save()
+                    await bot.manager.update_pokemon(pk.id, owner_id=pk.owner_id, idx=pk.idx)
 
             bot.dispatch("trade_confirm", trade)
 
@@ -99,20 +99,23 @@ class Vote(commands.Cog):
                 mention_author=False,
             )
 
+        _result = await self.bot.manager.update_economy(ctx.author.id, vote_crystals=-1, next_idx=1)
+        if _result is None:
+            return await ctx.reply(
+                f"You don't have any vote crystals! Vote for us by using `{ctx.prefix}vote` command to get some.",
+                mention_author=False,
+            )
+
         pk: models.Pokemon = models.Pokemon.get_random(
             species_id=self._get_form_pokemon()["species_id"],
             level=random.randint(15, 70),
             xp=0,
-            idx=mem.next_idx,
+            idx=_result["next_idx"] - 1,
             owner_id=ctx.author.id,
             shiny=random.randint(1, 4096) == 1,
             timestamp=discord.utils.utcnow(),
         )
 
-        mem.vote_crystals -= 1
-        mem.next_idx += 1
-
-        await mem.save()
         await pk.save()
 
         return await ctx.reply(
@@ -0,0 +1,345 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from typing import TYPE_CHECKING, Counter, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import aiohttp
+import asyncio
+import logging
+import multiprocessing
+import sys
+import time
+
+from PIL import Image, ImageDraw, ImageFont
+
+if TYPE_CHECKING:
+    from core.bot import PokeBest
+    import models
+
+log = logging.getLogger(__name__)
+
+__all__ = ["BattleScenes", "SceneSide", "render_scene"]
+
+SPRITE_POSITIONS: Tuple[Tuple[int, int], Tuple[int, int]] = ((175, 220), (1250, 220))
+BAR_SIZE: Tuple[int, int] = (300, 18)
+# Width of the HP and status text right of a bar
+STATUS_WIDTH: int = 260
+FONT_PATH: str = "DejaVuSans-Bold.ttf"
+FONT_SIZE: int = 32
+SMALL_FONT_SIZE: int = 22
+MAX_WORKER_SPRITES: int = 256
+MAX_WORKER_FRAMES: int = 16
+
+STATUS_LABELS: Dict[str, str] = {
+    "Paralysis": "PAR",
+    "Sleep": "SLP",
+    "Freeze": "FRZ",
+    "Burn": "BRN",
+    "Poison": "PSN",
+}
+
+
+class SceneSide(NamedTuple):
+    sprite: str
+    level: int
+    name: str
+    hp: int
+    max_hp: int
+    status: Tuple[str, ...] = ()
+
+    @property
+    def static(self) -> Tuple[str, int, str]:
+        return self.sprite, self.level, self.name
+
+    @property
+    def dynamic(self) -> Tuple[int, int, Tuple[str, ...]]:
+        return self.hp, self.max_hp, self.status
+
+
+class _Frame:
+    """
+    Static layer of a battle (background, sprites, names and levels) plus the
+    last frame drawn from it. Turns only repaint the HP and status regions
+    that changed since that frame.
+    """
+
+    __slots__ = ("static", "image", "draw", "drawn")
+
+    def __init__(self, static: Image.Image) -> None:
+        self.static: Image.Image = static
+        self.image: Image.Image = static.copy()
+        self.draw: ImageDraw.ImageDraw = ImageDraw.Draw(self.image)
+        self.drawn: List[Optional[tuple]] = [None, None]
+
+
+# .. Worker process state, filled by `_init_worker` and kept between renders ..
+_backgrounds: Dict[str, Image.Image] = {}
+_sprites: OrderedDict[str, Image.Image] = OrderedDict()
+_frames: OrderedDict[tuple, _Frame] = OrderedDict()
+_font: Optional[ImageFont.ImageFont] = None
+_small_font: Optional[ImageFont.ImageFont] = None
+_buffer: BytesIO = BytesIO()
+
+
+def _load_font(size: int) -> ImageFont.ImageFont:
+    try:
+        return ImageFont.truetype(FONT_PATH, size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+def _init_worker(backgrounds: Dict[str, bytes]) -> None:
+    global _font, _small_font
+
+    for name, raw in backgrounds.items():
+        _backgrounds[name] = Image.open(BytesIO(raw)).convert("RGB")
+
+    _font = _load_font(FONT_SIZE)
+    _small_font = _load_font(SMALL_FONT_SIZE)
+
+
+def _sprite(key: str, raw: bytes) -> Image.Image:
+    sprite: Optional[Image.Image] = _sprites.get(key)
+    if sprite is None:
+        sprite = _sprites[key] = Image.open(BytesIO(raw)).convert("RGBA")
+        while _sprites.__len__() > MAX_WORKER_SPRITES:
+            _sprites.popitem(last=False)
+
+    _sprites.move_to_end(key)
+    return sprite
+
+
+def _bar_color(hp: float) -> Tuple[int, int, int]:
+    if hp > 0.5:
+        return (76, 209, 55)
+    if hp > 0.2:
+        return (251, 197, 49)
+    return (232, 65, 24)
+
+
+def _bar_top(position: Tuple[int, int]) -> int:
+    return position[1] - BAR_SIZE[1] - 20
+
+
+def _dynamic_box(position: Tuple[int, int], size: Tuple[int, int]) -> Tuple[int, int, int, int]:
+    x, top = position[0], _bar_top(position)
+    return (
+        max(x - 2, 0),
+        max(top - 6, 0),
+        min(x + BAR_SIZE[0] + STATUS_WIDTH, size[0]),
+        min(top + BAR_SIZE[1] + 8, size[1]),
+    )
+
+
+def _static_layer(background: str, sides: Tuple[SceneSide, SceneSide], sprites: Dict[str, bytes]) -> Image.Image:
+    layer: Image.Image = _backgrounds[background].copy()
+    draw: ImageDraw.ImageDraw = ImageDraw.Draw(layer)
+
+    for position, side in zip(SPRITE_POSITIONS, sides):
+        sprite: Image.Image = _sprite(side.sprite, sprites[side.sprite])
+        layer.paste(sprite, position, mask=sprite)
+
+        x, top = position[0], _bar_top(position)
+        draw.text((x, top - FONT_SIZE - 12), f"{side.name}  Lv. {side.level}", fill=(255, 255, 255), font=_font)
+
+    return layer
+
+
+def _draw_dynamic(frame: _Frame, position: Tuple[int, int], side: SceneSide) -> None:
+    box: Tuple[int, int, int, int] = _dynamic_box(position, frame.image.size)
+    frame.image.paste(frame.static.crop(box), box[:2])
+
+    x, top = position[0], _bar_top(position)
+    width, height = BAR_SIZE
+    ratio: float = min(max(side.hp / side.max_hp, 0.0), 1.0) if side.max_hp else 0.0
+
+    frame.draw.rectangle((x, top, x + width, top + height), fill=(40, 40, 40))
+    filled: int = round(width * ratio)
+    if filled:
+        frame.draw.rectangle((x, top, x + filled, top + height), fill=_bar_color(ratio))
+
+    text: str = " ".join((f"{side.hp}/{side.max_hp}",) + side.status)
+    frame.draw.text((x + width + 12, top - 4), text, fill=(255, 255, 255), font=_small_font)
+
+
+def render_scene(
+    background: str,
+    sides: Tuple[SceneSide, SceneSide],
+    sprites: Dict[str, bytes],
+    fmt: str = "JPEG",
+    quality: int = 80,
+) -> bytes:
+    """
+    Draws both pokemon with their HP bars, levels and statuses on a cached
+    background. Runs in the worker processes: the static layer of a battle is
+    composed on its first turn and later turns only repaint what changed.
+    """
+    key: tuple = (background, sides[0].static, sides[1].static)
+    frame: Optional[_Frame] = _frames.get(key)
+
+    if frame is None:
+        frame = _frames[key] = _Frame(_static_layer(background, sides, sprites))
+        while _frames.__len__() > MAX_WORKER_FRAMES:
+            _frames.popitem(last=False)
+    _frames.move_to_end(key)
+
+    for idx, (position, side) in enumerate(zip(SPRITE_POSITIONS, sides)):
+        if frame.drawn[idx] != side.dynamic:
+            _draw_dynamic(frame, position, side)
+            frame.drawn[idx] = side.dynamic
+
+    _buffer.seek(0)
+    _buffer.truncate()
+    if fmt == "WEBP":
+        frame.image.save(_buffer, "WEBP", quality=quality, method=2)
+    else:
+        frame.image.save(_buffer, "JPEG", quality=quality)
+    return _buffer.getvalue()
+
+
+class BattleScenes:
+    """
+    Battle images composed in-process instead of downloading the background
+    and both sprites for every render.
+
+    Backgrounds are downloaded once (and kept on disk) and handed to the
+    render workers when they start, sprites are kept as bytes here and
+    decoded once per worker. Every worker is its own single process pool so
+    the turns of a battle always reach the worker holding its frame. At most
+    `max_pending` renders are queued, the rest wait their turn.
+    """
+
+    BACKGROUNDS: Dict[str, str] = {
+        "default": "https://i.imgur.com/KWdmvCn.png",
+    }
+
+    def __init__(
+        self,
+        bot: PokeBest,
+        *,
+        workers: int = 2,
+        max_pending: int = 8,
+        fmt: str = "JPEG",
+        quality: int = 80,
+        directory: Path = Path("cache/battle_scenes"),
+        max_sprites: int = 512,
+    ) -> None:
+        self.bot: PokeBest = bot
+        self.workers: int = workers
+        self.fmt: str = fmt.upper()
+        self.quality: int = quality
+        self.directory: Path = directory
+        self.max_sprites: int = max_sprites
+
+        self._pools: List[ProcessPoolExecutor] = []
+        self._starting: asyncio.Lock = asyncio.Lock()
+        self._slots: asyncio.Semaphore = asyncio.Semaphore(max_pending)
+        self._sprites: OrderedDict[str, bytes] = OrderedDict()
+
+        # renders, render_time, sprite_hits, sprite_misses
+        self.stats: Counter = Counter()
+
+    @property
+    def filename(self) -> str:
+        return "duel.webp" if self.fmt == "WEBP" else "duel.jpg"
+
+    async def _download(self, url: str) -> bytes:
+        async with self.bot.session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+            resp.raise_for_status()
+            return await resp.read()
+
+    async def _background(self, name: str, url: str) -> bytes:
+        path: Path = self.directory / f"{name}.png"
+        try:
+            return await self.bot.loop.run_in_executor(None, path.read_bytes)
+        except OSError:
+            pass
+
+        raw: bytes = await self._download(url)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        await self.bot.loop.run_in_executor(None, path.write_bytes, raw)
+        return raw
+
+    async def start(self) -> None:
+        async with self._starting:
+            if self._pools:
+                return
+
+            backgrounds: Dict[str, bytes] = {
+                name: await self._background(name, url) for name, url in self.BACKGROUNDS.items()
+            }
+            # Spawned rather than forked, the workers don't need a copy of the whole bot.
+            self._pools = [
+                ProcessPoolExecutor(
+                    max_workers=1,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(backgrounds,),
+                )
+                for _ in range(self.workers)
+            ]
+            log.info("[BATTLE SCENES ] Started %s render worker(s)", self.workers)
+
+    async def sprite(self, url: str) -> bytes:
+        raw: Optional[bytes] = self._sprites.get(url)
+        if raw is not None:
+            self._sprites.move_to_end(url)
+            self.stats["sprite_hits"] += 1
+            return raw
+
+        self.stats["sprite_misses"] += 1
+        raw = self._sprites[url] = await self._download(url)
+        while self._sprites.__len__() > self.max_sprites:
+            self._sprites.popitem(last=False)
+        return raw
+
+    @staticmethod
+    def _side(pokemon: models.Pokemon, status: Iterable[str]) -> SceneSide:
+        return SceneSide(
+            pokemon.normal_image,
+            pokemon.level,
+            str(pokemon),
+            pokemon.hp,
+            pokemon.max_hp,
+            tuple(sorted(STATUS_LABELS.get(s, s[:3].upper()) for s in status)),
+        )
+
+    async def render(
+        self,
+        pokemon1: models.Pokemon,
+        pokemon2: models.Pokemon,
+        *,
+        background: str = "default",
+        status: Tuple[Iterable[str], Iterable[str]] = ((), ()),
+    ) -> BytesIO:
+        if not self._pools:
+            await self.start()
+
+        sides: Tuple[SceneSide, SceneSide] = (self._side(pokemon1, status[0]), self._side(pokemon2, status[1]))
+        sprites: Dict[str, bytes] = {side.sprite: await self.sprite(side.sprite) for side in sides}
+
+        # The same pair of pokemon always goes to the same worker, where its frame is.
+        pool: ProcessPoolExecutor = self._pools[hash((sides[0].static, sides[1].static)) % len(self._pools)]
+
+        async with self._slots:
+            t1 = time.perf_counter()
+            image: bytes = await self.bot.loop.run_in_executor(
+                pool, render_scene, background, sides, sprites, self.fmt, self.quality
+            )
+            self.stats["render_time"] += time.perf_counter() - t1
+
+        self.stats["renders"] += 1
+        return BytesIO(image)
+
+    def close(self) -> None:
+        for pool in self._pools:
+            # Queued renders are only dropped from 3.9 on, before that they finish first.
+            if sys.version_info >= (3, 9):
+                pool.shutdown(wait=False, cancel_futures=True)
+            else:
+                pool.shutdown(wait=False)
+        self._pools = []
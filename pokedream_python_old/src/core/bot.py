@@ -1,5 +1,4 @@
 from pathlib import Path
-from cogs.sprites import SpriteManager
 import models
 from discord.ext import commands
 import discord
@@ -10,18 +9,33 @@ import logging
 import asyncpg
 import aioredis
 
-from typing import Any, Counter, List, Optional
+from typing import TYPE_CHECKING, Any, Counter, List, Optional
 from tortoise import Tortoise
 import config
-from cogs import __loadable__, __ready_cogs__
+from cogs import __lazy__, __loadable__, __ready_cogs__
 from cogs.database import Database
+from cogs.helpers.battle_engine import MoveTables
 from utils.psqlclient import PostgresClient
 from utils.cache import CacheManager
 from utils.exceptions import SuspendedUser
 from datetime import datetime
 from ._logging import init_logging
 from .rpc import RPCMixin
-from aioredis_lock import RedisLock, LockTimeoutError
+from .battle_scenes import BattleScenes
+from .catch import CatchPipeline
+from .channels import ChannelResolver
+from .extensions import ExtensionLoader
+from .guesses import GuessRouter
+from .incense import IncenseIndex
+from .pubsub import PubSub
+from .setting_cache import PrefixManager
+from .spawn_images import SpawnImageCache
+from .spawn_sampler import SpawnSampler
+from .spawn_state import RedisSpawnStore, SpawnStore
+from .species_index import SpeciesIndex
+from .startup import Startup
+from .suspensions import SuspensionIndex
+from .locks import LocalLockBackend, LockManager, LockTimeoutError, RedisLockBackend
 
 from rich.progress import track
 from rich.table import Table
@@ -29,6 +43,10 @@ from rich.console import Console
 import os
 import time
 
+if TYPE_CHECKING:
+    # Only an annotation, importing it here executed the whole sprites table a second time.
+    from cogs.sprites import SpriteManager
+
 console: Console = Console()
 
 log = logging.getLogger(__name__)
@@ -62,15 +80,12 @@ CONCURRENCY_LIMITED_COMMANDS: set = {
 
 
 async def is_suspended(ctx: commands.Context):
-    user: models.Member = await ctx.bot.manager.fetch_member_info(ctx.author.id)
-
-    if not user:
+    if ctx.author.id not in ctx.bot.suspensions or ctx.author.id in config.OWNERS:
         return True
 
-    if user.suspended and ctx.author.id not in config.OWNERS:
-        raise SuspendedUser(user.suspended_reason)
-
-    return True
+    # Only suspended members pay for a lookup, to show them the reason.
+    user: models.Member = await ctx.bot.manager.fetch_member_info(ctx.author.id)
+    raise SuspendedUser(getattr(user, "suspended_reason", None))
 
 
 # ================================================================================================================================================================
@@ -84,36 +99,10 @@ class PokeBest(RPCMixin, commands.AutoShardedBot):
         self.DEBUG = config.DEBUG_MODE
         init_logging(0, Path("logs\\PokeBest-core.log"))
 
-        async def _prefix_manager(bot, message: discord.Message):
-            if message.guild is None:
-                return [
-                    "p!",
-                    "P!",
-                    self.user.mention + " ",
-                    self.user.mention[:2] + "!" + self.user.mention[2:] + " ",
-                ]
-
-            try:
-                if bot.cache is None:
-                    return ["p!", "P!"]
-                guild: models.Guild = bot.cache.guilds[f"{message.guild.id}"]
-            except KeyError:
-                guild = None
-
-            if guild is None:
-                return [
-                    "p!",
-                    "P!",
-                    self.user.mention + " ",
-                    self.user.mention[:2] + "!" + self.user.mention[2:] + " ",
-                ]
-
-            return [
-                guild.prefix.lower(),
-                guild.prefix.upper(),
-                self.user.mention + " ",
-                self.user.mention[:2] + "!" + self.user.mention[2:] + " ",
-            ]
+        self.prefixes: PrefixManager = PrefixManager(self)
+
+        def _prefix_manager(bot, message: discord.Message):
+            return bot.prefixes.get_prefixes(message.guild.id if message.guild is not None else None)
 
         self.case_insensitive = True
 
@@ -146,24 +135,56 @@ class PokeBest(RPCMixin, commands.AutoShardedBot):
         self.log.info("Hello, World!")
 
         # Loading cogs in init because of slash loading
+        self.cog_loader: ExtensionLoader = ExtensionLoader(self)
+        _lazy: dict = __lazy__ if getattr(config, "LAZY_COGS", False) else {}
+
         for _cog in __loadable__:
-            self.load_extension(_cog)
-            self.log.info("[COG ] Loaded %s" % _cog)
+            if _cog in _lazy:
+                self.cog_loader.defer(_cog, _lazy[_cog])
+            else:
+                self.cog_loader.load(_cog)
 
         self.loop = asyncio.get_event_loop()
         self.session = aiohttp.ClientSession(loop=self.loop)
+        self.spawn_images: SpawnImageCache = SpawnImageCache(self)
+        self.battle_scenes: BattleScenes = BattleScenes(
+            self,
+            workers=getattr(config, "BATTLE_RENDER_WORKERS", 2),
+            fmt=getattr(config, "BATTLE_SCENE_FORMAT", "JPEG"),
+        )
 
         self.add_check(is_suspended)
 
         # .. Cache ..
-        self.spawn_cache: dict = {}
+        # Wild pokemon only have to be claimed through redis when several processes may catch them.
+        self.spawns: SpawnStore = RedisSpawnStore(self) if getattr(config, "SHARED_SPAWNS", False) else SpawnStore()
+        self.spawn_sampler: SpawnSampler = SpawnSampler.from_files(boosts=SpawnSampler.boosts_for(config))
+        self.species: SpeciesIndex = SpeciesIndex.from_file()
+        self.move_tables: MoveTables = MoveTables.default()
         self.cache = None
         self.bot_config = None
+        self.pubsub: PubSub = PubSub(self)
+        self.suspensions: SuspensionIndex = SuspensionIndex(self)
+        self.incense: IncenseIndex = IncenseIndex(self)
+        self.catches: CatchPipeline = CatchPipeline(self)
+        self.guesses: GuessRouter = GuessRouter(self)
+        self.channels: ChannelResolver = ChannelResolver(self)
+        self.startup: Startup = Startup()
+
+        # Command locks only have to go through redis when other processes run shards of the bot.
+        self.locks: LockManager = LockManager(
+            RedisLockBackend(self)
+            if getattr(config, "DISTRIBUTED_LOCKS", self.shard_ids is not None)
+            else LocalLockBackend()
+        )
 
         # Auto-spam control
         self.spam_control = commands.CooldownMapping.from_cooldown(10, 12.0, commands.BucketType.user)
         self._auto_spam_count = Counter()
 
+        # messages_seen, commands_parsed and commands_rate_limited, see `bothealth`
+        self.message_stats: Counter = Counter()
+
         self.owner_id = 766553763569336340
         self.boot_time = datetime.utcnow()
 
@@ -182,10 +203,48 @@ class PokeBest(RPCMixin, commands.AutoShardedBot):
         return self.get_cog("Database")
 
     @property
-    def sprites(self) -> SpriteManager:
+    def sprites(self) -> "SpriteManager":
         return self.get_cog("SpriteManager")
 
     async def _init_bot(self):
+        # on_ready fires again after every reconnect, only the first call initializes the bot.
+        await self.startup.run(self._startup_pipeline)
+
+    async def _startup_pipeline(self):
+        stage = self.startup.stage
+
+        # Nothing depends on the RPC server, it doesn't hold commands back and can't fail the startup either.
+        rpc_task: asyncio.Task = asyncio.create_task(stage("rpc", self.rpc.initialize, optional=True))
+
+        try:
+            await asyncio.gather(stage("database", self._init_database), stage("redis", self._init_redis))
+            await asyncio.gather(
+                stage("cache", self._init_cache),
+                stage("bot config", self._load_bot_config),
+                stage("suspensions", self.suspensions.load),
+                stage("incense", self.incense.load),
+                stage("member cache", self.manager.member_cache.load),
+            )
+            self.startup.ready.set()
+
+            await stage("extensions", self._load_ready_cogs)
+
+            # Most spawns are of the same few species, have their images on disk before they're needed.
+            self.spawn_images.start_prewarm()
+
+        finally:
+            await rpc_task
+
+    async def _load_ready_cogs(self):
+        # Loading jsk here to save it from slash registration
+        for _cog in ("jishaku",) + __ready_cogs__:
+            # Those loaded by a failed attempt stay loaded
+            if _cog not in self.extensions:
+                self.cog_loader.load(_cog)
+
+        console.print(self.cog_loader.report())
+
+    async def _init_database(self):
         # psql_client: PostgresClient = PostgresClient(config.DATABASE_URI)
         # await psql_client.create_pool()
 
@@ -194,8 +253,12 @@ class PokeBest(RPCMixin, commands.AutoShardedBot):
         await Tortoise.generate_schemas(safe=True)
         self.pool = Tortoise.get_connection("default")._pool
 
+        for _, model in Tortoise.apps.get("models").items():
+            model.bot = self
+
         self.log.info("[DATABASE ] Connected Successfully!")
 
+    async def _init_redis(self):
         try:
             self.redis = await aioredis.create_redis_pool(address=config.REDIS_URI, password="myrediscluster")
             self.log.info("[REDIS ] Redis connected successfully!")
@@ -204,13 +267,15 @@ class PokeBest(RPCMixin, commands.AutoShardedBot):
             self.log.error("[REDIS ] Couldn't connect redis! Exiting...")
             quit()
 
+    async def _init_cache(self):
         self.cache: CacheManager = CacheManager(self)
         await self.cache.fill_cache()
         self.log.info("[CACHE ] Loaded successfully!")
 
-        for _, model in Tortoise.apps.get("models").items():
-            model.bot = self
+        self.prefixes.set_user(self.user.id)
+        await self.prefixes.load(self.cache.guilds.values())
 
+    async def _load_bot_config(self):
         _bot_configs: List[models.BotConfig] = await models.BotConfig.all()
         if _bot_configs.__len__() == 0:
             _bot_config: models.BotConfig = await models.BotConfig.create()
@@ -220,14 +285,6 @@ class PokeBest(RPCMixin, commands.AutoShardedBot):
 
         self.log.info("[CORE ] Bot's config loaded successfully!")
 
-        await self.rpc.initialize()
-
-        # Loading jsk here to save it from slash registration
-        self.load_extension("jishaku")
-
-        for _cog in __ready_cogs__:
-            self.load_extension(_cog)
-
     class Embed(discord.Embed):
         def __init__(self, **kwargs):
             # color = kwargs.pop("color", 0x02FAFA)
@@ -300,20 +357,30 @@ class PokeBest(RPCMixin, commands.AutoShardedBot):
         if ctx.command is None:
             return
 
-        if not (
-            ctx.command.name in CONCURRENCY_LIMITED_COMMANDS
-            or (ctx.command.root_parent and ctx.command.root_parent.name in CONCURRENCY_LIMITED_COMMANDS)
-        ):
+        _name: str = (ctx.command.root_parent or ctx.command).name
+        if not (ctx.command.name in CONCURRENCY_LIMITED_COMMANDS or _name in CONCURRENCY_LIMITED_COMMANDS):
             return await super().invoke(ctx)
 
         try:
-            async with RedisLock(self.redis, f"command:{ctx.author.id}", 60, 1):
+            async with self.locks.acquire(f"command:{ctx.author.id}", _name, expire=60, wait=1):
                 return await super().invoke(ctx)
         except LockTimeoutError:
             await ctx.reply("You are already engaged in a command, please wait for it to finish.")
 
     async def process_commands(self, message: discord.Message) -> None:
-        if message.author.bot:
+        if message.author.bot or not self.startup.is_ready:
+            return
+
+        self.message_stats["messages_seen"] += 1
+
+        # Plain chat never starts with a prefix and most of what does isn't a command,
+        # none of those need a context.
+        prefix: Optional[str] = self.prefixes.match(message)
+        if prefix is None:
+            return
+
+        _invoker: List[str] = message.content[len(prefix) :].split(None, 1)
+        if not _invoker or _invoker[0] not in self.all_commands:
             return
 
         ctx: commands.Context = await self.get_context(message, cls=commands.Context)
@@ -321,18 +388,22 @@ class PokeBest(RPCMixin, commands.AutoShardedBot):
         if ctx.command is None:
             return
 
+        self.message_stats["commands_parsed"] += 1
+
         bucket = self.spam_control.get_bucket(message)
         current = message.created_at.timestamp()
         retry_after = bucket.update_rate_limit(current)
         author_id = message.author.id
 
         if retry_after and author_id != self.owner_id:
+            self.message_stats["commands_rate_limited"] += 1
             self._auto_spam_count[author_id] += 1
             if self._auto_spam_count[author_id] >= 5:
                 mem: models.Member = await self.manager.fetch_member_info(author_id)
                 mem.suspended = True
                 mem.suspended_reason = "Auto-Spam control system blocked you."
                 await mem.save()
+                await self.suspensions.suspend(author_id)
 
                 del self._auto_spam_count[author_id]
                 await self.log_spammer(ctx, message, retry_after, autoblock=True)
@@ -356,8 +427,16 @@ class PokeBest(RPCMixin, commands.AutoShardedBot):
         return super().run(*args, **kwargs)
 
     async def close(self):
-        await self.session.close()
-        await self.pool.close()
-        self.redis.close()
-        await Tortoise.close_connections()
-        await super().close()
+        try:
+            # Pending message XP has to reach the database before the pool goes away.
+            if self.manager is not None:
+                await self.manager.xp.close()
+        finally:
+            self.battle_scenes.close()
+            await self.session.close()
+            await self.pubsub.close()
+
+            await self.pool.close()
+            self.redis.close()
+            await Tortoise.close_connections()
+            await super().close()
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, AsyncIterator, Counter, List, Optional, Set
+
+from discord.ext import commands
+from tortoise.expressions import F
+from tortoise.signals import post_delete, post_save
+from tortoise.transactions import in_transaction
+
+import logging
+
+import models
+
+if TYPE_CHECKING:
+    from core.bot import PokeBest
+
+log = logging.getLogger(__name__)
+
+__all__ = ["CatchContext", "CatchPipeline", "count_query"]
+
+_current: ContextVar[Optional[CatchContext]] = ContextVar("current_catch", default=None)
+
+
+def count_query(n: int = 1) -> None:
+    """Counts `n` database queries towards the catch being processed, if any."""
+    catch: Optional[CatchContext] = _current.get()
+    if catch is not None:
+        catch.queries += n
+
+
+class CatchContext:
+    """
+    One successful catch, shared by every `on_catch` listener.
+
+    Listeners change `member` in memory and report which fields they changed
+    with `touch`, or add to counters with `increment`, instead of fetching and
+    saving the member themselves.
+    """
+
+    __slots__ = ("ctx", "member", "pokemon", "fields", "increments", "queries")
+
+    def __init__(self, ctx: commands.Context) -> None:
+        self.ctx: commands.Context = ctx
+        self.member: Optional[models.Member] = None
+        self.pokemon: Optional[models.Pokemon] = None
+
+        self.fields: Set[str] = set()
+        self.increments: Counter[str] = Counter()
+        self.queries: int = 0
+
+    def touch(self, *fields: str) -> None:
+        self.fields.update(fields)
+
+    def increment(self, **deltas: int) -> None:
+        self.increments.update(deltas)
+
+
+class CatchPipeline:
+    """
+    Runs the `on_catch` listeners of a catch and writes every change they
+    made to the member with a single UPDATE once all of them are done.
+
+    Listeners run one after another since they all change the same member.
+    """
+
+    def __init__(self, bot: PokeBest) -> None:
+        self.bot: PokeBest = bot
+
+        # catches, queries
+        self.stats: Counter[str] = Counter()
+
+    @property
+    def queries_per_catch(self) -> float:
+        return self.stats["queries"] / self.stats["catches"] if self.stats["catches"] else 0.0
+
+    @asynccontextmanager
+    async def catch(self, ctx: commands.Context) -> AsyncIterator[CatchContext]:
+        """
+        Wraps the catch itself, its queries are counted from here on. The
+        listeners only run if the block set `member` and `pokemon` and didn't
+        raise.
+        """
+        catch: CatchContext = CatchContext(ctx)
+        token = _current.set(catch)
+
+        try:
+            yield catch
+
+            if catch.member is not None and catch.pokemon is not None:
+                await self._run_listeners(catch)
+                await self._commit(catch)
+
+        finally:
+            _current.reset(token)
+
+        self.stats["catches"] += 1
+        self.stats["queries"] += catch.queries
+
+    async def _run_listeners(self, catch: CatchContext) -> None:
+        listeners: List = self.bot.extra_events.get("on_catch", [])
+
+        for listener in listeners:
+            try:
+                await listener(catch)
+            except Exception:
+                log.exception("on_catch listener %s failed", listener.__qualname__)
+
+    async def _commit(self, catch: CatchContext) -> None:
+        fields: Set[str] = set(catch.fields)
+
+        for field, delta in catch.increments.items():
+            setattr(catch.member, field, F(field) + delta)
+            fields.add(field)
+
+        if fields:
+            async with in_transaction() as connection:
+                await catch.member.save(update_fields=sorted(fields), using_db=connection)
+
+
+# Saves and deletes of members and pokemon are counted through their signals, the
+# raw queries of the Database cog call `count_query` themselves.
+@post_save(models.Member, models.Pokemon)
+async def _count_save(sender, instance, created: bool, using_db, update_fields) -> None:
+    count_query()
+
+
+@post_delete(models.Member, models.Pokemon)
+async def _count_delete(sender, instance, using_db) -> None:
+    count_query()
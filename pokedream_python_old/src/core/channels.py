@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Counter, Dict, Iterable, List, Optional, Tuple, Union
+
+import asyncio
+import logging
+import time
+
+import discord
+
+import models
+
+if TYPE_CHECKING:
+    from core.bot import PokeBest
+
+log = logging.getLogger(__name__)
+
+__all__ = ["ChannelResolver"]
+
+Channel = Union[discord.abc.GuildChannel, discord.Thread]
+
+
+class ChannelResolver:
+    """
+    Resolves channel ids of spawn redirects and the normal spawn channels.
+
+    Channels missing from the gateway cache are fetched concurrently, with
+    concurrent lookups of the same id sharing one request. Channels that
+    couldn't be fetched are remembered for a while instead of being fetched
+    again on every spawn. Deleted redirect channels are removed from the
+    guild's settings.
+    """
+
+    # Seconds a failed lookup is remembered, by how it failed
+    GONE_TTL: float = 3600.0
+    ERROR_TTL: float = 60.0
+
+    def __init__(self, bot: PokeBest) -> None:
+        self.bot: PokeBest = bot
+
+        self._missing: Dict[int, float] = {}
+        self._inflight: Dict[int, asyncio.Future] = {}
+
+        # cached, fetched, missing, pruned
+        self.stats: Counter[str] = Counter()
+
+    def _remember_missing(self, channel_id: int, ttl: float) -> None:
+        self._missing[channel_id] = time.monotonic() + ttl
+
+    def _is_missing(self, channel_id: int) -> bool:
+        expires: Optional[float] = self._missing.get(channel_id)
+        if expires is None:
+            return False
+
+        if expires < time.monotonic():
+            del self._missing[channel_id]
+            return False
+        return True
+
+    async def _fetch(self, channel_id: int) -> Tuple[Optional[Channel], bool]:
+        try:
+            return await self.bot.fetch_channel(channel_id), False
+        except discord.NotFound:
+            self._remember_missing(channel_id, self.GONE_TTL)
+            return None, True
+        except discord.Forbidden:
+            self._remember_missing(channel_id, self.GONE_TTL)
+        except discord.HTTPException:
+            self._remember_missing(channel_id, self.ERROR_TTL)
+        return None, False
+
+    async def resolve(self, channel_id: int, guild: Optional[discord.Guild] = None) -> Tuple[Optional[Channel], bool]:
+        """
+        Returns the channel, or `None` if it can't be used right now. The flag
+        tells whether the channel was deleted.
+        """
+        channel: Optional[Channel] = (guild or self.bot).get_channel(channel_id)
+        if channel is not None:
+            self.stats["cached"] += 1
+            return channel, False
+
+        if self._is_missing(channel_id):
+            self.stats["missing"] += 1
+            return None, False
+
+        if channel_id in self._inflight:
+            return await asyncio.shield(self._inflight[channel_id])
+
+        self.stats["fetched"] += 1
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[channel_id] = future
+
+        try:
+            result: Tuple[Optional[Channel], bool] = await self._fetch(channel_id)
+            future.set_result(result)
+        except BaseException:
+            future.set_result((None, False))
+            raise
+        finally:
+            del self._inflight[channel_id]
+
+        return result
+
+    async def resolve_many(
+        self, channel_ids: Iterable[int], guild: Optional[discord.Guild] = None
+    ) -> Tuple[List[Channel], List[int]]:
+        """Resolves every id at once, returns the usable channels and the ids of deleted ones."""
+        channel_ids = list(dict.fromkeys(channel_ids))
+        results: List[Tuple[Optional[Channel], bool]] = await asyncio.gather(
+            *(self.resolve(channel_id, guild) for channel_id in channel_ids)
+        )
+
+        channels: List[Channel] = [channel for channel, _ in results if channel is not None]
+        gone: List[int] = [channel_id for channel_id, (_, deleted) in zip(channel_ids, results) if deleted]
+        return channels, gone
+
+    async def redirects(self, guild: discord.Guild) -> List[Channel]:
+        """Returns the usable redirect channels of the guild, dropping deleted ones from its settings."""
+        try:
+            _guild: models.Guild = self.bot.cache.guilds[f"{guild.id}"]
+        except (KeyError, AttributeError):
+            return []
+
+        if not _guild.channels:
+            return []
+
+        channels, gone = await self.resolve_many(_guild.channels, guild)
+        if gone:
+            await self.prune(_guild, gone)
+        return channels
+
+    @staticmethod
+    def _prune_query() -> str:
+        _table: str = models.Guild._meta.db_table
+        _pk: str = models.Guild._meta.db_pk_column
+        _channels: str = models.Guild._meta.fields_db_projection["channels"]
+
+        return (
+            f'UPDATE "{_table}" SET "{_channels}" = '
+            f'ARRAY(SELECT c FROM unnest("{_channels}") AS c WHERE c <> ALL($2::bigint[])) '
+            f'WHERE "{_pk}" = $1;'
+        )
+
+    async def prune(self, guild: models.Guild, channel_ids: List[int]) -> None:
+        try:
+            await self.bot.pool.execute(self._prune_query(), guild.id, channel_ids)
+        except Exception:
+            log.exception("[CHANNELS ] Couldn't prune redirects %s of guild %s", channel_ids, guild.id)
+            return
+
+        guild.channels = [channel_id for channel_id in guild.channels if channel_id not in channel_ids]
+        self.stats["pruned"] += len(channel_ids)
+        log.info("[CHANNELS ] Pruned deleted redirect(s) %s of guild %s", channel_ids, guild.id)
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from tortoise.signals import post_delete, post_save
+
+import asyncio
+import time
+
+import models
+
+if TYPE_CHECKING:
+    from core.bot import PokeBest
+
+__all__ = ["CollectionStats", "CollectionStatsCache"]
+
+
+@dataclass
+class CollectionStats:
+    total: int = 0
+    shiny: int = 0
+    favorites: int = 0
+    max_idx: int = 0
+    species: Dict[int, int] = field(default_factory=dict)
+
+
+class CollectionStatsCache:
+    """
+    Per member collection statistics computed with aggregate queries.
+
+    Entries are dropped whenever one of the member's pokemon is saved or
+    deleted (catch, release, trade...). Ownership changes made through a
+    queryset `update` can't be seen by the signals, so entries also expire
+    after `ttl` seconds. At most `max_size` members are kept, the least
+    recently used ones are evicted first.
+    """
+
+    def __init__(self, bot: PokeBest, *, ttl: float = 300.0, max_size: int = 5000) -> None:
+        self.bot: PokeBest = bot
+        self.ttl: float = ttl
+        self.max_size: int = max_size
+
+        self._cached: "OrderedDict[int, Tuple[float, CollectionStats]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return self._cached.__len__()
+
+    @staticmethod
+    def _queries() -> Tuple[str, str]:
+        _projection: Dict[str, str] = models.Pokemon._meta.fields_db_projection
+        _table: str = models.Pokemon._meta.db_table
+
+        owner, shiny, favorite, idx, species = (
+            _projection[f] for f in ("owner_id", "shiny", "favorite", "idx", "species_id")
+        )
+
+        totals: str = (
+            f'SELECT COUNT(*) AS total, COUNT(*) FILTER (WHERE "{shiny}") AS shiny, '
+            f'COUNT(*) FILTER (WHERE "{favorite}") AS favorites, COALESCE(MAX("{idx}"), 0) AS max_idx '
+            f'FROM "{_table}" WHERE "{owner}" = $1;'
+        )
+        per_species: str = f'SELECT "{species}", COUNT(*) FROM "{_table}" WHERE "{owner}" = $1 GROUP BY "{species}";'
+
+        return totals, per_species
+
+    async def get(self, member_id: int) -> CollectionStats:
+        try:
+            expires, stats = self._cached[member_id]
+        except KeyError:
+            pass
+        else:
+            if expires > time.monotonic():
+                self._cached.move_to_end(member_id)
+                return stats
+            del self._cached[member_id]
+
+        totals_query, species_query = self._queries()
+        totals, rows = await asyncio.gather(
+            self.bot.pool.fetchrow(totals_query, member_id),
+            self.bot.pool.fetch(species_query, member_id),
+        )
+
+        stats = CollectionStats(**dict(totals), species={row[0]: row[1] for row in rows})
+        self._cached[member_id] = (time.monotonic() + self.ttl, stats)
+        self._cached.move_to_end(member_id)
+
+        while self._cached.__len__() > self.max_size:
+            self._cached.popitem(last=False)
+
+        return stats
+
+    def invalidate(self, member_id: Optional[int]) -> None:
+        self._cached.pop(member_id, None)
+
+
+def _get_cache(sender) -> Optional[CollectionStatsCache]:
+    bot: Optional[PokeBest] = getattr(sender, "bot", None)
+    if bot is None or bot.manager is None:
+        return None
+    return bot.manager.collection_stats
+
+
+@post_save(models.Pokemon)
+async def _pokemon_post_save(sender, instance: models.Pokemon, created: bool, using_db, update_fields) -> None:
+    cache: Optional[CollectionStatsCache] = _get_cache(sender)
+    if cache is not None:
+        cache.invalidate(instance.owner_id)
+
+
+@post_delete(models.Pokemon)
+async def _pokemon_post_delete(sender, instance: models.Pokemon, using_db) -> None:
+    cache: Optional[CollectionStatsCache] = _get_cache(sender)
+    if cache is not None:
+        cache.invalidate(instance.owner_id)
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Tuple
+
+from discord.ext import commands
+from rich.table import Table
+
+import time
+
+if TYPE_CHECKING:
+    from core.bot import PokeBest
+
+__all__ = ["ExtensionLoader"]
+
+
+class ExtensionLoader:
+    """
+    Loads extensions while recording how long each one took to import and
+    set up.
+
+    Extensions can also be deferred, they're then registered as prefix-only
+    stub commands and the real extension is loaded the first time one of
+    those commands is used.
+    """
+
+    def __init__(self, bot: PokeBest) -> None:
+        self.bot: PokeBest = bot
+
+        self.timings: Dict[str, float] = {}
+        self.deferred: Dict[str, Tuple[str, ...]] = {}
+
+    def load(self, name: str) -> None:
+        t1 = time.perf_counter()
+        self.bot.load_extension(name)
+        self.timings[name] = time.perf_counter() - t1
+
+        self.bot.log.info("[COG ] Loaded %s in %.2f ms" % (name, self.timings[name] * 1000))
+
+    def defer(self, name: str, command_names: Tuple[str, ...]) -> None:
+        self.deferred[name] = command_names
+        for command_name in command_names:
+            self.bot.add_command(self._stub(name, command_name))
+
+        self.bot.log.info("[COG ] Deferred %s" % name)
+
+    def load_deferred(self, name: str) -> None:
+        if name not in self.deferred:
+            return
+
+        for command_name in self.deferred.pop(name):
+            self.bot.remove_command(command_name)
+        self.load(name)
+
+    def _stub(self, extension: str, name: str) -> commands.Command:
+        async def stub(ctx: commands.Context):
+            self.load_deferred(extension)
+
+            # Resolve the message again now that the real command (and its subcommands) exist.
+            _ctx: commands.Context = await self.bot.get_context(ctx.message, cls=commands.Context)
+            if _ctx.command is not None:
+                await self.bot.invoke(_ctx)
+
+        return commands.Command(stub, name=name, slash_command=False)
+
+    def report(self) -> Table:
+        table = Table(show_header=True, header_style="bold magenta")
+        table.add_column("Extension")
+        table.add_column("Load time")
+
+        for name, timing in sorted(self.timings.items(), key=lambda item: item[1], reverse=True):
+            table.add_row(name, f"{timing * 1000:.2f} ms")
+        for name in self.deferred:
+            table.add_row(name, "deferred")
+
+        table.add_row("total", f"{sum(self.timings.values()) * 1000:.2f} ms")
+        return table
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import asyncio
+import heapq
+import itertools
+
+import discord
+
+if TYPE_CHECKING:
+    from core.bot import PokeBest
+
+__all__ = ["GuessRouter"]
+
+
+class _Pending:
+    __slots__ = ("channel_id", "author_id", "species_id", "future")
+
+    def __init__(self, channel_id: int, author_id: int, species_id: int, future: asyncio.Future) -> None:
+        self.channel_id: int = channel_id
+        self.author_id: int = author_id
+        self.species_id: int = species_id
+        self.future: asyncio.Future = future
+
+
+class GuessRouter:
+    """
+    Pending incense guesses keyed by channel.
+
+    Replaces one `bot.wait_for("message")` per incense spawn, whose checks
+    discord.py runs against every message the bot sees: `feed` only looks at
+    the guesses waiting in the message's channel. Timeouts share one timer
+    handle armed for the earliest deadline.
+    """
+
+    def __init__(self, bot: PokeBest) -> None:
+        self.bot: PokeBest = bot
+
+        self._channels: Dict[int, List[_Pending]] = {}
+        self._deadlines: List[Tuple[float, int, _Pending]] = []
+        self._counter = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def __len__(self) -> int:
+        return sum(map(len, self._channels.values()))
+
+    async def wait(self, channel_id: int, author_id: int, species_id: int, *, timeout: float) -> discord.Message:
+        """
+        Waits for `author_id` to name `species_id` in the channel and returns
+        that message, raises `asyncio.TimeoutError` like `wait_for` otherwise.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        pending: _Pending = _Pending(channel_id, author_id, species_id, loop.create_future())
+
+        self._channels.setdefault(channel_id, []).append(pending)
+
+        deadline: float = loop.time() + timeout
+        heapq.heappush(self._deadlines, (deadline, next(self._counter), pending))
+        if self._deadlines[0][2] is pending:
+            self._arm(loop)
+
+        try:
+            return await pending.future
+        finally:
+            self._discard(pending)
+
+    def feed(self, message: discord.Message) -> None:
+        waiting: Optional[List[_Pending]] = self._channels.get(message.channel.id)
+        if not waiting:
+            return
+
+        species_id: Optional[int] = None
+        for pending in waiting:
+            if pending.author_id != message.author.id or pending.future.done():
+                continue
+
+            if species_id is None:
+                species_id = self.bot.species.lookup(message.content)
+                if species_id is None:
+                    return
+
+            if pending.species_id == species_id:
+                pending.future.set_result(message)
+
+    def _discard(self, pending: _Pending) -> None:
+        waiting: Optional[List[_Pending]] = self._channels.get(pending.channel_id)
+        if waiting is None:
+            return
+
+        try:
+            waiting.remove(pending)
+        except ValueError:
+            pass
+
+        if not waiting:
+            del self._channels[pending.channel_id]
+
+    def _arm(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if self._deadlines:
+            self._timer = loop.call_at(self._deadlines[0][0], self._expire, loop)
+
+    def _expire(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._timer = None
+        now: float = loop.time()
+
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _, _, pending = heapq.heappop(self._deadlines)
+            if not pending.future.done():
+                pending.future.set_exception(asyncio.TimeoutError())
+
+        self._arm(loop)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Set
+
+import logging
+
+if TYPE_CHECKING:
+    from core.bot import PokeBest
+
+log = logging.getLogger(__name__)
+
+__all__ = ["IncenseIndex"]
+
+
+class IncenseIndex:
+    """
+    In-memory set of members with an active incense.
+
+    Remaining spawns still live in the `db:incense` redis hash, this only
+    mirrors who is in it so `on_message` doesn't have to ask redis about every
+    author. Buying and running out of incense are broadcasted to the other
+    processes.
+    """
+
+    KEY: str = "db:incense"
+    CHANNEL: str = "incense"
+
+    def __init__(self, bot: PokeBest) -> None:
+        self.bot: PokeBest = bot
+        self._holders: Set[int] = set()
+
+    def __contains__(self, member_id: int) -> bool:
+        return member_id in self._holders
+
+    def __len__(self) -> int:
+        return self._holders.__len__()
+
+    async def load(self) -> None:
+        _ids: List[str] = await self.bot.redis.hkeys(self.KEY, encoding="utf-8")
+        self._holders = {int(_id) for _id in _ids}
+
+        await self.bot.pubsub.subscribe(self.CHANNEL, self._on_message)
+        log.info("[INCENSE ] Loaded %s incense holder(s)", len(self._holders))
+
+    async def add(self, member_id: int, spawns: int) -> None:
+        await self.bot.redis.hset(self.KEY, member_id, spawns)
+
+        self._holders.add(member_id)
+        await self.bot.pubsub.publish(self.CHANNEL, f"+{member_id}")
+
+    async def use(self, member_id: int) -> int:
+        """Uses one spawn of the member's incense and returns how many are left."""
+        remaining: int = await self.bot.redis.hincrby(self.KEY, member_id, -1)
+        if remaining > 0:
+            return remaining
+
+        await self.bot.redis.hdel(self.KEY, member_id)
+
+        self._holders.discard(member_id)
+        await self.bot.pubsub.publish(self.CHANNEL, f"-{member_id}")
+
+        return 0
+
+    async def _on_message(self, payload: str) -> None:
+        op, member_id = payload[0], int(payload[1:])
+
+        if op == "+":
+            self._holders.add(member_id)
+        else:
+            self._holders.discard(member_id)
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, AsyncIterator, Counter, Dict
+
+import asyncio
+import time
+
+from aioredis_lock import LockTimeoutError, RedisLock
+
+if TYPE_CHECKING:
+    from core.bot import PokeBest
+
+__all__ = ["LocalLockBackend", "RedisLockBackend", "LockManager", "LockStats", "LockTimeoutError"]
+
+
+class LocalLockBackend:
+    """
+    Per key `asyncio.Lock` table, enough when a single process owns every
+    shard. Locks are dropped as soon as nobody holds or waits for them.
+
+    Like redis locks, a lock is a lease: after `expire` seconds it is handed
+    to the next waiter even if its holder is still running, and the late
+    holder's release is then ignored.
+    """
+
+    def __init__(self) -> None:
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._users: Counter[str] = Counter()
+        self._holders: Dict[str, object] = {}
+
+        self.expired: int = 0
+
+    def __len__(self) -> int:
+        return self._locks.__len__()
+
+    @staticmethod
+    async def _acquire(key: str, lock: asyncio.Lock, wait: float) -> None:
+        acquire: asyncio.Future = asyncio.ensure_future(lock.acquire())
+
+        try:
+            await asyncio.wait_for(asyncio.shield(acquire), wait)
+        except BaseException as e:
+            # Timed out or cancelled, the lock may still have been granted in the
+            # meantime. It's given back right away then, instead of leaking.
+            acquire.cancel()
+            acquire.add_done_callback(
+                lambda f: lock.release() if not f.cancelled() and f.exception() is None else None
+            )
+
+            if isinstance(e, asyncio.TimeoutError):
+                raise LockTimeoutError(key) from None
+            raise
+
+    def _release(self, key: str, token: object) -> None:
+        if self._holders.get(key) is token:
+            del self._holders[key]
+            self._locks[key].release()
+
+    def _expire(self, key: str, token: object) -> None:
+        if self._holders.get(key) is token:
+            self.expired += 1
+            self._release(key, token)
+
+    @asynccontextmanager
+    async def hold(self, key: str, expire: float, wait: float) -> AsyncIterator[None]:
+        lock: asyncio.Lock = self._locks.setdefault(key, asyncio.Lock())
+        self._users[key] += 1
+
+        try:
+            await self._acquire(key, lock, wait)
+
+            token: object = object()
+            self._holders[key] = token
+            lease: asyncio.TimerHandle = asyncio.get_running_loop().call_later(expire, self._expire, key, token)
+
+            try:
+                yield
+            finally:
+                lease.cancel()
+                self._release(key, token)
+
+        finally:
+            self._users[key] -= 1
+            if self._users[key] <= 0:
+                del self._users[key]
+                del self._locks[key]
+
+
+class RedisLockBackend:
+    """Redis backed locks, shared by every process."""
+
+    def __init__(self, bot: PokeBest) -> None:
+        self.bot: PokeBest = bot
+
+    def __len__(self) -> int:
+        return 0
+
+    def hold(self, key: str, expire: float, wait: float) -> RedisLock:
+        return RedisLock(self.bot.redis, key, expire, wait)
+
+
+@dataclass
+class LockStats:
+    acquired: int = 0
+    contended: int = 0
+    timeouts: int = 0
+    wait_time: float = 0.0
+
+    @property
+    def average_wait(self) -> float:
+        return self.wait_time / self.acquired if self.acquired else 0.0
+
+
+class LockManager:
+    """
+    Command lock manager with pluggable backend and per command metrics.
+
+    An acquisition counts as contended when it had to wait longer than
+    `CONTENTION_THRESHOLD` seconds, which is well above an uncontended redis
+    round trip.
+    """
+
+    CONTENTION_THRESHOLD: float = 0.005
+
+    def __init__(self, backend) -> None:
+        self.backend = backend
+        self.stats: Dict[str, LockStats] = {}
+
+    @property
+    def distributed(self) -> bool:
+        return isinstance(self.backend, RedisLockBackend)
+
+    @asynccontextmanager
+    async def acquire(self, key: str, name: str, *, expire: float = 60, wait: float = 1) -> AsyncIterator[None]:
+        stats: LockStats = self.stats.setdefault(name, LockStats())
+        entered: bool = False
+        t1 = time.perf_counter()
+
+        try:
+            async with self.backend.hold(key, expire, wait):
+                waited: float = time.perf_counter() - t1
+                entered = True
+
+                stats.acquired += 1
+                stats.wait_time += waited
+                stats.contended += waited > self.CONTENTION_THRESHOLD
+
+                yield
+
+        except LockTimeoutError:
+            if not entered:
+                stats.timeouts += 1
+            raise
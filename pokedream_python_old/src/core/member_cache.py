@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+from collections import Counter, OrderedDict
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Union
+
+from tortoise.signals import post_delete, post_save
+
+import logging
+import pickle
+import time
+
+import models
+
+from .catch import count_query
+
+if TYPE_CHECKING:
+    from core.bot import PokeBest
+
+log = logging.getLogger(__name__)
+
+__all__ = ["MemberCache"]
+
+# Marker stored for ids which have no `Member` row yet, so commands from
+# users who never picked a starter don't go to postgres every time.
+_MISSING: bytes = b""
+
+
+class MemberCache:
+    """
+    Two tier cache for `models.Member` rows.
+
+    The first tier is an in-process LRU with a short TTL, the second one is
+    redis (shared by every process). Entries are stored pickled so every
+    caller gets its own `Member` instance and can mutate it freely before
+    calling `save()`.
+
+    Every `Member.save()` and delete invalidates the cache through the
+    tortoise `post_save`/`post_delete` signals, in every process over pubsub.
+    Saved instances are never cached themselves, they may be stale copies
+    whose save overwrote fields updated atomically elsewhere. Queryset updates
+    (`Member.filter(...).update(...)`) bypass the signals and must call
+    `invalidate` themselves.
+
+    A row read from the database is only cached if the member wasn't
+    invalidated while it was being read.
+    """
+
+    REDIS_KEY: str = "db:member:{}"
+    CHANNEL: str = "member"
+
+    def __init__(
+        self,
+        bot: PokeBest,
+        *,
+        max_size: int = 20000,
+        local_ttl: float = 30.0,
+        redis_ttl: int = 600,
+    ) -> None:
+        self.bot: PokeBest = bot
+
+        self.max_size: int = max_size
+        self.local_ttl: float = local_ttl
+        self.redis_ttl: int = redis_ttl
+
+        self._local: "OrderedDict[int, Tuple[float, bytes]]" = OrderedDict()
+        # Misses being read from the database per member, and how often each
+        # of those members was invalidated in the meantime
+        self._reading: Counter = Counter()
+        self._versions: Dict[int, int] = {}
+
+        self.stats: Counter = Counter()
+
+    def __len__(self) -> int:
+        return self._local.__len__()
+
+    @property
+    def redis(self):
+        return getattr(self.bot, "redis", None)
+
+    async def load(self) -> None:
+        await self.bot.pubsub.subscribe(self.CHANNEL, self._on_message)
+
+    @property
+    def hit_ratio(self) -> float:
+        hits: int = self.stats["local_hits"] + self.stats["redis_hits"]
+        total: int = hits + self.stats["misses"]
+        return hits / total if total else 0.0
+
+    def _get_local(self, member_id: int) -> Optional[bytes]:
+        try:
+            expires, payload = self._local[member_id]
+        except KeyError:
+            return None
+
+        if expires < time.monotonic():
+            del self._local[member_id]
+            return None
+
+        self._local.move_to_end(member_id)
+        return payload
+
+    def _set_local(self, member_id: int, payload: bytes) -> None:
+        self._local[member_id] = (time.monotonic() + self.local_ttl, payload)
+        self._local.move_to_end(member_id)
+
+        while self._local.__len__() > self.max_size:
+            self._local.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    @staticmethod
+    def _load(payload: bytes) -> Optional[models.Member]:
+        if payload == _MISSING:
+            return None
+        return pickle.loads(payload)
+
+    async def get(self, member_id: int) -> Union[None, models.Member]:
+        payload: Optional[bytes] = self._get_local(member_id)
+        if payload is not None:
+            self.stats["local_hits"] += 1
+            return self._load(payload)
+
+        if self.redis is not None:
+            payload = await self.redis.get(self.REDIS_KEY.format(member_id))
+            if payload is not None:
+                self.stats["redis_hits"] += 1
+                self._set_local(member_id, payload)
+                return self._load(payload)
+
+        self.stats["misses"] += 1
+        self._reading[member_id] += 1
+        version: int = self._versions.get(member_id, 0)
+
+        try:
+            member: Optional[models.Member] = await models.Member.get_or_none(id=member_id)
+            count_query()
+        finally:
+            stale: bool = self._versions.get(member_id, 0) != version
+
+            self._reading[member_id] -= 1
+            if self._reading[member_id] <= 0:
+                del self._reading[member_id]
+                self._versions.pop(member_id, None)
+
+        if stale:
+            self.stats["stale_reads"] += 1
+        elif member is None:
+            # Negative entries stay local only, `Member.create` invalidates them.
+            self._set_local(member_id, _MISSING)
+        else:
+            await self.put(member)
+
+        return member
+
+    async def put(self, member: models.Member) -> None:
+        payload: bytes = pickle.dumps(member)
+        self._set_local(member.id, payload)
+
+        if self.redis is not None:
+            await self.redis.set(self.REDIS_KEY.format(member.id), payload, expire=self.redis_ttl)
+
+    def _drop(self, member_id: int) -> None:
+        self._local.pop(member_id, None)
+        if member_id in self._reading:
+            self._versions[member_id] = self._versions.get(member_id, 0) + 1
+
+    async def invalidate(self, member_id: int) -> None:
+        self._drop(member_id)
+        self.stats["invalidations"] += 1
+
+        if self.redis is not None:
+            await self.redis.delete(self.REDIS_KEY.format(member_id))
+            await self.bot.pubsub.publish(self.CHANNEL, f"{member_id}")
+
+    async def _on_message(self, payload: str) -> None:
+        member_id: int = int(payload)
+        self._drop(member_id)
+
+        # A miss of this process may have put the row back into redis after the sender deleted it.
+        await self.redis.delete(self.REDIS_KEY.format(member_id))
+
+    def clear(self) -> None:
+        self._local.clear()
+
+
+def _get_cache(sender) -> Optional[MemberCache]:
+    bot: Optional[PokeBest] = getattr(sender, "bot", None)
+    if bot is None or bot.manager is None:
+        return None
+    return bot.manager.member_cache
+
+
+@post_save(models.Member)
+async def _member_post_save(sender, instance: models.Member, created: bool, using_db, update_fields) -> None:
+    cache: Optional[MemberCache] = _get_cache(sender)
+    if cache is not None:
+        await cache.invalidate(instance.id)
+
+
+@post_delete(models.Member)
+async def _member_post_delete(sender, instance: models.Member, using_db) -> None:
+    cache: Optional[MemberCache] = _get_cache(sender)
+    if cache is not None:
+        await cache.invalidate(instance.id)
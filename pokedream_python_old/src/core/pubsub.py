@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List
+
+import asyncio
+import logging
+
+if TYPE_CHECKING:
+    from core.bot import PokeBest
+
+log = logging.getLogger(__name__)
+
+__all__ = ["PubSub"]
+
+Handler = Callable[[str], Awaitable[None]]
+
+
+class PubSub:
+    """
+    Tiny wrapper over redis pub/sub used to keep the in-process caches of
+    every shard process in sync.
+
+    Handlers receive the raw string payload. Messages published by this
+    process are delivered back to it as well, so handlers must be idempotent.
+    """
+
+    CHANNEL_PREFIX: str = "pokebest:"
+
+    def __init__(self, bot: PokeBest) -> None:
+        self.bot: PokeBest = bot
+
+        self._handlers: Dict[str, List[Handler]] = {}
+        self._readers: Dict[str, asyncio.Task] = {}
+
+    async def subscribe(self, name: str, handler: Handler) -> None:
+        handlers: List[Handler] = self._handlers.setdefault(name, [])
+        if handler not in handlers:
+            handlers.append(handler)
+
+        if name in self._readers:
+            return
+
+        (channel,) = await self.bot.redis.subscribe(self.CHANNEL_PREFIX + name)
+        self._readers[name] = self.bot.loop.create_task(self._reader(name, channel))
+
+    async def publish(self, name: str, payload: str) -> None:
+        await self.bot.redis.publish(self.CHANNEL_PREFIX + name, payload)
+
+    async def _reader(self, name: str, channel) -> None:
+        while await channel.wait_message():
+            payload: str = await channel.get(encoding="utf-8")
+
+            for handler in self._handlers.get(name, []):
+                try:
+                    await handler(payload)
+                except Exception:
+                    log.exception("[PUBSUB ] Handler for %s failed on %r", name, payload)
+
+    async def close(self) -> None:
+        for name, task in self._readers.items():
+            task.cancel()
+
+        if self._readers:
+            await self.bot.redis.unsubscribe(*(self.CHANNEL_PREFIX + name for name in self._readers))
+
+        self._readers.clear()
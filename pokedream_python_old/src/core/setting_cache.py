@@ -1,29 +1,67 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple
 import discord
 import models
 
+if TYPE_CHECKING:
+    from core.bot import PokeBest
+
 
 class PrefixManager:
-    def __init__(self):
-        self._cached: Dict[Optional[int], List[str]] = {}
+    """
+    Precomputed prefixes of every guild.
+
+    Each guild maps to an immutable tuple holding the lower and upper case
+    prefix plus both mention forms of the bot, so resolving the prefixes of a
+    message is a single int keyed dict lookup. Changes made by `setprefix` in
+    any process are broadcasted over pub/sub.
+    """
+
+    DEFAULT_PREFIX: str = "p!"
+    CHANNEL: str = "prefixes"
+
+    def __init__(self, bot: PokeBest):
+        self.bot: PokeBest = bot
+
+        self._cached: Dict[int, Tuple[str, ...]] = {}
+        self._mentions: Tuple[str, ...] = ()
+        self._default: Tuple[str, ...] = self._build(self.DEFAULT_PREFIX)
+
+    def _build(self, prefix: Optional[str]) -> Tuple[str, ...]:
+        prefix = prefix or self.DEFAULT_PREFIX
+        return tuple(dict.fromkeys((prefix.lower(), prefix.upper()) + self._mentions))
+
+    def set_user(self, user_id: int) -> None:
+        self._mentions = (f"<@{user_id}> ", f"<@!{user_id}> ")
+        self._default = self._build(self.DEFAULT_PREFIX)
+        self._cached = {gid: self._build(prefixes[0]) for gid, prefixes in self._cached.items()}
 
-    async def get_prefixes(self, guild: Optional[discord.Guild] = None) -> List[str]:
-        ret: List[str]
+    async def load(self, guilds: Iterable[models.Guild]) -> None:
+        self._cached = {guild.id: self._build(guild.prefix) for guild in guilds}
+        await self.bot.pubsub.subscribe(self.CHANNEL, self._on_message)
 
-        gid: Optional[int] = guild.id or None
+    def get_prefixes(self, guild_id: Optional[int] = None) -> Tuple[str, ...]:
+        if guild_id is None:
+            return self._default
+        return self._cached.get(guild_id, self._default)
 
-        if gid in self._cached:
-            ret = self._cached[gid].copy()
+    async def set_prefix(self, guild_id: int, prefix: str) -> None:
+        self._cached[guild_id] = self._build(prefix)
+        await self.bot.pubsub.publish(self.CHANNEL, f"{guild_id}:{prefix}")
 
-        elif gid is not None:
-            _guild_model: Optional[models.Guild] = await models.Guild.get_or_none(id=guild.id)
+    def match(self, message: discord.Message) -> Optional[str]:
+        """Returns the prefix the message starts with, or `None` if it can't be a command."""
+        content: str = message.content
+        prefixes: Tuple[str, ...] = self.get_prefixes(message.guild.id if message.guild is not None else None)
 
-            ret = ["p!", "P!"] if _guild_model is None else list(_guild_model.prefix)
-            self._cached[gid] = ret.copy()
+        if not content.startswith(prefixes):
+            return None
 
-        return ret
+        for prefix in prefixes:
+            if content.startswith(prefix):
+                return prefix
 
-    async def set_prefixes(self):
-        ...
+    async def _on_message(self, payload: str) -> None:
+        guild_id, prefix = payload.split(":", 1)
+        self._cached[int(guild_id)] = self._build(prefix)
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Counter, Dict, List, Optional, Tuple
+
+import aiohttp
+import asyncio
+import hashlib
+import json
+import logging
+import time
+
+from data import data
+from utils.constants import TYPES
+from utils.methods import write_fp
+
+if TYPE_CHECKING:
+    from core.bot import PokeBest
+
+log = logging.getLogger(__name__)
+
+__all__ = ["SpawnImageCache"]
+
+Key = Tuple[str, int]
+
+
+class SpawnImageCache:
+    """
+    Spawn images keyed by `(biome, species_id)`, spawns don't show whether
+    they are shiny.
+
+    Images are looked up in an in-memory LRU first, then in a content
+    addressed store on disk (`objects/<sha256>` plus one small `keys/<key>`
+    file pointing to it, so identical images are stored once) and only then
+    fetched. The image server gets `timeout` seconds before falling back to
+    the plain sprite, concurrent spawns of a missing image share a single
+    fetch.
+
+    Sprite fallbacks are only kept in memory for `fallback_ttl` seconds and
+    never written to disk, the image server is asked again once they expire.
+    """
+
+    ABUNDANCE_PATH: Path = Path("data/json/abundance.json")
+
+    def __init__(
+        self,
+        bot: PokeBest,
+        *,
+        directory: Path = Path("cache/spawn_images"),
+        max_size: int = 256,
+        timeout: float = 2.0,
+        fallback_ttl: float = 300.0,
+    ) -> None:
+        self.bot: PokeBest = bot
+        self.directory: Path = directory
+        self.max_size: int = max_size
+        self.timeout: aiohttp.ClientTimeout = aiohttp.ClientTimeout(total=timeout)
+        self.fallback_ttl: float = fallback_ttl
+
+        self._memory: OrderedDict[Key, bytes] = OrderedDict()
+        # Keys of the fallbacks in `_memory` and when they expire
+        self._fallbacks: Dict[Key, float] = {}
+        self._inflight: Dict[Key, asyncio.Future] = {}
+        self._prewarm_task: Optional[asyncio.Task] = None
+
+        # memory_hits, disk_hits, misses, fallbacks, failures, prewarmed
+        self.stats: Counter = Counter()
+
+    def __len__(self) -> int:
+        return self._memory.__len__()
+
+    @property
+    def hit_ratio(self) -> float:
+        hits: int = self.stats["memory_hits"] + self.stats["disk_hits"]
+        total: int = hits + self.stats["misses"]
+        return hits / total if total else 0.0
+
+    def _key_path(self, key: Key) -> Path:
+        biome, species_id = key
+        return self.directory / "keys" / f"{biome}-{species_id}"
+
+    def _read(self, key: Key) -> Optional[bytes]:
+        try:
+            digest: str = self._key_path(key).read_text()
+            return (self.directory / "objects" / digest).read_bytes()
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, key: Key, image: bytes) -> None:
+        digest: str = hashlib.sha256(image).hexdigest()
+        obj: Path = self.directory / "objects" / digest
+
+        obj.parent.mkdir(parents=True, exist_ok=True)
+        if not obj.exists():
+            obj.write_bytes(image)
+
+        self._key_path(key).parent.mkdir(parents=True, exist_ok=True)
+        self._key_path(key).write_text(digest)
+
+    def _remember(self, key: Key, image: bytes, fallback: bool = False) -> None:
+        self._memory[key] = image
+        self._memory.move_to_end(key)
+
+        if fallback:
+            self._fallbacks[key] = time.monotonic() + self.fallback_ttl
+        else:
+            self._fallbacks.pop(key, None)
+
+        while self._memory.__len__() > self.max_size:
+            evicted, _ = self._memory.popitem(last=False)
+            self._fallbacks.pop(evicted, None)
+
+    async def get(self, biome: str, species_id: int) -> Optional[bytes]:
+        key: Key = (biome.lower(), species_id)
+
+        if key in self._fallbacks and self._fallbacks[key] < time.monotonic():
+            del self._fallbacks[key]
+            self._memory.pop(key, None)
+
+        image: Optional[bytes] = self._memory.get(key)
+        if image is not None:
+            self._memory.move_to_end(key)
+            self.stats["memory_hits"] += 1
+            return image
+
+        if key in self._inflight:
+            return await asyncio.shield(self._inflight[key])
+
+        future: asyncio.Future = self.bot.loop.create_future()
+        self._inflight[key] = future
+
+        fallback: bool = False
+        try:
+            image = await self.bot.loop.run_in_executor(None, self._read, key)
+            if image is not None:
+                self.stats["disk_hits"] += 1
+            else:
+                self.stats["misses"] += 1
+                image, fallback = await self._fetch(key)
+
+        except Exception:
+            # The spawn goes without an image rather than not at all.
+            log.exception("[SPAWN IMAGES ] Couldn't get the image of %s", key)
+            self.stats["failures"] += 1
+            image = None
+
+        finally:
+            if image is not None:
+                self._remember(key, image, fallback)
+            future.set_result(image)
+            del self._inflight[key]
+
+        return image
+
+    async def _download(self, url: str) -> Optional[bytes]:
+        try:
+            async with self.bot.session.get(url, timeout=self.timeout) as resp:
+                if resp.status == 200:
+                    return await resp.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            pass
+        return None
+
+    async def _fetch(self, key: Key) -> Tuple[Optional[bytes], bool]:
+        """Returns the image and whether it is the sprite fallback, which isn't stored on disk."""
+        biome, species_id = key
+        _species: dict = data.species_by_num(species_id)
+
+        fallback: bool = False
+        raw: Optional[bytes] = await self._download(f"{self.bot.config.IMAGE_SERVER_URL}spawn/{biome}/{species_id}")
+        if raw is None:
+            self.stats["fallbacks"] += 1
+            fallback = True
+            raw = await self._download(_species["sprites"]["normal"])
+
+        if raw is None:
+            self.stats["failures"] += 1
+            return None, fallback
+
+        try:
+            image: bytes = (await self.bot.loop.run_in_executor(None, write_fp, raw)).getvalue()
+        except Exception:
+            log.warning("[SPAWN IMAGES ] Couldn't decode the image of %s", key, exc_info=True)
+            self.stats["failures"] += 1
+            return None, fallback
+
+        if not fallback:
+            try:
+                await self.bot.loop.run_in_executor(None, self._write, key, image)
+            except OSError:
+                log.warning("[SPAWN IMAGES ] Couldn't store the image of %s", key, exc_info=True)
+
+        return image, fallback
+
+    def start_prewarm(self, count: int = 100, concurrency: int = 4) -> None:
+        if self._prewarm_task is None or self._prewarm_task.done():
+            self._prewarm_task = asyncio.create_task(self.prewarm(count, concurrency))
+
+    async def prewarm(self, count: int = 100, concurrency: int = 4) -> None:
+        """Makes sure the `count` most abundant species are on disk for each of their biomes."""
+        with open(self.ABUNDANCE_PATH) as f:
+            abundance: List[dict] = json.load(f)
+
+        _common: List[dict] = sorted(abundance, key=lambda entry: entry["abundance"], reverse=True)[:count]
+        keys: List[Key] = [
+            (TYPES[idx].lower(), entry["species_id"])
+            for entry in _common
+            for idx in data.species_by_num(entry["species_id"])["types"]
+        ]
+
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+
+        async def _warm(key: Key) -> None:
+            async with semaphore:
+                if await self.bot.loop.run_in_executor(None, self._key_path(key).exists):
+                    return
+                image, fallback = await self._fetch(key)
+                if image is not None and not fallback:
+                    self.stats["prewarmed"] += 1
+
+        await asyncio.gather(*(_warm(key) for key in keys), return_exceptions=True)
+        log.info("[SPAWN IMAGES ] Pre-warmed %s image(s)", self.stats["prewarmed"])
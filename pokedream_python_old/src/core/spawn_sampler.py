@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import json
+import random
+
+__all__ = ["AliasTable", "SpawnSampler"]
+
+
+class AliasTable:
+    """
+    Walker's alias method (Vose's construction), draws an item with
+    probability proportional to its weight in O(1).
+    """
+
+    __slots__ = ("items", "prob", "alias", "_size")
+
+    def __init__(self, items: Sequence[int], weights: Sequence[float]) -> None:
+        if not items or len(items) != len(weights):
+            raise ValueError("An alias table needs as many weights as items, and at least one of them.")
+
+        total: float = sum(weights)
+        if total <= 0:
+            raise ValueError("An alias table needs a positive total weight.")
+
+        n: int = len(items)
+        scaled: List[float] = [weight * n / total for weight in weights]
+        prob: List[float] = [1.0] * n
+        alias: List[int] = list(range(n))
+
+        small: List[int] = [i for i, p in enumerate(scaled) if p < 1.0]
+        large: List[int] = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            s, l = small.pop(), large.pop()
+            prob[s], alias[s] = scaled[s], l
+
+            scaled[l] += scaled[s] - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+
+        # Whatever is left is 1.0 up to rounding errors, it never needs its alias.
+        self.items: Tuple[int, ...] = tuple(items)
+        self.prob: Tuple[float, ...] = tuple(prob)
+        self.alias: Tuple[int, ...] = tuple(alias)
+        self._size: int = n
+
+    def __len__(self) -> int:
+        return self._size
+
+    def sample(self, rand=random.random) -> int:
+        i: int = int(rand() * self._size)
+        return self.items[i] if rand() < self.prob[i] else self.items[self.alias[i]]
+
+
+class SpawnSampler:
+    """
+    Species sampler for wild spawns, built once from `abundance.json`.
+
+    Besides the table over every species there's one per type and one per
+    biome of `BIOMES` (the spawn channels with their own background), so a
+    biome also decides what spawns in it. Event modes multiply the weight of
+    their themed types.
+    """
+
+    ABUNDANCE_PATH: Path = Path("data/json/abundance.json")
+    POKEMON_PATH: Path = Path("data/json/pokemon.json")
+
+    # Type ids of data/json/pokemon.json
+    BIOMES: Dict[str, Tuple[int, ...]] = {
+        "ice": (15,),
+        "beach": (11,),
+        "desert": (5, 6),
+        "forest": (12, 7),
+    }
+
+    # Config flag -> type weight multipliers while it is enabled
+    EVENT_BOOSTS: Dict[str, Dict[int, float]] = {
+        "CHRISTMAS_MODE": {15: 4.0},
+        "DIWALI_MODE": {10: 4.0},
+    }
+
+    def __init__(
+        self,
+        abundance: Mapping[int, float],
+        types: Mapping[int, Sequence[int]],
+        *,
+        boosts: Optional[Mapping[int, float]] = None,
+    ) -> None:
+        boosts = boosts or {}
+        weights: Dict[int, float] = {}
+
+        for species_id, weight in abundance.items():
+            for type_id in types.get(species_id, ()):
+                weight *= boosts.get(type_id, 1.0)
+            if weight > 0:
+                weights[species_id] = weight
+
+        self.weights: Dict[int, float] = weights
+        self.table: AliasTable = self._build(weights)
+
+        by_type: Dict[int, List[int]] = {}
+        for species_id in weights:
+            for type_id in types.get(species_id, ()):
+                by_type.setdefault(type_id, []).append(species_id)
+
+        self.types: Dict[int, AliasTable] = {
+            type_id: self._build({species_id: weights[species_id] for species_id in species})
+            for type_id, species in by_type.items()
+        }
+        self.biomes: Dict[str, AliasTable] = {
+            biome: self._build(
+                {species_id: weights[species_id] for t in type_ids for species_id in by_type.get(t, ())}
+            )
+            for biome, type_ids in self.BIOMES.items()
+        }
+
+    @staticmethod
+    def _build(weights: Mapping[int, float]) -> AliasTable:
+        return AliasTable(list(weights.keys()), list(weights.values()))
+
+    @classmethod
+    def boosts_for(cls, config) -> Dict[int, float]:
+        boosts: Dict[int, float] = {}
+        for flag, multipliers in cls.EVENT_BOOSTS.items():
+            if getattr(config, flag, False):
+                for type_id, multiplier in multipliers.items():
+                    boosts[type_id] = boosts.get(type_id, 1.0) * multiplier
+        return boosts
+
+    @classmethod
+    def from_files(
+        cls,
+        abundance_path: Path = ABUNDANCE_PATH,
+        pokemon_path: Path = POKEMON_PATH,
+        *,
+        boosts: Optional[Mapping[int, float]] = None,
+    ) -> "SpawnSampler":
+        with open(abundance_path) as f:
+            abundance: Iterable[dict] = json.load(f)
+        with open(pokemon_path, encoding="utf-8") as f:
+            pokemon: Iterable[dict] = json.load(f)
+
+        return cls(
+            {entry["species_id"]: entry["abundance"] for entry in abundance},
+            {entry["species_id"]: entry["types"] for entry in pokemon},
+            boosts=boosts,
+        )
+
+    def sample(self, biome: Optional[str] = None) -> int:
+        """Returns a species id, from the biome's own table if it has one."""
+        return self.biomes.get(biome, self.table).sample()
+
+    def sample_type(self, type_id: int) -> int:
+        return self.types[type_id].sample()
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from enum import Enum
+from typing import TYPE_CHECKING, Optional
+
+import sys
+import time
+
+if TYPE_CHECKING:
+    from core.bot import PokeBest
+
+__all__ = ["Claim", "SpawnState", "SpawnStore", "RedisSpawnStore"]
+
+
+class Claim(Enum):
+    OK = 0
+    NOTHING = 1
+    ENGAGED = 2
+    WRONG = 3
+
+
+class SpawnState:
+    __slots__ = ("messages", "species_id", "hint_used", "is_shiny", "is_engaged", "last_active")
+
+    def __init__(self) -> None:
+        self.messages: int = 0
+        self.species_id: Optional[int] = None
+        self.hint_used: bool = False
+        self.is_shiny: bool = False
+        self.is_engaged: bool = False
+        self.last_active: float = time.monotonic()
+
+    def __repr__(self) -> str:
+        return f"<SpawnState messages={self.messages} species_id={self.species_id} is_engaged={self.is_engaged}>"
+
+    @property
+    def active(self) -> bool:
+        return self.species_id is not None
+
+
+class SpawnStore:
+    """
+    Spawn state of every channel, ordered from least to most recently active.
+
+    Channels without an active spawn are evicted once they've been idle for
+    `max_idle` seconds or when the store grows past `max_size`. Channels with
+    a wild pokemon are kept until it is caught.
+
+    Message counters are always local, everything that decides who gets a
+    wild pokemon (`spawn`, `check`, `claim`, `engage` and `reset`) is a
+    coroutine so it can be shared between processes by `RedisSpawnStore`.
+    """
+
+    # Evicting is amortized over the writes, this bounds the work done by one write.
+    EVICTION_STEPS: int = 8
+
+    def __init__(self, *, max_size: int = 50000, max_idle: float = 3600.0) -> None:
+        self.max_size: int = max_size
+        self.max_idle: float = max_idle
+
+        self._states: OrderedDict[int, SpawnState] = OrderedDict()
+        self.evictions: int = 0
+
+    def __len__(self) -> int:
+        return self._states.__len__()
+
+    def __contains__(self, channel_id: int) -> bool:
+        return channel_id in self._states
+
+    def get(self, channel_id: int) -> Optional[SpawnState]:
+        return self._states.get(channel_id)
+
+    def _touch(self, channel_id: int) -> SpawnState:
+        state: Optional[SpawnState] = self._states.get(channel_id)
+        if state is None:
+            state = self._states[channel_id] = SpawnState()
+            self._evict()
+        else:
+            state.last_active = time.monotonic()
+            self._states.move_to_end(channel_id)
+
+        return state
+
+    def _evict(self) -> None:
+        deadline: float = time.monotonic() - self.max_idle
+
+        for _ in range(self.EVICTION_STEPS):
+            channel_id, state = next(iter(self._states.items()))
+            if self._states.__len__() <= self.max_size and state.last_active > deadline:
+                return
+
+            if state.active:
+                # Still has a wild pokemon, look at it again after every other channel.
+                self._states.move_to_end(channel_id)
+                continue
+
+            del self._states[channel_id]
+            self.evictions += 1
+
+    def increment(self, channel_id: int) -> int:
+        """Counts a message in the channel and returns the count since the last spawn."""
+        state: SpawnState = self._touch(channel_id)
+        state.messages += 1
+        return state.messages
+
+    def reset_messages(self, channel_id: int) -> None:
+        state: Optional[SpawnState] = self._states.get(channel_id)
+        if state is not None:
+            state.messages = 0
+
+    async def spawn(self, channel_id: int, species_id: int, *, is_shiny: bool = False) -> SpawnState:
+        state: SpawnState = self._touch(channel_id)
+        state.species_id = species_id
+        state.is_engaged = False
+        state.is_shiny = state.is_shiny or is_shiny
+        return state
+
+    async def check(self, channel_id: int, species_id: Optional[int]) -> Claim:
+        return self._check(channel_id, species_id)
+
+    def _check(self, channel_id: int, species_id: Optional[int]) -> Claim:
+        state: Optional[SpawnState] = self._states.get(channel_id)
+
+        if state is None or not state.active:
+            return Claim.NOTHING
+        if state.is_engaged:
+            return Claim.ENGAGED
+        if species_id is None or state.species_id != species_id:
+            return Claim.WRONG
+        return Claim.OK
+
+    async def claim(self, channel_id: int, species_id: Optional[int]) -> Claim:
+        """Takes the wild pokemon if it's `species_id`. Checking and taking happen without yielding."""
+        result: Claim = self._check(channel_id, species_id)
+        if result is Claim.OK:
+            self._states[channel_id].species_id = None
+        return result
+
+    async def engage(self, channel_id: int) -> None:
+        state: Optional[SpawnState] = self._states.get(channel_id)
+        if state is not None:
+            state.is_engaged = True
+
+    async def reset(self, channel_id: int) -> None:
+        state: SpawnState = self._touch(channel_id)
+        state.messages = 0
+        state.species_id = None
+        state.hint_used = False
+        state.is_shiny = False
+        state.is_engaged = False
+
+    def memory_usage(self) -> int:
+        """Approximate size in bytes of the store and its records."""
+        return sys.getsizeof(self._states) + sum(sys.getsizeof(state) for state in self._states.values())
+
+
+class RedisSpawnStore(SpawnStore):
+    """
+    Spawn store whose wild pokemon live in redis, for shards spread over
+    several processes.
+
+    Each channel is a `spawn:<channel_id>` hash and claiming runs as one lua
+    script, so checking the species and the duel, then taking the pokemon, is
+    atomic across every process. The local records are still written, they
+    keep serving message counters and hints.
+    """
+
+    KEY: str = "spawn:{}"
+    TTL: int = 86400
+
+    # KEYS[1] spawn hash, ARGV[1] guessed species ("" for none), ARGV[2] "1" to take it
+    CLAIM_SCRIPT: str = """
+local species = redis.call('HGET', KEYS[1], 'species')
+if not species or species == '' then
+    return 1
+end
+if redis.call('HGET', KEYS[1], 'engaged') == '1' then
+    return 2
+end
+if species ~= ARGV[1] then
+    return 3
+end
+if ARGV[2] == '1' then
+    redis.call('HSET', KEYS[1], 'species', '')
+end
+return 0
+"""
+
+    def __init__(self, bot: PokeBest, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.bot: PokeBest = bot
+
+    async def _run_claim(self, channel_id: int, species_id: Optional[int], take: bool) -> Claim:
+        result: int = await self.bot.redis.eval(
+            self.CLAIM_SCRIPT,
+            keys=[self.KEY.format(channel_id)],
+            args=["" if species_id is None else str(species_id), "1" if take else "0"],
+        )
+        return Claim(result)
+
+    async def spawn(self, channel_id: int, species_id: int, *, is_shiny: bool = False) -> SpawnState:
+        tr = self.bot.redis.multi_exec()
+        tr.hmset_dict(self.KEY.format(channel_id), {"species": species_id, "engaged": 0})
+        tr.expire(self.KEY.format(channel_id), self.TTL)
+        await tr.execute()
+
+        return await super().spawn(channel_id, species_id, is_shiny=is_shiny)
+
+    async def check(self, channel_id: int, species_id: Optional[int]) -> Claim:
+        return await self._run_claim(channel_id, species_id, False)
+
+    async def claim(self, channel_id: int, species_id: Optional[int]) -> Claim:
+        result: Claim = await self._run_claim(channel_id, species_id, True)
+        if result is Claim.OK:
+            await super().claim(channel_id, species_id)
+        return result
+
+    async def engage(self, channel_id: int) -> None:
+        await self.bot.redis.hset(self.KEY.format(channel_id), "engaged", 1)
+        await super().engage(channel_id)
+
+    async def reset(self, channel_id: int) -> None:
+        await self.bot.redis.delete(self.KEY.format(channel_id))
+        await super().reset(channel_id)
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from difflib import get_close_matches
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+import json
+import re
+import unicodedata
+
+__all__ = ["SpeciesIndex", "normalize_name"]
+
+_STRIP = re.compile(r"[\W_]+")
+
+# Spellings of each regional prefix, the first one being the one used in English names
+_REGIONS: Tuple[Tuple[str, ...], ...] = (
+    ("alolan", "alola"),
+    ("galarian", "galar"),
+    ("hisuian", "hisui"),
+)
+
+
+def _fold(ch: str) -> str:
+    # Diacritics are only dropped from latin letters, dakuten & co. tell kana apart.
+    base: str = unicodedata.normalize("NFD", ch)[0]
+    return base if base.isascii() else ch
+
+
+def normalize_name(name: str) -> str:
+    """
+    Folds a pokemon name for lookups: full-width forms, latin diacritics, case,
+    whitespace and punctuation don't matter, `♀` and `♂` become `f` and `m`.
+    """
+    name = "".join(map(_fold, unicodedata.normalize("NFKC", name))).casefold()
+    return _STRIP.sub("", name.replace("♀", "f").replace("♂", "m"))
+
+
+class SpeciesIndex:
+    """
+    Species ids by every name of every language in `pokemon.json`, built once.
+
+    Lookups are a single dict access on the normalized name. Regional forms
+    can also be written as `alola rattata`, `rattata alolan`, etc. `suggest`
+    does a fuzzy match for "did you mean", only against names of about the
+    same length so it stays cheap.
+    """
+
+    POKEMON_PATH: Path = Path("data/json/pokemon.json")
+
+    MAX_FUZZY_LENGTH: int = 24
+    MAX_LENGTH_DIFFERENCE: int = 2
+
+    def __init__(self, names: Iterable[Tuple[int, Mapping[str, str]]]) -> None:
+        index: Dict[str, int] = {}
+        english: List[Tuple[int, str]] = []
+
+        for species_id, localized in names:
+            for language, name in localized.items():
+                index.setdefault(normalize_name(name), species_id)
+                if language == "9":
+                    english.append((species_id, name))
+
+        # Aliases never shadow a real name.
+        for species_id, name in english:
+            for alias in self._regional_aliases(name):
+                index.setdefault(alias, species_id)
+
+        self._index: Dict[str, int] = index
+        self._by_length: Dict[int, List[str]] = {}
+        for key in index:
+            if key.isascii():
+                self._by_length.setdefault(len(key), []).append(key)
+
+    def __len__(self) -> int:
+        return self._index.__len__()
+
+    @staticmethod
+    def _regional_aliases(name: str) -> List[str]:
+        words: List[str] = name.casefold().replace("-", " ").split()
+        if len(words) < 2:
+            return []
+
+        for spellings in _REGIONS:
+            if words[0] in spellings:
+                rest: str = normalize_name(" ".join(words[1:]))
+                return [alias for s in spellings for alias in (s + rest, rest + s)]
+        return []
+
+    @classmethod
+    def from_file(cls, path: Path = POKEMON_PATH) -> "SpeciesIndex":
+        with open(path, encoding="utf-8") as f:
+            pokemon: List[dict] = json.load(f)
+
+        return cls((entry["species_id"], entry["names"]) for entry in pokemon)
+
+    def lookup(self, name: str) -> Optional[int]:
+        return self._index.get(normalize_name(name))
+
+    def suggest(self, name: str, *, limit: int = 3, cutoff: float = 0.75) -> List[int]:
+        """Returns the ids of up to `limit` species whose names are close to `name`, best first."""
+        key: str = normalize_name(name)
+        if not key or len(key) > self.MAX_FUZZY_LENGTH:
+            return []
+
+        candidates: List[str] = [
+            candidate
+            for length in range(len(key) - self.MAX_LENGTH_DIFFERENCE, len(key) + self.MAX_LENGTH_DIFFERENCE + 1)
+            for candidate in self._by_length.get(length, ())
+        ]
+
+        species_ids: List[int] = []
+        for match in get_close_matches(key, candidates, n=limit * 2, cutoff=cutoff):
+            if self._index[match] not in species_ids:
+                species_ids.append(self._index[match])
+        return species_ids[:limit]
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from typing import Awaitable, Callable, Dict, Optional, Set, TypeVar
+
+import asyncio
+import logging
+import time
+
+__all__ = ["Startup"]
+
+T = TypeVar("T")
+
+log = logging.getLogger(__name__)
+
+
+class Startup:
+    """
+    Runs the bot's startup pipeline exactly once.
+
+    `on_ready` fires again after every gateway reconnect, later calls of `run`
+    wait for the first one instead of initializing everything again. A failed
+    startup may be retried by the next call, stages which finished before are
+    skipped then. `ready` is set by the pipeline as soon as commands can be
+    handled, which may be before every stage is done.
+    """
+
+    def __init__(self) -> None:
+        self.ready: asyncio.Event = asyncio.Event()
+        self.timings: Dict[str, float] = {}
+        self.completed: Set[str] = set()
+
+        self._task: Optional[asyncio.Task] = None
+        self._started_at: Optional[float] = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self.ready.is_set()
+
+    @property
+    def done(self) -> bool:
+        return self._task is not None and self._task.done() and not self._failed(self._task)
+
+    @staticmethod
+    def _failed(task: asyncio.Task) -> bool:
+        return task.done() and (task.cancelled() or task.exception() is not None)
+
+    async def run(self, pipeline: Callable[[], Awaitable[None]]) -> None:
+        if self._task is None or self._failed(self._task):
+            self._started_at = time.perf_counter()
+            self._task = asyncio.create_task(pipeline())
+            self._task.add_done_callback(self._report)
+
+        await asyncio.shield(self._task)
+
+    async def stage(self, name: str, start: Callable[[], Awaitable[T]], *, optional: bool = False) -> Optional[T]:
+        """
+        Runs `start` unless the stage already completed in an earlier attempt.
+        Optional stages only log their failure instead of failing the startup,
+        they're tried again by the next attempt.
+        """
+        if name in self.completed:
+            return None
+
+        t1 = time.perf_counter()
+        try:
+            result: T = await start()
+        except Exception:
+            if not optional:
+                raise
+            log.exception("[STARTUP ] Optional stage %s failed", name)
+            return None
+        finally:
+            self.timings[name] = time.perf_counter() - t1
+            log.info("[STARTUP ] %s took %.2f ms", name, self.timings[name] * 1000)
+
+        self.completed.add(name)
+        return result
+
+    def _report(self, task: asyncio.Task) -> None:
+        if self._failed(task):
+            log.error("[STARTUP ] Startup failed after stages %s", ", ".join(self.timings) or "none")
+            return
+
+        total: float = time.perf_counter() - self._started_at
+        log.info(
+            "[STARTUP ] Finished in %.2f ms (%s)",
+            total * 1000,
+            ", ".join(f"{name}: {timing * 1000:.2f} ms" for name, timing in self.timings.items()),
+        )
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Set
+
+import logging
+
+import models
+
+if TYPE_CHECKING:
+    from core.bot import PokeBest
+
+log = logging.getLogger(__name__)
+
+__all__ = ["SuspensionIndex"]
+
+
+class SuspensionIndex:
+    """
+    In-memory set of suspended member ids.
+
+    It is loaded once at startup and every change made through `suspend` or
+    `unsuspend` is broadcasted to the other processes, so the global
+    `is_suspended` check never has to touch the database.
+    """
+
+    CHANNEL: str = "suspensions"
+
+    def __init__(self, bot: PokeBest) -> None:
+        self.bot: PokeBest = bot
+        self._suspended: Set[int] = set()
+
+    def __contains__(self, member_id: int) -> bool:
+        return member_id in self._suspended
+
+    def __len__(self) -> int:
+        return self._suspended.__len__()
+
+    async def load(self) -> None:
+        _ids: List[int] = await models.Member.filter(suspended=True).values_list("id", flat=True)
+        self._suspended = set(_ids)
+
+        await self.bot.pubsub.subscribe(self.CHANNEL, self._on_message)
+        log.info("[SUSPENSIONS ] Loaded %s suspended member(s)", len(self._suspended))
+
+    async def suspend(self, member_id: int) -> None:
+        self._suspended.add(member_id)
+        await self.bot.pubsub.publish(self.CHANNEL, f"+{member_id}")
+
+    async def unsuspend(self, member_id: int) -> None:
+        self._suspended.discard(member_id)
+        await self.bot.pubsub.publish(self.CHANNEL, f"-{member_id}")
+
+    async def _on_message(self, payload: str) -> None:
+        op, member_id = payload[0], int(payload[1:])
+
+        if op == "+":
+            self._suspended.add(member_id)
+        else:
+            self._suspended.discard(member_id)
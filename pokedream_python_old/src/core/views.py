@@ -11,6 +11,7 @@ from discord.user import User
 
 import models
 from .bot import PokeBest
+from .spawn_state import Claim
 from core.paginator import SimplePaginator, SimplePaginatorView
 from discord.ui import View, button, Select
 from discord.ext import commands
@@ -800,15 +801,12 @@ class GiftView(discord.ui.View):
             return "pokemon"
 
     async def _insert_sp(self, sp, mem: models.Member) -> models.Pokemon:
-        next_idx: int = await self.ctx.bot.manager.get_next_idx(self.ctx.author.id)
         pk: models.Pokemon = models.Pokemon.get_random(
             owner_id=self.ctx.author.id,
-            idx=next_idx,
             species_id=sp.__getitem__("species_id"),
             level=random.randint(1, 50),
             xp=0,
         )
-        mem.next_idx += 1
 
         return pk
 
@@ -833,20 +831,22 @@ class GiftView(discord.ui.View):
                 sp = data.species_by_num(random.randint(1, 898))
                 pk: models.Pokemon = await self._insert_sp(sp, mem)
 
-            elif reward_type == "redeem":
-                mem.redeems += 1
-
             elif reward_type == "shiny":
-                next_idx: int = await self.ctx.bot.manager.get_next_idx(self.ctx.author.id)
                 pk: models.Pokemon = models.Pokemon.get_random(
                     owner_id=self.ctx.author.id,
                     shiny=True,
-                    idx=next_idx,
                     species_id=random.randint(1, 898),
                 )
-                mem.next_idx += 1
 
-            mem.balance += 1000
+            _result = await self.ctx.bot.manager.update_economy(
+                self.ctx.author.id,
+                gift=-1,
+                balance=1000,
+                redeems=int(reward_type == "redeem"),
+                next_idx=int(pk is not None),
+            )
+            if _result is None:
+                return await interaction.followup.send("You don't have any gifts to open!", ephemeral=True)
 
             if pk is not None:
                 emb: discord.Embed = self.ctx.bot.Embed(
@@ -863,10 +863,9 @@ class GiftView(discord.ui.View):
 
             await self.ctx.reply(embed=emb, mention_author=False)
 
-            mem.gift -= 1
             if pk is not None:
+                pk.idx = _result["next_idx"] - 1
                 await pk.save()
-            await mem.save()
 
     @button(label="Give", emoji="🔁")
     async def give_gift(self, button: discord.ui.Button, interaction: discord.Interaction):
@@ -1129,17 +1128,15 @@ class SpawnDuelView(View):
     @discord.ui.button(label="Fight", emoji="⚔", style=ButtonStyle.blurple)
     async def duel_to_catch_button(self, button: discord.Button, interaction: discord.Interaction):
         await interaction.response.defer()
-        if (
-            self.bot.spawn_cache.get(self.channel.id, None) is not None
-            and self.bot.spawn_cache[self.channel.id].get("species_id", None) is not None
-        ):
-            if self.bot.spawn_cache[self.channel.id]["species_id"] != self.species_id:
+        _claim: Claim = await self.bot.spawns.check(self.channel.id, self.species_id)
+        if _claim is not Claim.NOTHING:
+            if _claim is Claim.WRONG:
                 return await interaction.followup.send(
                     "This pokemon is no more available to catch or duel.",
                     ephemeral=True,
                 )
 
-            if self.bot.spawn_cache[self.channel.id]["is_engaged"]:
+            if _claim is Claim.ENGAGED:
                 return await interaction.followup.send(
                     "This pokemon is already in duel with another trainer.",
                     ephemeral=True,
@@ -1164,7 +1161,7 @@ class SpawnDuelView(View):
                     mention_author=False,
                 )
 
-            self.bot.spawn_cache[self.channel.id]["is_engaged"] = True
+            await self.bot.spawns.engage(self.channel.id)
 
             await interaction.followup.send(
                 f"You took out your {self.bot.sprites.get(pk1.specie['dex_number'])} {pk1:l}..."
@@ -1192,13 +1189,7 @@ class SpawnDuelView(View):
 
             msg: discord.Message = await self.ctx.send("Battle is being loaded...", mention_author=False)
 
-            self.bot.spawn_cache[self.ctx.channel.id] = {
-                "messages": 0,
-                "species_id": None,
-                "hint_used": False,
-                "is_shiny": False,
-                "is_engaged": False,
-            }
+            await self.bot.spawns.reset(self.ctx.channel.id)
 
             _mem.spawn_duel_cooldown = datetime.utcnow() + timedelta(minutes=15)
             await _mem.save()
@@ -1271,17 +1262,22 @@ class PremiumCatchView(View):
                 await interaction.followup.send("Argh... You almost had it!")
 
             else:
+                _result = await self.bot.manager.update_economy(self.mem.id, premium_balls=-1, next_idx=1)
+                if _result is None:
+                    return await interaction.followup.send(
+                        "You don't have premium balls to use! Take part in raids to get more."
+                    )
+
                 pk: models.Pokemon = models.Pokemon.get_random(
                     species_id=self.raids.species_id,
                     level=random.randint(1, 60),
                     xp=0,
                     owner_id=self.mem.id,
                     timestamp=datetime.now(),
-                    idx=self.mem.next_idx,
+                    idx=_result["next_idx"] - 1,
                     shiny=random.randint(1, 1000) == 1,
                 )
 
-                self.mem.next_idx += 1
                 await pk.save()
 
                 emb: discord.Embed = discord.Embed(
@@ -1293,8 +1289,7 @@ class PremiumCatchView(View):
                     url="https://media.discordapp.net/attachments/890889580021157918/932255203669979137/20220116_181839.gif"
                 )
 
-                self.mem.premium_balls -= 1
-                await self.mem.save()
+                self.mem.premium_balls = _result["premium_balls"]
 
                 await interaction.followup.send(embed=emb)
 
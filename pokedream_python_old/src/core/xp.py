@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Counter, Dict, Optional, Tuple
+
+from tortoise.signals import post_delete, post_save
+
+import asyncio
+import logging
+
+import models
+
+if TYPE_CHECKING:
+    from core.bot import PokeBest
+
+__all__ = ["XPAccumulator"]
+
+log = logging.getLogger(__name__)
+
+
+class XPAccumulator:
+    """
+    Message XP of selected pokemon, added up in memory and written in bulk.
+
+    Selected pokemon are kept between flushes so a chatting member costs one
+    query per `interval` instead of three per message. The XP of a pokemon is
+    always applied in memory first, level ups and evolutions are noticed on the
+    message that causes them and written right away, everything else is sent
+    as a single `xp = xp + delta` statement every `interval` seconds or once
+    `max_pending` pokemon are waiting.
+    """
+
+    def __init__(self, bot: PokeBest, *, interval: float = 5.0, max_pending: int = 500) -> None:
+        self.bot: PokeBest = bot
+        self.interval: float = interval
+        self.max_pending: int = max_pending
+
+        self._selected: Dict[Tuple[int, int], models.Pokemon] = {}
+        self._pending: Counter[int] = Counter()
+        # The batch `flush` is writing, put back into `_pending` if the write fails
+        self._inflight: Counter[int] = Counter()
+
+        self._task: Optional[asyncio.Task] = None
+        self._flushing: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return self._pending.__len__()
+
+    @staticmethod
+    def _query() -> str:
+        _projection: Dict[str, str] = models.Pokemon._meta.fields_db_projection
+        _table: str = models.Pokemon._meta.db_table
+        _pk: str = models.Pokemon._meta.db_pk_column
+        xp: str = _projection["xp"]
+
+        return (
+            f'UPDATE "{_table}" SET "{xp}" = "{_table}"."{xp}" + v.delta '
+            f'FROM unnest($1::bigint[], $2::bigint[]) AS v(pk, delta) WHERE "{_table}"."{_pk}" = v.pk;'
+        )
+
+    async def get_selected(self, member: models.Member) -> Optional[models.Pokemon]:
+        if member.selected_id is None:
+            return None
+
+        key: Tuple[int, int] = (member.id, member.selected_id)
+        pokemon: Optional[models.Pokemon] = self._selected.get(key)
+
+        if pokemon is None:
+            pokemon = await models.Pokemon.get_or_none(owner_id=member.id, idx=member.selected_id)
+            if pokemon is not None:
+                self._selected[key] = pokemon
+
+        return pokemon
+
+    def add(self, pokemon: models.Pokemon, xp: int) -> None:
+        pokemon.xp += xp
+        self._pending[pokemon.pk] += xp
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_loop())
+
+        if self._pending.__len__() >= self.max_pending and self._flushing is None:
+            self._flushing = asyncio.create_task(self.flush())
+
+    async def save(self, pokemon: models.Pokemon) -> None:
+        """
+        Writes the pokemon right away, its pending XP is already part of `pokemon.xp`.
+        A running flush is waited for first, so an older delta of the pokemon
+        can't be added on top of the saved XP.
+        """
+        self._inflight.pop(pokemon.pk, None)
+        while self._flushing is not None:
+            await asyncio.shield(self._flushing)
+
+        self._pending.pop(pokemon.pk, None)
+        await pokemon.save(update_fields=["xp", "level", "species_id"])
+
+    def forget(self, pokemon: models.Pokemon) -> None:
+        self._selected.pop((pokemon.owner_id, pokemon.idx), None)
+
+    async def flush(self) -> None:
+        pending, self._pending = self._pending, Counter()
+        self._inflight = pending
+        # Other commands may change the pokemon, re-read them after every flush.
+        self._selected.clear()
+
+        try:
+            if pending:
+                await self.bot.pool.execute(self._query(), list(pending.keys()), list(pending.values()))
+        except Exception as e:
+            log.exception("Couldn't flush XP of %s pokemon", pending.__len__(), exc_info=e)
+            self._pending.update(pending)
+        finally:
+            self._inflight = Counter()
+            self._flushing = None
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+
+            # Shielded, so `close` can't cancel a flush half way and lose its XP.
+            if self._flushing is None:
+                self._flushing = asyncio.create_task(self.flush())
+            await asyncio.shield(self._flushing)
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        if self._flushing is not None:
+            await self._flushing
+
+        await self.flush()
+
+
+def _get_accumulator(sender) -> Optional[XPAccumulator]:
+    bot: Optional[PokeBest] = getattr(sender, "bot", None)
+    if bot is None or bot.manager is None:
+        return None
+    return bot.manager.xp
+
+
+@post_save(models.Pokemon)
+async def _pokemon_post_save(sender, instance: models.Pokemon, created: bool, using_db, update_fields) -> None:
+    accumulator: Optional[XPAccumulator] = _get_accumulator(sender)
+    if accumulator is not None:
+        accumulator.forget(instance)
+
+
+@post_delete(models.Pokemon)
+async def _pokemon_post_delete(sender, instance: models.Pokemon, using_db) -> None:
+    accumulator: Optional[XPAccumulator] = _get_accumulator(sender)
+    if accumulator is not None:
+        accumulator.forget(instance)